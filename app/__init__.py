@@ -1,19 +1,32 @@
 import datetime
 import json
+import os
 from typing import Dict, Optional, Union
 
-from decouple import config
+from decouple import Csv, config
 from flask import Flask
 from flask_login import LoginManager
 
-from .db import DatabaseManager
-from .middlewares import register_middlewares
+from .commands import register_commands
+from .db import db_manager
+from .db.routing import DB_READ_ROUTING
+from .middlewares import (
+    allow_cross_origin,
+    check_maintenance,
+    collect_query_metrics,
+    compress_responses,
+    fingerprint_static_assets,
+    profile_requests,
+    register_middlewares,
+    route_reads,
+)
 from .models import User
-from .routes import register_routes
+from .routes import events_bp, register_routes
 from .utils import MESSAGES, encoding, register_error_handlers, register_template_filters
 
+SESSION_LIFETIME: datetime.timedelta = datetime.timedelta(hours=9)
+
 login_manager: LoginManager = LoginManager()
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @login_manager.user_loader
@@ -34,17 +47,52 @@ def create_app() -> Flask:
     app: Flask = Flask(__name__, static_folder="static", template_folder="templates")
 
     app.secret_key = encoding.decode_base64(config("SECRET_KEY"))
-    app.config["MAINTENANCE_MODE"] = False
+    app.config["PROFILING_ENABLED"] = config("PROFILING_ENABLED", default=False, cast=bool)
+    app.config["COMPRESSION_MIN_SIZE"] = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+    app.config["COMPRESSION_LEVEL"] = config("COMPRESSION_LEVEL", default=6, cast=int)
+    app.config["PROFILES_DIR"] = os.path.abspath(config("PROFILES_DIR", default="profiles"))
 
-    app.permanent_session_lifetime = datetime.timedelta(hours=9)
+    app.permanent_session_lifetime = SESSION_LIFETIME
 
     register_template_filters(app)
     register_routes(app)
+    # Compression is registered first, so that it runs after all other after-request handlers.
+    compress_responses(app)
+    fingerprint_static_assets(app)
     # register_middlewares(app)
+    check_maintenance(app)
+    if DB_READ_ROUTING:
+        route_reads(app)
+    collect_query_metrics(app)
+    if app.config["PROFILING_ENABLED"]:
+        profile_requests(app)
     register_error_handlers(app)
+    register_commands(app)
 
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
     login_manager.login_message = MESSAGES["auth"]["login_required"]
     login_manager.login_message_category = "info"
     return app
+
+
+def create_events_app() -> Flask:
+    """
+    Creates application serving only live updates (`/events`), run by the events server with an asynchronous
+    worker class (see `gunicorn.events.conf.py`), so that requests waiting for events do not hold threads
+    of the main server. Pages of `EVENTS_ALLOWED_ORIGINS` read it with the session cookie of the main server.
+    """
+
+    app: Flask = Flask(__name__, static_folder=None)
+
+    app.secret_key = encoding.decode_base64(config("SECRET_KEY"))
+    app.permanent_session_lifetime = SESSION_LIFETIME
+
+    app.register_blueprint(events_bp)
+    allow_cross_origin(app, config("EVENTS_ALLOWED_ORIGINS", default="", cast=Csv()))
+
+    # Without login view unauthenticated requests get 401 instead of a redirect to the login page
+    events_login_manager: LoginManager = LoginManager()
+    events_login_manager.user_loader(load_user)
+    events_login_manager.init_app(app)
+    return app
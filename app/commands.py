@@ -0,0 +1,30 @@
+from typing import Dict
+
+import click
+from flask import Flask
+
+from .db import db_manager
+from .db.archive_manager import ARCHIVE_KEEP_YEARS
+from .db.event_manager import EVENTS_KEEP_COUNT
+
+
+def register_commands(app: Flask) -> None:
+    @app.cli.command("rebuild-task-cube")
+    def rebuild_task_cube() -> None:
+        """Recompute pre-aggregated task hours, intended to run nightly."""
+
+        rows_count: int = db_manager.task_cube.rebuild()
+        click.echo(f"Task cube rebuilt: {rows_count} rows")
+
+    @app.cli.command("archive-data")
+    @click.option("--keep-years", default=ARCHIVE_KEEP_YEARS, show_default=True, help="Years kept in live tables.")
+    @click.option("--keep-events", default=EVENTS_KEEP_COUNT, show_default=True, help="Latest events kept in outbox.")
+    def archive_data(keep_years: int, keep_events: int) -> None:
+        """Move tasks and logs of older years to archive tables and trim the events outbox."""
+
+        moved: Dict[str, int] = db_manager.archive.archive(keep_years=keep_years)
+        for table_name, rows_count in moved.items():
+            click.echo(f"Archived {table_name}: {rows_count} rows")
+
+        deleted_count: int = db_manager.events.delete_old_events(keep_count=keep_events)
+        click.echo(f"Deleted events: {deleted_count}")
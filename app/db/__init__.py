@@ -1 +1,4 @@
 from .db_manager import DatabaseManager
+
+# Managers are stateless, so one instance is shared by all blueprints and middlewares.
+db_manager: DatabaseManager = DatabaseManager()
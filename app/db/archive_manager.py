@@ -0,0 +1,170 @@
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+from decouple import config
+
+from .bulk_keys import KeyTable
+from .data_versions import bump_data_versions
+from .db_connection import DatabaseConnection
+from .setting_manager import SETTINGS_CACHE_TTL, SettingManager
+
+ARCHIVE_KEEP_YEARS: int = config("ARCHIVE_KEEP_YEARS", default=2, cast=int)
+ARCHIVE_BATCH_SIZE: int = config("ARCHIVE_BATCH_SIZE", default=5000, cast=int)
+
+# Archived table: archive table, partitioning date column and copied columns
+ARCHIVED_TABLES: Dict[str, Tuple[str, str, str]] = {
+    "tasks": (
+        "tasks_archive",
+        "operation_date",
+        """
+            id,
+            employee_name,
+            personnel_number,
+            department,
+            work_name,
+            hours,
+            order_number,
+            order_name,
+            operation_date,
+            employee_category
+        """,
+    ),
+    "logs": (
+        "logs_archive",
+        "created_date",
+        """
+            id,
+            action,
+            entity_id,
+            entity_type,
+            user_name,
+            ip_address,
+            platform,
+            os_version,
+            browser,
+            browser_version,
+            created_date,
+            created_time
+        """,
+    ),
+}
+
+archived_ids: KeyTable = KeyTable("archived_ids", {"id": "INT"})
+setting_manager: SettingManager = SettingManager()
+
+
+def get_boundary_setting(table_name: str) -> str:
+    return f"{table_name}_archived_before"
+
+
+def get_archive_boundary(table_name: str) -> Optional[date]:
+    """
+    Returns the date before which all rows of the table may be in its archive, or None if nothing is archived.
+    """
+
+    boundary: str = setting_manager.get_setting(get_boundary_setting(table_name))
+    return date.fromisoformat(boundary) if boundary else None
+
+
+def get_table_source(
+    table_name: str, start_date: Optional[Union[str, date, datetime]] = None, include_archive: bool = False
+) -> str:
+    """
+    Returns the FROM clause source of the table for a range starting at `start_date`: the table itself,
+    or, when the range reaches archived years, union of the table and its archive under the table's name,
+    so that queries written against the table need no other changes.
+
+    A range without `start_date` covers live rows only, unless the archive is requested with `include_archive`.
+    """
+
+    boundary: Optional[date] = get_archive_boundary(table_name)
+    if boundary is None or not (start_date or include_archive):
+        return table_name
+
+    if isinstance(start_date, str) and start_date:
+        start_date = datetime.strptime(start_date[:10], "%Y-%m-%d")
+    if isinstance(start_date, datetime):
+        start_date = start_date.date()
+    if start_date and start_date >= boundary:
+        return table_name
+
+    archive_name, _, columns = ARCHIVED_TABLES[table_name]
+    return f"""(
+        SELECT {columns} FROM {table_name}
+        UNION ALL
+        SELECT {columns} FROM {archive_name}
+    ) AS {table_name}"""
+
+
+class ArchiveManager(DatabaseConnection):
+    """
+    Sliding window of live rows of tasks and logs.
+
+    Rows dated before the window are moved to archive tables of the same structure, so range scans
+    and counts over live tables touch only recent years. Readers which may need older rows use
+    `get_table_source`, which adds the archive only when the requested range reaches it.
+    Archived tasks are read-only: they can be listed and reported, but edits and deletions of them are rejected.
+    """
+
+    def archive_table(self, table_name: str, before: date) -> int:
+        """
+        Moves rows of the table dated before `before` to its archive.
+
+        Rows are moved in batches of `ARCHIVE_BATCH_SIZE` by id, each batch in its own transaction,
+        so the move never holds locks on the whole table and can be interrupted at any point.
+        The boundary is recorded before moving, so readers include the archive from the first batch on.
+
+        Args:
+            table_name (str): Key of `ARCHIVED_TABLES`.
+            before (date): First date which stays in the live table.
+
+        Returns:
+            rows_count (int): Number of moved rows.
+        """
+
+        archive_name, date_column, columns = ARCHIVED_TABLES[table_name]
+
+        boundary: Optional[date] = get_archive_boundary(table_name)
+        if boundary is None or boundary < before:
+            setting_manager.set_setting(get_boundary_setting(table_name), before.isoformat())
+            # Other worker processes see the new boundary when their cached settings expire
+            time.sleep(SETTINGS_CACHE_TTL)
+
+        query: str = f"""
+            SELECT id FROM {table_name}
+            WHERE {date_column} < ?
+            ORDER BY id
+            OFFSET ? ROWS
+            FETCH NEXT ? ROWS ONLY
+        """
+
+        move_query: str = f"""
+            INSERT INTO {archive_name} ({columns})
+            SELECT {columns} FROM {table_name}
+            WHERE id IN (SELECT id FROM {archived_ids.name})
+        """
+
+        rows_count: int = 0
+        while True:
+            with self.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (before, 0, ARCHIVE_BATCH_SIZE))
+                    ids: List[Tuple[int]] = cursor.fetchall()
+                    if not ids:
+                        return rows_count
+
+                    archived_ids.stage(cursor, ids)
+                    cursor.execute(move_query)
+                    cursor.execute(f"DELETE FROM {table_name} WHERE id IN (SELECT id FROM {archived_ids.name})")
+                connection.commit()
+            bump_data_versions(table_name)
+            rows_count += len(ids)
+
+    def archive(self, keep_years: int = ARCHIVE_KEEP_YEARS) -> Dict[str, int]:
+        """
+        Moves tasks and logs of years before the last `keep_years` years to archives.
+        """
+
+        before: date = date(date.today().year - keep_years + 1, 1, 1)
+        return {table_name: self.archive_table(table_name, before) for table_name in ARCHIVED_TABLES}
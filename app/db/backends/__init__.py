@@ -0,0 +1,157 @@
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple, Type
+
+from decouple import config
+
+from .base import Backend
+from .dialect import translate_to_sqlite
+from .odbc import OdbcBackend
+from .pool import ConnectionPool
+from .sqlite import SqliteBackend
+
+BACKENDS: Dict[str, Type[Backend]] = {
+    OdbcBackend.name: OdbcBackend,
+    SqliteBackend.name: SqliteBackend,
+}
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=4, cast=int)
+DB_READ_RETRY_INTERVAL: float = config("DB_READ_RETRY_INTERVAL", default=30, cast=float)
+
+backend: Optional[Backend] = None
+pool: Optional[ConnectionPool] = None
+
+read_backend: Optional[Backend] = None
+read_pool: Optional[ConnectionPool] = None
+read_unavailable_until: float = 0.0
+
+
+def create_backend(name: str) -> Backend:
+    if name == OdbcBackend.name:
+        return OdbcBackend(connection_string=config("DB_CONNECTION_STRING"))
+    if name == SqliteBackend.name:
+        return SqliteBackend(path=config("DB_SQLITE_PATH", default="worktime.sqlite3"))
+    raise ValueError(f"Unknown database backend: {name}. Available backends: {', '.join(BACKENDS)}")
+
+
+def create_read_backend(name: str) -> Backend:
+    """
+    Creates backend of the read-only connection target: a readable secondary replica
+    (`DB_READ_CONNECTION_STRING`, for example with `ApplicationIntent=ReadOnly`) or the primary database
+    read in snapshot isolation sessions (`DB_READ_SNAPSHOT_ISOLATION`), so that long reads do not hold
+    shared locks blocking task entry.
+    """
+
+    if name == OdbcBackend.name:
+        session_statements: Tuple[str, ...] = ()
+        if config("DB_READ_SNAPSHOT_ISOLATION", default=False, cast=bool):
+            session_statements = ("SET TRANSACTION ISOLATION LEVEL SNAPSHOT",)
+        return OdbcBackend(
+            connection_string=config("DB_READ_CONNECTION_STRING", default=config("DB_CONNECTION_STRING")),
+            session_statements=session_statements,
+        )
+    if name == SqliteBackend.name:
+        return SqliteBackend(
+            path=config("DB_READ_SQLITE_PATH", default=config("DB_SQLITE_PATH", default="worktime.sqlite3"))
+        )
+    raise ValueError(f"Unknown database backend: {name}. Available backends: {', '.join(BACKENDS)}")
+
+
+def get_backend() -> Backend:
+    global backend
+
+    if backend is None:
+        backend = create_backend(config("DB_BACKEND", default=OdbcBackend.name))
+    return backend
+
+
+def get_read_backend() -> Backend:
+    global read_backend
+
+    if read_backend is None:
+        read_backend = create_read_backend(config("DB_BACKEND", default=OdbcBackend.name))
+    return read_backend
+
+
+def set_backend(new_backend: Optional[Backend]) -> None:
+    global backend, pool, read_backend, read_pool
+    backend = new_backend
+    read_backend = None
+    for connection_pool in (pool, read_pool):
+        if connection_pool is not None:
+            connection_pool.clear()
+    pool = read_pool = None
+
+
+def get_pool() -> Optional[ConnectionPool]:
+    global pool
+
+    if pool is None and DB_POOL_SIZE > 0:
+        pool = ConnectionPool(get_backend(), DB_POOL_SIZE)
+    return pool
+
+
+def get_read_pool() -> Optional[ConnectionPool]:
+    global read_pool
+
+    if read_pool is None and DB_POOL_SIZE > 0:
+        read_pool = ConnectionPool(get_read_backend(), DB_POOL_SIZE)
+    return read_pool
+
+
+def connect_read_only() -> Optional[Any]:
+    global read_unavailable_until
+
+    if time.monotonic() < read_unavailable_until:
+        return None
+
+    try:
+        connection_pool: Optional[ConnectionPool] = get_read_pool()
+        if connection_pool is None:
+            return get_read_backend().connect()
+        return connection_pool.connect()
+    except Exception:
+        # Reads fall back to the primary database and the read-only target is not retried for a while,
+        # so that every request does not wait for a connection timeout.
+        logger.warning("Read-only database is unavailable, reading from the primary", exc_info=True)
+        read_unavailable_until = time.monotonic() + DB_READ_RETRY_INTERVAL
+        return None
+
+
+def connect(read_only: bool = False) -> Any:
+    """
+    Opens connection of the configured backend, taking it from the connection pool when pooling is enabled.
+
+    Args:
+        read_only (bool): Connect to the read-only target, falling back to the primary database
+            when it is unavailable.
+    """
+
+    if read_only:
+        connection: Optional[Any] = connect_read_only()
+        if connection is not None:
+            return connection
+
+    connection_pool: Optional[ConnectionPool] = get_pool()
+    if connection_pool is None:
+        return get_backend().connect()
+    return connection_pool.connect()
+
+
+def reset_backend() -> None:
+    """
+    Forgets backend and pooled connections without closing them.
+
+    Called in a worker process right after fork: connections inherited from the parent process
+    share sockets with it and must not be used or closed by the child.
+    """
+
+    global backend, pool, read_backend, read_pool
+    backend = read_backend = None
+    pool = read_pool = None
+
+
+def is_duplicate_key_error(error: Exception) -> bool:
+    return get_backend().is_duplicate_key_error(error)
@@ -0,0 +1,23 @@
+from typing import Any
+
+
+class Backend:
+    """
+    Base class of database backends.
+
+    Backend is responsible for opening DB-API connections which support the usage pattern shared
+    by all managers: the connection and its cursor are context managers, queries use qmark (?)
+    placeholders and SQL Server (T-SQL) syntax.
+    """
+
+    name: str = ""
+
+    def connect(self) -> Any:
+        raise NotImplementedError
+
+    def is_duplicate_key_error(self, error: Exception) -> bool:
+        """
+        Tells whether the error of a statement is a violation of a primary key or unique index.
+        """
+
+        return False
@@ -0,0 +1,81 @@
+import re
+from functools import lru_cache
+from typing import Match, Pattern
+
+OUTPUT_PATTERN: Pattern[str] = re.compile(
+    r"\s+OUTPUT\s+(?P<columns>(?:INSERTED|DELETED)\.\w+(?:\s*,\s*(?:INSERTED|DELETED)\.\w+)*)",
+    re.IGNORECASE,
+)
+OUTPUT_COLUMN_PREFIX_PATTERN: Pattern[str] = re.compile(r"\b(?:INSERTED|DELETED)\.", re.IGNORECASE)
+
+OFFSET_FETCH_PATTERN: Pattern[str] = re.compile(
+    r"OFFSET\s+\?\s+ROWS\s+FETCH\s+NEXT\s+\?\s+ROWS\s+ONLY",
+    re.IGNORECASE,
+)
+
+UPDATE_FROM_PATTERN: Pattern[str] = re.compile(
+    r"^\s*UPDATE\s+(?P<table>\w+)\s+SET\s+(?P<assignments>.*?)\s+FROM\s+(?P=table)\s+(?P<joins>.*?)"
+    r"\s+WHERE\s+(?P<conditions>.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+DEFAULT_COLLATION_PATTERN: Pattern[str] = re.compile(r"\s+COLLATE\s+DATABASE_DEFAULT\b", re.IGNORECASE)
+
+TEMP_TABLE_PATTERN: Pattern[str] = re.compile(r"(?<![\w#'])#(\w+)")
+
+VALUES_ALIAS_PATTERN: Pattern[str] = re.compile(
+    r"\(\s*VALUES\s+(?P<rows>.*?)\)\s+AS\s+(?P<alias>\w+)\s*\((?P<columns>[^)]*)\)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def translate_update_from(matched: Match[str]) -> str:
+    table: str = matched.group("table")
+    assignments: str = re.sub(rf"\b{table}\.", "", matched.group("assignments"))
+    return (
+        f"UPDATE {table} SET {assignments} WHERE {table}.id IN ("
+        f"SELECT {table}.id FROM {table} {matched.group('joins')} WHERE {matched.group('conditions')})"
+    )
+
+
+def translate_values_alias(matched: Match[str]) -> str:
+    columns: str = ", ".join(
+        f"column{index} AS {column.strip()}" for index, column in enumerate(matched.group("columns").split(","), 1)
+    )
+    return f"(SELECT {columns} FROM (VALUES {matched.group('rows')})) AS {matched.group('alias')}"
+
+
+@lru_cache(maxsize=1024)
+def translate_to_sqlite(query: str) -> str:
+    """
+    Translates T-SQL constructs used by the managers into SQLite syntax.
+
+    Supported constructs:
+        - INSERT ... OUTPUT INSERTED.<column> VALUES (...) -> INSERT ... VALUES (...) RETURNING <column>
+        - DELETE FROM ... OUTPUT DELETED.<column>, ... [WHERE ...] -> DELETE FROM ... [WHERE ...] RETURNING <column>, ...
+        - OFFSET ? ROWS FETCH NEXT ? ROWS ONLY -> LIMIT ?, ? (parameter order is preserved)
+        - UPDATE <table> SET ... FROM <table> JOIN ... WHERE ... -> UPDATE <table> SET ... WHERE id IN (SELECT ...)
+        - (VALUES (...), ...) AS alias(column, ...) -> (SELECT column1 AS column, ... FROM (VALUES ...)) AS alias
+        - #<table> (session temporary table) -> temp.<table>
+        - COLLATE DATABASE_DEFAULT -> removed, columns keep SQLite's default collation
+
+    Translation result is cached, because managers build a small set of distinct query strings.
+
+    Args:
+        query (str): Query in T-SQL syntax.
+
+    Returns:
+        query (str): Equivalent query in SQLite syntax.
+    """
+
+    output_matched: Match[str] = OUTPUT_PATTERN.search(query)
+    if output_matched:
+        columns: str = OUTPUT_COLUMN_PREFIX_PATTERN.sub("", output_matched.group("columns"))
+        query = OUTPUT_PATTERN.sub("", query).rstrip() + f" RETURNING {columns}"
+
+    query = OFFSET_FETCH_PATTERN.sub("LIMIT ?, ?", query)
+    query = UPDATE_FROM_PATTERN.sub(translate_update_from, query)
+    query = VALUES_ALIAS_PATTERN.sub(translate_values_alias, query)
+    query = DEFAULT_COLLATION_PATTERN.sub("", query)
+    query = TEMP_TABLE_PATTERN.sub(r"temp.\1", query)
+    return query
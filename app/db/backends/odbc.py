@@ -0,0 +1,34 @@
+from typing import Any, Tuple
+
+from .base import Backend
+
+
+class OdbcBackend(Backend):
+    """
+    SQL Server backend working through ODBC driver.
+
+    Args:
+        connection_string (str): ODBC connection string, for example
+            "DRIVER={ODBC Driver 17 for SQL Server};SERVER=...;DATABASE=WorkTime;UID=...;PWD=...".
+        session_statements (Tuple[str, ...]): Statements executed on every new connection.
+    """
+
+    name: str = "odbc"
+
+    def __init__(self, connection_string: str, session_statements: Tuple[str, ...] = ()) -> None:
+        self.connection_string: str = connection_string
+        self.session_statements: Tuple[str, ...] = session_statements
+
+    def connect(self) -> Any:
+        import pyodbc
+
+        connection: Any = pyodbc.connect(self.connection_string)
+        for statement in self.session_statements:
+            connection.execute(statement)
+        return connection
+
+    def is_duplicate_key_error(self, error: Exception) -> bool:
+        import pyodbc
+
+        # 2627: violation of a primary key or unique constraint, 2601: duplicate key in a unique index
+        return isinstance(error, pyodbc.IntegrityError) and any(code in str(error) for code in ("2627", "2601"))
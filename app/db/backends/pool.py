@@ -0,0 +1,84 @@
+import queue
+from typing import Any, Optional
+
+from .base import Backend
+
+
+class PooledConnection:
+    """
+    Connection proxy returned by the pool.
+
+    Exiting the context commits pending changes and returns the connection to the pool instead
+    of closing it. On error changes are rolled back and the connection is closed, because
+    it may be broken (for example, after database server restart).
+    """
+
+    def __init__(self, pool: "ConnectionPool", connection: Any) -> None:
+        self.pool: ConnectionPool = pool
+        self.connection: Any = connection
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exception_type: Optional[type], *args: Any) -> None:
+        if exception_type is not None:
+            self.pool.discard(self.connection)
+            return
+
+        try:
+            self.connection.commit()
+        except Exception:
+            self.pool.discard(self.connection)
+            raise
+        self.pool.release(self.connection)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+    def cursor(self) -> Any:
+        return self.connection.cursor()
+
+
+class ConnectionPool:
+    """
+    Per-process pool of idle connections of a backend.
+
+    The pool does not limit the number of connections in use: a connection is opened when
+    there is no idle one, and at most `size` idle connections are kept after release.
+    Size should match the number of threads serving requests in one worker process.
+
+    Args:
+        backend (Backend): Backend opening new connections.
+        size (int): Maximum number of idle connections.
+    """
+
+    def __init__(self, backend: Backend, size: int) -> None:
+        self.backend: Backend = backend
+        self.idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+    def connect(self) -> PooledConnection:
+        try:
+            connection: Any = self.idle.get_nowait()
+        except queue.Empty:
+            connection = self.backend.connect()
+        return PooledConnection(self, connection)
+
+    def release(self, connection: Any) -> None:
+        try:
+            self.idle.put_nowait(connection)
+        except queue.Full:
+            self.discard(connection)
+
+    def discard(self, connection: Any) -> None:
+        for method in (connection.rollback, connection.close):
+            try:
+                method()
+            except Exception:
+                pass
+
+    def clear(self) -> None:
+        while True:
+            try:
+                self.discard(self.idle.get_nowait())
+            except queue.Empty:
+                break
@@ -0,0 +1,165 @@
+import os
+import sqlite3
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from .base import Backend
+from .dialect import translate_to_sqlite
+
+SCHEMA_PATH: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "schema", "tables.sqlite.sql")
+HUNDREDTH: Decimal = Decimal("0.01")
+
+
+def adapt_datetime(value: datetime) -> str:
+    if value.time() == time(0, 0):
+        return value.strftime("%Y-%m-%d")
+    return value.isoformat(sep=" ")
+
+
+def convert_decimal(value: bytes) -> Decimal:
+    return Decimal(value.decode()).quantize(HUNDREDTH)
+
+
+sqlite3.register_adapter(Decimal, float)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_adapter(datetime, adapt_datetime)
+sqlite3.register_adapter(time, time.isoformat)
+sqlite3.register_converter("DECIMAL", convert_decimal)
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter("TIME", lambda value: time.fromisoformat(value.decode()))
+
+
+def convert_value(value: Any) -> Any:
+    if isinstance(value, float):
+        return Decimal(repr(value)).quantize(HUNDREDTH)
+    return value
+
+
+class SqliteCursor:
+    """
+    Cursor wrapper which translates T-SQL queries and mimics pyodbc cursor behaviour.
+
+    Float values produced by expressions without declared type (SUM, COALESCE and others)
+    are converted to Decimal, because all fractional columns of the schema are DECIMAL(10,2).
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self.cursor: sqlite3.Cursor = cursor
+
+    def __enter__(self) -> "SqliteCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.cursor.close()
+
+    @property
+    def rowcount(self) -> int:
+        return self.cursor.rowcount
+
+    @property
+    def description(self) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+        return self.cursor.description
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> "SqliteCursor":
+        self.cursor.execute(translate_to_sqlite(query), tuple(params))
+        return self
+
+    def executemany(self, query: str, params: Iterable[Sequence[Any]]) -> "SqliteCursor":
+        self.cursor.executemany(translate_to_sqlite(query), params)
+        return self
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        row: Optional[Tuple[Any, ...]] = self.cursor.fetchone()
+        if row is None:
+            return None
+        return tuple(convert_value(value) for value in row)
+
+    def fetchmany(self, size: int) -> List[Tuple[Any, ...]]:
+        return [tuple(convert_value(value) for value in row) for row in self.cursor.fetchmany(size)]
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return [tuple(convert_value(value) for value in row) for row in self.cursor.fetchall()]
+
+    def close(self) -> None:
+        self.cursor.close()
+
+
+class SqliteConnection:
+    """
+    Connection wrapper with pyodbc-like context manager semantics.
+
+    Exiting the context commits pending changes (or rolls them back on error) and closes the connection.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection: sqlite3.Connection = connection
+
+    def __enter__(self) -> "SqliteConnection":
+        return self
+
+    def __exit__(self, exception_type: Optional[type], *args: Any) -> None:
+        if exception_type is None:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+
+    def cursor(self) -> SqliteCursor:
+        return SqliteCursor(self.connection.cursor())
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class SqliteBackend(Backend):
+    """
+    Embedded SQLite backend for local development, tests and benchmarks.
+
+    Database file is created together with the schema on first connection.
+
+    Args:
+        path (str): Path to the database file.
+    """
+
+    name: str = "sqlite"
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.initialized: bool = False
+
+    def open_connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection = sqlite3.connect(
+            self.path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            timeout=30,
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def initialize(self) -> None:
+        connection: sqlite3.Connection = self.open_connection()
+        try:
+            connection.execute("PRAGMA journal_mode = WAL")
+            with open(file=SCHEMA_PATH, mode="r", encoding="utf-8") as file:
+                connection.executescript(file.read())
+            connection.commit()
+        finally:
+            connection.close()
+        self.initialized = True
+
+    def is_duplicate_key_error(self, error: Exception) -> bool:
+        return isinstance(error, sqlite3.IntegrityError) and str(error).startswith("UNIQUE constraint failed")
+
+    def connect(self) -> SqliteConnection:
+        if not self.initialized:
+            self.initialize()
+        return SqliteConnection(self.open_connection())
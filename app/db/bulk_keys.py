@@ -0,0 +1,50 @@
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from decouple import config
+
+BULK_KEYS_CHUNK_SIZE: int = config("BULK_KEYS_CHUNK_SIZE", default=1000, cast=int)
+COLLATION: str = " COLLATE DATABASE_DEFAULT"
+
+
+class KeyTable:
+    """
+    Session temporary table for passing large key sets to a query.
+
+    Inlining one placeholder per key hits SQL Server's limit of 2100 parameters and produces
+    a separate query plan for every key count. Instead, keys are staged into `#<name>` with
+    `executemany` of a single-row INSERT and queries join against the table, so the statement
+    text is the same for any number of keys.
+
+    Keys are deduplicated and inserted in chunks of `BULK_KEYS_CHUNK_SIZE` rows.
+    The table lives until the connection is closed and is recreated on every `stage` call.
+    String columns are declared with `COLLATE DATABASE_DEFAULT`, because temporary tables otherwise
+    take the collation of tempdb and joins against database columns fail with a collation conflict.
+
+    Args:
+        name (str): Table name without the `#` prefix.
+        columns (Dict[str, str]): Column names mapped to their SQL types.
+    """
+
+    def __init__(self, name: str, columns: Dict[str, str]) -> None:
+        self.name: str = "#" + name
+        self.columns: Dict[str, str] = columns
+
+    def stage(self, cursor: Any, keys: Iterable[Sequence[Any]]) -> str:
+        definitions: str = ", ".join(
+            f"{column} {column_type}{COLLATION if 'CHAR' in column_type.upper() else ''} NOT NULL"
+            for column, column_type in self.columns.items()
+        )
+        placeholders: str = ", ".join("?" for _ in self.columns)
+
+        cursor.execute(f"DROP TABLE IF EXISTS {self.name}")
+        cursor.execute(f"CREATE TABLE {self.name} ({definitions})")
+
+        if hasattr(cursor, "fast_executemany"):
+            cursor.fast_executemany = True
+
+        rows: List[Tuple[Any, ...]] = list(dict.fromkeys(tuple(key) for key in keys))
+        query: str = f"INSERT INTO {self.name} ({', '.join(self.columns)}) VALUES ({placeholders})"
+
+        for start in range(0, len(rows), BULK_KEYS_CHUNK_SIZE):
+            cursor.executemany(query, rows[start : start + BULK_KEYS_CHUNK_SIZE])
+        return self.name
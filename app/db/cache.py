@@ -0,0 +1,54 @@
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe process-local cache with per-entry expiration.
+
+    Managers invalidate entries on writes they perform. Expiration bounds staleness of entries
+    changed by other worker processes, which keep their own copy of the cache. Entries may also be
+    stored with a version, such as counters of `data_versions` of the tables they were read from:
+    an entry is returned only for the version it was stored with, so changes made by other
+    worker processes are seen as soon as they bump the counters.
+
+    Args:
+        ttl (float): Lifetime of an entry, in seconds.
+        max_size (int): Maximum number of entries, the oldest entry is evicted on overflow.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        self.ttl: float = ttl
+        self.max_size: int = max_size
+        self.entries: Dict[Hashable, Tuple[float, Hashable, Any]] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable, version: Hashable = None) -> Optional[Any]:
+        with self.lock:
+            entry: Optional[Tuple[float, Hashable, Any]] = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, entry_version, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return None
+            if entry_version != version:
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, version: Hashable = None) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+            if len(self.entries) >= self.max_size:
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = (time.monotonic() + self.ttl, version, value)
+
+    def invalidate(self, *keys: Hashable) -> None:
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,175 @@
+import json
+import time
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from decouple import config
+
+from .db_connection import DatabaseConnection
+from .setting_manager import SettingManager
+
+CHANGE_FEED_GAP_TIMEOUT: int = config("CHANGE_FEED_GAP_TIMEOUT", default=300, cast=int)
+# Upper bound of events kept for lagging consumers, so that an abandoned consumer does not keep events forever
+CHANGE_FEED_MAX_BACKLOG: int = config("CHANGE_FEED_MAX_BACKLOG", default=1000000, cast=int)
+
+# Event type: entity and operation of the change record
+CHANGE_EVENTS: Dict[str, Tuple[str, str]] = {
+    "task_added": ("task", "insert"),
+    "task_updated": ("task", "update"),
+    "task_deleted": ("task", "delete"),
+    "work_updated": ("work", "upsert"),
+    "work_deleted": ("work", "delete"),
+}
+CHANGE_ENTITIES: Tuple[str, ...] = ("task", "work")
+
+DELETED_UNTIL_SETTING: str = "events_deleted_until"
+
+Change = Dict[str, Any]
+
+setting_manager: SettingManager = SettingManager()
+
+
+def get_deleted_until() -> int:
+    return int(setting_manager.get_setting(DELETED_UNTIL_SETTING, default="0"))
+
+
+def get_change(event_id: int, event_type: str, payload: Dict[str, Any]) -> Optional[Change]:
+    """
+    Returns change record of the event: entity, operation, id and the row. Rows of deleted tasks
+    are their last values, deleted works are tombstones without a row.
+    """
+
+    entity, operation = CHANGE_EVENTS[event_type]
+    if entity == "task":
+        row: Optional[Dict[str, Any]] = payload.get("task")
+        if row is None:
+            return None
+        return {"seq": event_id, "entity": entity, "operation": operation, "id": row["id"], "data": row}
+
+    row: Optional[Dict[str, Any]] = None if operation == "delete" else payload
+    return {"seq": event_id, "entity": entity, "operation": operation, "id": payload["work_id"], "data": row}
+
+
+class ChangeFeed(DatabaseConnection):
+    """
+    Incremental export of task and work changes for payroll and ERP synchronization.
+
+    Changes are read from the `events` outbox, which managers fill within their write transactions,
+    so ids of events are the change sequence and a consumer's watermark is the id of the last change
+    it applied. Every consumer keeps its acknowledged watermark in `change_feed_consumers`, and events
+    are not cleaned up before the slowest consumer has acknowledged them (up to `CHANGE_FEED_MAX_BACKLOG`).
+
+    Ids are assigned at insert, so an event may become visible after events with greater ids committed
+    by faster transactions. A page therefore stops before a missing id, until the id has been missing
+    for `CHANGE_FEED_GAP_TIMEOUT` seconds: then it belongs to a rolled back transaction and is skipped.
+    """
+
+    def get_changes(
+        self,
+        consumer: str,
+        after: Optional[int],
+        limit: int,
+        entities: Sequence[str] = CHANGE_ENTITIES,
+    ) -> Optional[Tuple[List[Change], int, bool]]:
+        """
+        Returns changes following the watermark.
+
+        Args:
+            consumer (str): Consumer name.
+            after (int, optional): Watermark, the consumer's acknowledged watermark by default.
+            limit (int): Maximum number of events read.
+            entities (Sequence[str]): Entities of returned changes; other events only advance the watermark.
+
+        Returns:
+            changes (List[Change]): Changes in sequence order.
+            watermark (int): Watermark after the returned changes, to be acknowledged once they are applied.
+            has_more (bool): Whether further changes are available at once.
+
+            None if events following the watermark have been cleaned up, and the consumer has to resynchronize
+            from a full export.
+        """
+
+        if after is None:
+            after = self.get_consumer_watermark(consumer)
+        if after < get_deleted_until():
+            return None
+
+        query: str = """
+            SELECT id, event_type, payload
+            FROM events
+            WHERE id > ?
+            ORDER BY id
+            OFFSET ? ROWS
+            FETCH NEXT ? ROWS ONLY
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (after, 0, limit))
+                events: List[Tuple[int, str, str]] = cursor.fetchall()
+                if not events:
+                    return [], after, False
+
+                query: str = "SELECT event_id FROM event_gaps WHERE event_id > ? AND event_id < ? AND seen_at <= ?"
+                cursor.execute(query, (after, events[-1][0], int(time.time()) - CHANGE_FEED_GAP_TIMEOUT))
+                settled_gaps: Set[int] = {event_id for event_id, in cursor.fetchall()}
+
+                changes: List[Change] = []
+                watermark: int = after
+                for event_id, event_type, payload in events:
+                    if event_id > watermark + 1 and watermark + 1 not in settled_gaps:
+                        self.record_gap(cursor, watermark + 1)
+                        connection.commit()
+                        return changes, watermark, False
+
+                    watermark = event_id
+                    if event_type not in CHANGE_EVENTS or CHANGE_EVENTS[event_type][0] not in entities:
+                        continue
+                    change: Optional[Change] = get_change(event_id, event_type, json.loads(payload))
+                    if change is not None:
+                        changes.append(change)
+
+        return changes, watermark, len(events) == limit
+
+    def record_gap(self, cursor: Any, event_id: int) -> None:
+        query: str = """
+            INSERT INTO event_gaps (event_id, seen_at)
+            SELECT ?, ?
+            WHERE NOT EXISTS (SELECT 1 FROM event_gaps WHERE event_id = ?)
+        """
+        cursor.execute(query, (event_id, int(time.time()), event_id))
+
+    def get_consumer_watermark(self, consumer: str) -> int:
+        query: str = "SELECT last_event_id FROM change_feed_consumers WHERE name = ?"
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (consumer.strip(),))
+                record: Optional[Tuple[int]] = cursor.fetchone()
+                return 0 if record is None else record[0]
+
+    def acknowledge(self, consumer: str, watermark: int) -> None:
+        """
+        Stores the consumer's watermark. Watermarks only move forward, so a late retry of an earlier
+        acknowledgement does not replay changes.
+
+        Raises:
+            ValueError: If the watermark is ahead of the last event.
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM events")
+                if watermark < 0 or watermark > cursor.fetchone()[0]:
+                    raise ValueError("Watermark is ahead of the change feed")
+
+                query: str = "UPDATE change_feed_consumers SET last_event_id = ? WHERE name = ? AND last_event_id < ?"
+                cursor.execute(query, (watermark, consumer.strip(), watermark))
+
+                if cursor.rowcount == 0:
+                    query: str = """
+                        INSERT INTO change_feed_consumers (name, last_event_id)
+                        SELECT ?, ?
+                        WHERE NOT EXISTS (SELECT 1 FROM change_feed_consumers WHERE name = ?)
+                    """
+                    cursor.execute(query, (consumer.strip(), watermark, consumer.strip()))
+            connection.commit()
@@ -0,0 +1,59 @@
+import logging
+from typing import Dict, Iterable
+
+from .db_connection import DatabaseConnection
+from .routing import replica_safe
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class DataVersionManager(DatabaseConnection):
+    def get_data_versions(self, table_names: Iterable[str]) -> Dict[str, int]:
+        table_names = list(table_names)
+        placeholders: str = ", ".join("?" for _ in table_names)
+        query: str = f"SELECT table_name, version FROM data_versions WHERE table_name IN ({placeholders})"
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query, tuple(table_names))
+                versions: Dict[str, int] = dict.fromkeys(table_names, 0)
+                versions.update(cursor.fetchall())
+                return versions
+
+    @replica_safe
+    def get_read_versions(self, table_names: Iterable[str]) -> Dict[str, int]:
+        """
+        Returns versions as seen by replica-safe reads. Read before the data they describe, they may only
+        lag behind it, so a version never labels data older than the version itself.
+        """
+
+        return self.get_data_versions(table_names)
+
+    def bump_data_versions(self, *table_names: str) -> None:
+        """
+        Increments version counters of tables after the caller's transaction has been committed.
+
+        Counters let every worker process find out cheaply that its copy of the table's data is outdated.
+        They are incremented in a short transaction of their own, so writes to a table do not queue up
+        on its counter row for the whole duration of their transactions. Rows of counters are seeded
+        by the schema. A counter incremented after the data it describes may only make readers reload
+        data again, and a failed increment is logged without failing the committed write.
+        """
+
+        placeholders: str = ", ".join("?" for _ in table_names)
+        query: str = f"UPDATE data_versions SET version = version + 1 WHERE table_name IN ({placeholders})"
+
+        try:
+            with self.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, table_names)
+                connection.commit()
+        except Exception:
+            logger.exception("Failed to bump data versions of %s", ", ".join(table_names))
+
+
+data_versions: DataVersionManager = DataVersionManager()
+
+
+def bump_data_versions(*table_names: str) -> None:
+    data_versions.bump_data_versions(*table_names)
@@ -0,0 +1,17 @@
+from typing import Any
+
+from decouple import config
+
+from .backends import connect
+from .instrumentation import InstrumentedConnection
+from .routing import use_read_only_target
+
+QUERY_INSTRUMENTATION: bool = config("QUERY_INSTRUMENTATION", default=True, cast=bool)
+
+
+class DatabaseConnection:
+    def get_connection(self) -> Any:
+        connection: Any = connect(read_only=use_read_only_target())
+        if QUERY_INSTRUMENTATION:
+            return InstrumentedConnection(connection)
+        return connection
@@ -1,8 +1,15 @@
+from .archive_manager import ArchiveManager
+from .change_feed import ChangeFeed
+from .data_versions import DataVersionManager
 from .db_connection import DatabaseConnection
 from .employee_manager import EmployeeManager
+from .event_manager import EventManager
 from .hour_manager import HourManager
 from .log_manager import LogManager
 from .order_manager import OrderManager
+from .pivot_manager import PivotManager
+from .setting_manager import SettingManager
+from .task_cube import TaskCube
 from .task_manager import TaskManager
 from .user_manager import UserManager
 from .work_manager import WorkManager
@@ -10,10 +17,27 @@ from .work_manager import WorkManager
 
 class DatabaseManager(DatabaseConnection):
     def __init__(self):
+        self.archive: ArchiveManager = ArchiveManager()
+        self.changes: ChangeFeed = ChangeFeed()
+        self.data_versions: DataVersionManager = DataVersionManager()
         self.employees: EmployeeManager = EmployeeManager()
+        self.events: EventManager = EventManager()
         self.hours: HourManager = HourManager()
         self.logs: LogManager = LogManager()
         self.orders: OrderManager = OrderManager()
+        self.pivot: PivotManager = PivotManager()
+        self.settings: SettingManager = SettingManager()
         self.tasks: TaskManager = TaskManager()
+        self.task_cube: TaskCube = TaskCube()
         self.users: UserManager = UserManager()
         self.works: WorkManager = WorkManager()
+
+    def check_connection(self) -> bool:
+        try:
+            with self.get_connection() as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchone()
+            return True
+        except Exception:
+            return False
@@ -1,12 +1,27 @@
 import re
-from collections import defaultdict
 from decimal import Decimal
 from typing import Dict, List, Match, Optional, Tuple, Union
 
+from .data_versions import bump_data_versions
 from .db_connection import DatabaseConnection
+from .event_manager import publish_event
+from .reference_data import reference_data
+from .routing import replica_safe
+from .task_columns import GroupKey, TaskColumns, get_task_columns, to_hours
 
 Tasks = List[Dict[str, Union[str, Decimal]]]
 Data = List[List[Union[str, Decimal]]]
+# Sheet name, number of days of the month and rows of the grid
+Timesheet = Tuple[str, int, List[List[Union[str, float, None]]]]
+# Label of department subtotal rows of timesheets, by which the report file also styles them
+TIMESHEET_SUBTOTAL_LABEL: str = "Итого по подразделению"
+
+EMPLOYEE_CATEGORIES: Dict[str, str] = {
+    "worker": "Рабочий",
+    "specialist": "Специалист",
+    "manager": "Руководитель",
+}
+TIMESHEET_EMPLOYEE_COLUMNS: List[str] = ["department", "employee_name", "personnel_number", "employee_category"]
 
 
 class EmployeeManager(DatabaseConnection):
@@ -19,7 +34,10 @@ class EmployeeManager(DatabaseConnection):
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(query, (name.strip(), personnel_number.strip(), department.strip(), category.strip()))
+                publish_event(cursor, "employee_added", {"personnel_number": personnel_number.strip()})
                 connection.commit()
+        bump_data_versions("employees")
+        reference_data.invalidate("employees")
 
     def update_employee(
         self,
@@ -52,6 +70,8 @@ class EmployeeManager(DatabaseConnection):
                     ),
                 )
                 connection.commit()
+        bump_data_versions("employees")
+        reference_data.invalidate("employees")
 
     def delete_employee(self, employee_id: int) -> None:
         query: str = "DELETE FROM employees WHERE id = ?"
@@ -59,7 +79,10 @@ class EmployeeManager(DatabaseConnection):
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(query, (employee_id,))
+                publish_event(cursor, "employee_deleted", {"employee_id": employee_id})
                 connection.commit()
+        bump_data_versions("employees")
+        reference_data.invalidate("employees")
 
     def get_employee_used_hours(self, personnel_number: str, operation_date: str) -> Decimal:
         query: str = """
@@ -82,27 +105,22 @@ class EmployeeManager(DatabaseConnection):
         used_hours: Decimal = self.get_employee_used_hours(personnel_number.strip(), operation_date)
         return hours_per_day - used_hours
 
-    def get_employee_department(self, personnel_number: str) -> Optional[str]:
-        query: str = "SELECT department FROM employees WHERE personnel_number = ?"
+    def get_employee_attributes(self, personnel_number: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Returns name, department and category of the employee.
+        """
 
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (personnel_number.strip(),))
+        return reference_data.get_employee(personnel_number)
 
-                res: Optional[Tuple[str]] = cursor.fetchone()
-                if res:
-                    return res[0]
+    def get_employee_department(self, personnel_number: str) -> Optional[str]:
+        employee: Optional[Tuple[str, str, str]] = reference_data.get_employee(personnel_number)
+        if employee:
+            return employee[1]
 
     def get_employee_category(self, personnel_number: str) -> Optional[str]:
-        query: str = "SELECT category FROM employees WHERE personnel_number = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (personnel_number.strip(),))
-
-                res: Optional[Tuple[str]] = cursor.fetchone()
-                if res:
-                    return res[0]
+        employee: Optional[Tuple[str, str, str]] = reference_data.get_employee(personnel_number)
+        if employee:
+            return employee[2]
 
     def get_employees_by_partial_match(self, query: str) -> List[str]:
         query_string: str = """
@@ -139,6 +157,7 @@ class EmployeeManager(DatabaseConnection):
             return None
         return matched.group("employee_name"), matched.group("personnel_number")
 
+    @replica_safe
     def get_employees_count(self) -> int:
         query: str = "SELECT COUNT(*) FROM employees"
 
@@ -148,18 +167,9 @@ class EmployeeManager(DatabaseConnection):
                 return cursor.fetchone()[0]
 
     def get_departments(self) -> List[str]:
-        query: str = "SELECT name FROM departments"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query)
-
-                departments: List[str] = []
-                for data in cursor.fetchall():
-                    if data[0] not in departments:
-                        departments.append(data[0])
-                return departments
+        return reference_data.get_departments()
 
+    @replica_safe
     def get_employees(
         self,
         employee_name: Optional[str] = None,
@@ -220,24 +230,11 @@ class EmployeeManager(DatabaseConnection):
                 return personnel_numbers
 
     def get_employee_name_by_number(self, personnel_number: str) -> Optional[str]:
-        query: str = "SELECT name FROM employees WHERE personnel_number = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (personnel_number.strip(),))
-
-                row: Optional[Tuple[str]] = cursor.fetchone()
-                return row and row[0]
+        employee: Optional[Tuple[str, str, str]] = reference_data.get_employee(personnel_number)
+        return employee and employee[0]
 
     def get_personnel_number_by_name(self, employee_name: str) -> Optional[str]:
-        query: str = "SELECT personnel_number FROM employees WHERE name = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (employee_name.strip(),))
-
-                row: Optional[Tuple[str]] = cursor.fetchone()
-                return row and row[0]
+        return reference_data.get_personnel_number_by_name(employee_name)
 
     def get_employee_data_by_id(self, employee_id: int) -> Optional[Dict[str, Union[str, int]]]:
         query: str = """
@@ -260,15 +257,15 @@ class EmployeeManager(DatabaseConnection):
                         "employee_category": employee_data[4],
                     }
 
-    def get_employees_data(self, tasks: Tasks) -> Data:
+    def get_employees_data(self, tasks: Union[Tasks, TaskColumns]) -> Data:
         """
         Groups tasks by employee and date, aggregating hours for report generation.
 
-        Creates unique key from employee details and date to aggregate hours,
-        then formats the result with translated category names.
+        Hours are summed in integer hundredths over interned employee and date ids (see `TaskColumns`),
+        then formatted with translated category names.
 
         Args:
-            tasks (Tasks): List of task records, each containing employee details,
+            tasks (Union[Tasks, TaskColumns]): List of task records, each containing employee details,
                 order information, and work metrics.
 
         Returns:
@@ -276,33 +273,97 @@ class EmployeeManager(DatabaseConnection):
                 on specific date.
         """
 
-        spent_hours_per_employee: Dict[Tuple[str, ...], Decimal] = defaultdict(Decimal)
-
-        for task in tasks:
-            key: Tuple[str, ...] = (
-                task["employee_name"],
-                task["personnel_number"],
-                task["employee_category"],
-                task["department"],
-                task["operation_date"],
-            )
-            spent_hours_per_employee[key] += task["hours"]
-
-        employee_categories: Dict[str, str] = {
-            "worker": "Рабочий",
-            "specialist": "Специалист",
-            "manager": "Руководитель",
-        }
+        group_columns, spent_hours = get_task_columns(tasks).group_hours(
+            ["employee_name", "personnel_number", "employee_category", "department", "operation_date"]
+        )
+        employee_names, personnel_numbers, employee_categories, departments, operation_dates = group_columns
 
         employees_data: Data = [
-            [
-                employee_details[0],
-                employee_details[1],
-                employee_categories[employee_details[2]],
-                employee_details[3],
-                operation_date,
-                spent_hours,
-            ]
-            for (*employee_details, operation_date), spent_hours in spent_hours_per_employee.items()
+            list(employee_data)
+            for employee_data in zip(
+                employee_names,
+                personnel_numbers,
+                map(EMPLOYEE_CATEGORIES.__getitem__, employee_categories),
+                departments,
+                operation_dates,
+                map(to_hours, spent_hours),
+            )
         ]
         return employees_data
+
+    def get_timesheet_data(self, tasks: Union[Tasks, TaskColumns]) -> List[Timesheet]:
+        """
+        Builds monthly timesheet grids: hours of every employee per day of month, with per-employee totals,
+        department subtotals and the grand total.
+
+        Hours are summed in integer hundredths by one `bincount` over (month, employee, day) cell indexes
+        and subtotals are reduced per department over the resulting arrays, so the cost grows with the
+        number of tasks and rows, not with the number of cells.
+
+        Args:
+            tasks (Union[Tasks, TaskColumns]): List of task records.
+
+        Returns:
+            timesheets (List[Timesheet]): Grid of every month of the tasks, in chronological order. Rows are
+                sorted by department and employee name; days without hours are empty.
+        """
+
+        import numpy
+        import pandas
+
+        if not tasks:
+            return []
+
+        task_columns: TaskColumns = get_task_columns(tasks)
+        # Groups are numbered in sorted order, which is the department and name order of the sheet
+        employee_codes, employee_columns = task_columns.get_group_codes(TIMESHEET_EMPLOYEE_COLUMNS, sort=True)
+        employees: List[GroupKey] = list(zip(*employee_columns))
+        hours: numpy.ndarray = task_columns.get_hundredths()
+
+        # Dates repeat across tasks, so only distinct ones are parsed
+        date_codes, dates = task_columns.get_codes("operation_date")
+        dates = pandas.to_datetime(dates)
+        month_codes, months = pandas.factorize(dates.to_period("M"), sort=True)
+
+        employees_count: int = len(employees)
+        cell_indexes: numpy.ndarray = (month_codes * employees_count * 31)[date_codes] + employee_codes * 31
+        cell_indexes += (dates.day.to_numpy() - 1)[date_codes]
+        cells: numpy.ndarray = (
+            numpy.rint(numpy.bincount(cell_indexes, weights=hours, minlength=len(months) * employees_count * 31))
+            .astype(numpy.int64)
+            .reshape(len(months), employees_count, 31)
+        )
+        departments: numpy.ndarray = numpy.array(employee_columns[0], dtype=object)
+
+        timesheets: List[Timesheet] = []
+        for month_code, month in enumerate(months):
+            present: numpy.ndarray = numpy.flatnonzero(cells[month_code].any(axis=1))
+            if not present.size:
+                continue
+
+            grid: numpy.ndarray = numpy.column_stack(
+                [cells[month_code][present, : month.days_in_month], cells[month_code][present].sum(axis=1)]
+            )
+            month_departments: numpy.ndarray = departments[present]
+            starts: numpy.ndarray = numpy.flatnonzero(numpy.r_[True, month_departments[1:] != month_departments[:-1]])
+            subtotals: numpy.ndarray = numpy.add.reduceat(grid, starts, axis=0)
+            ends: List[int] = (numpy.r_[starts[1:], len(present)] - 1).tolist()
+
+            values: List[List[Optional[float]]] = numpy.where(grid == 0, None, grid / 100).tolist()
+            subtotal_values: List[List[Optional[float]]] = numpy.where(subtotals == 0, None, subtotals / 100).tolist()
+            total: List[float] = (grid.sum(axis=0) / 100).tolist()
+
+            rows: List[List[Union[str, float, None]]] = []
+            department_index: int = 0
+            for row_index, employee_code in enumerate(present.tolist()):
+                department, employee_name, personnel_number, category = employees[employee_code]
+                rows.append(
+                    [employee_name, personnel_number, EMPLOYEE_CATEGORIES[category], department, *values[row_index]]
+                )
+                if row_index == ends[department_index]:
+                    rows.append([TIMESHEET_SUBTOTAL_LABEL, "", "", department, *subtotal_values[department_index]])
+                    department_index += 1
+            rows.append(["Итого", "", "", "", *total])
+
+            timesheets.append((f"Табель {month.strftime('%m.%Y')}", month.days_in_month, rows))
+        return timesheets
@@ -0,0 +1,95 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from decouple import config
+
+from .change_feed import CHANGE_FEED_MAX_BACKLOG, DELETED_UNTIL_SETTING, get_deleted_until, setting_manager
+from .db_connection import DatabaseConnection
+
+EVENTS_KEEP_COUNT: int = config("EVENTS_KEEP_COUNT", default=10000, cast=int)
+
+Event = Tuple[int, str, Dict[str, Any]]
+
+
+def publish_event(cursor: Any, event_type: str, payload: Dict[str, Any]) -> None:
+    """
+    Records change event within the transaction of the cursor, so the event is visible
+    to subscribers only if the change itself is committed.
+    """
+
+    query: str = "INSERT INTO events (event_type, payload) VALUES (?, ?)"
+    cursor.execute(query, (event_type, json.dumps(payload, ensure_ascii=False, default=str)))
+
+
+def publish_events(cursor: Any, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """
+    Records several change events with one batch, in the given order, like `publish_event`.
+    """
+
+    if not events:
+        return
+
+    if hasattr(cursor, "fast_executemany"):
+        cursor.fast_executemany = True
+
+    query: str = "INSERT INTO events (event_type, payload) VALUES (?, ?)"
+    cursor.executemany(
+        query,
+        [(event_type, json.dumps(payload, ensure_ascii=False, default=str)) for event_type, payload in events],
+    )
+
+
+class EventManager(DatabaseConnection):
+    def get_last_event_id(self) -> int:
+        query: str = "SELECT COALESCE(MAX(id), 0) FROM events"
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query)
+                return cursor.fetchone()[0]
+
+    def get_events(self, after_id: int, limit: int = 500) -> List[Event]:
+        query: str = """
+            SELECT id, event_type, payload
+            FROM events
+            WHERE id > ?
+            ORDER BY id
+            OFFSET ? ROWS
+            FETCH NEXT ? ROWS ONLY
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (after_id, 0, limit))
+                return [
+                    (event_id, event_type, json.loads(payload)) for event_id, event_type, payload in cursor.fetchall()
+                ]
+
+    def delete_old_events(self, keep_count: int = EVENTS_KEEP_COUNT) -> int:
+        """
+        Deletes events except the last `keep_count` ones and those not yet acknowledged by change feed consumers.
+        Returns the number of deleted events.
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT COALESCE(MAX(id), 0) FROM events")
+                last_event_id: int = cursor.fetchone()[0]
+                cursor.execute("SELECT MIN(last_event_id) FROM change_feed_consumers")
+                consumers_event_id: Optional[int] = cursor.fetchone()[0]
+
+                deleted_until: int = last_event_id - keep_count
+                if consumers_event_id is not None:
+                    deleted_until = max(min(deleted_until, consumers_event_id), last_event_id - CHANGE_FEED_MAX_BACKLOG)
+                if deleted_until <= get_deleted_until():
+                    return 0
+
+                # Recorded first, so that consumers behind the boundary are told to resynchronize
+                # instead of taking deleted events for a gap
+                setting_manager.set_setting(DELETED_UNTIL_SETTING, str(deleted_until))
+
+                cursor.execute("DELETE FROM events WHERE id <= ?", (deleted_until,))
+                deleted_count: int = cursor.rowcount
+                cursor.execute("DELETE FROM event_gaps WHERE event_id <= ?", (deleted_until,))
+            connection.commit()
+        return deleted_count
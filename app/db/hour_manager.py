@@ -1,7 +1,10 @@
 from decimal import Decimal
 from typing import Any, List, Tuple
 
+from .data_versions import bump_data_versions
 from .db_connection import DatabaseConnection
+from .work_hours import discard_pending_hours
+from .work_manager import publish_work_updates, works_cache
 
 
 class HourManager(DatabaseConnection):
@@ -27,7 +30,11 @@ class HourManager(DatabaseConnection):
                     WHERE order_id = ? AND name = ?
                 """
                 cursor.execute(query, (spent_hours, order_id, work_name))
+                discard_pending_hours(cursor, "works.order_id = ? AND works.name = ?", (order_id, work_name))
+                publish_work_updates(cursor, "works.order_id = ? AND works.name = ?", (order_id, work_name))
             connection.commit()
+        bump_data_versions("works", "hours")
+        works_cache.clear()
 
     def delete_hours(self, hours_id: int, order_id: int, work_name: str) -> None:
         with self.get_connection() as connection:
@@ -38,10 +45,14 @@ class HourManager(DatabaseConnection):
                     WHERE order_id = ? AND name = ?
                 """
                 cursor.execute(query, (order_id, work_name.strip()))
+                discard_pending_hours(cursor, "works.order_id = ? AND works.name = ?", (order_id, work_name.strip()))
+                publish_work_updates(cursor, "works.order_id = ? AND works.name = ?", (order_id, work_name.strip()))
 
                 query: str = "DELETE FROM hours WHERE id = ?"
                 cursor.execute(query, (hours_id,))
             connection.commit()
+        bump_data_versions("works", "hours")
+        works_cache.clear()
 
     def get_hours_list(self) -> List:
         query: str = """
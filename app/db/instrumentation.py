@@ -0,0 +1,193 @@
+import logging
+import os
+import re
+import sys
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from types import FrameType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from decouple import config
+
+from .metrics import Counter, Histogram, registry
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SLOW_QUERY_THRESHOLD_MS: float = config("SLOW_QUERY_THRESHOLD_MS", default=500, cast=float)
+
+DB_PACKAGE_PATH: str = os.path.dirname(__file__)
+SKIPPED_FILES: Tuple[str, ...] = (
+    os.path.join(DB_PACKAGE_PATH, "instrumentation.py"),
+    os.path.join(DB_PACKAGE_PATH, "db_connection.py"),
+)
+
+queries_total: Counter = registry.counter("db_queries_total", "Number of executed SQL statements.")
+query_rows_total: Counter = registry.counter("db_query_rows_total", "Number of rows fetched from SQL statements.")
+slow_queries_total: Counter = registry.counter("db_slow_queries_total", "Number of statements over slow threshold.")
+query_duration: Histogram = registry.histogram("db_query_duration_seconds", "Duration of SQL statement execution.")
+
+
+class RequestQueryStats:
+    """
+    Aggregated statistics of SQL statements executed while serving a single request.
+    """
+
+    def __init__(self) -> None:
+        self.queries_count: int = 0
+        self.rows_count: int = 0
+        self.duration_ms: float = 0.0
+        self.queries: List[Dict[str, Any]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.queries_count += 1
+        self.duration_ms += record["duration_ms"]
+        self.queries.append(record)
+
+
+request_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_stats", default=None)
+
+
+@lru_cache(maxsize=2048)
+def get_fingerprint(query: str) -> str:
+    """
+    Normalizes query text so that statements differing only in literals or list sizes share one fingerprint.
+    """
+
+    fingerprint: str = re.sub(r"'(?:[^']|'')*'", "?", query)
+    fingerprint = re.sub(r"\b\d+(?:\.\d+)?\b", "?", fingerprint)
+    fingerprint = re.sub(r"\s+", " ", fingerprint).strip()
+    fingerprint = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)+\s*\))*", "(?+)", fingerprint)
+    fingerprint = re.sub(r"\?(?:\s*,\s*\?)+", "?+", fingerprint)
+    return fingerprint
+
+
+def get_caller() -> str:
+    frame: Optional[FrameType] = sys._getframe(2)
+    while frame is not None:
+        filename: str = frame.f_code.co_filename
+        if filename.startswith(DB_PACKAGE_PATH) and filename not in SKIPPED_FILES:
+            instance: Any = frame.f_locals.get("self")
+            if instance is not None:
+                return f"{type(instance).__name__}.{frame.f_code.co_name}"
+            return f"{os.path.splitext(os.path.basename(filename))[0]}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class InstrumentedCursor:
+    """
+    Cursor proxy which records fingerprint, duration, fetched rows and calling manager method of every statement.
+    """
+
+    def __init__(self, cursor: Any) -> None:
+        self.cursor: Any = cursor
+        self.record: Optional[Dict[str, Any]] = None
+
+    def __enter__(self) -> "InstrumentedCursor":
+        self.cursor.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> Any:
+        return self.cursor.__exit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.cursor, name)
+
+    def __iter__(self) -> Any:
+        for row in self.cursor:
+            self.track_fetch(1, 0.0)
+            yield row
+
+    @property
+    def fast_executemany(self) -> bool:
+        return self.cursor.fast_executemany
+
+    @fast_executemany.setter
+    def fast_executemany(self, value: bool) -> None:
+        self.cursor.fast_executemany = value
+
+    def run(self, method: str, query: str, params: Any) -> "InstrumentedCursor":
+        caller: str = get_caller()
+        started: float = time.perf_counter()
+        try:
+            getattr(self.cursor, method)(query, params)
+        finally:
+            duration: float = time.perf_counter() - started
+            self.track(query, caller, duration)
+        return self
+
+    def execute(self, query: str, params: Sequence[Any] = ()) -> "InstrumentedCursor":
+        return self.run("execute", query, params)
+
+    def executemany(self, query: str, params: Iterable[Sequence[Any]]) -> "InstrumentedCursor":
+        return self.run("executemany", query, params)
+
+    def fetchone(self) -> Any:
+        started: float = time.perf_counter()
+        row: Any = self.cursor.fetchone()
+        self.track_fetch(0 if row is None else 1, time.perf_counter() - started)
+        return row
+
+    def fetchmany(self, size: int) -> List[Any]:
+        started: float = time.perf_counter()
+        rows: List[Any] = self.cursor.fetchmany(size)
+        self.track_fetch(len(rows), time.perf_counter() - started)
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        started: float = time.perf_counter()
+        rows: List[Any] = self.cursor.fetchall()
+        self.track_fetch(len(rows), time.perf_counter() - started)
+        return rows
+
+    def track(self, query: str, caller: str, duration: float) -> None:
+        duration_ms: float = duration * 1000
+        fingerprint: str = get_fingerprint(query)
+
+        self.record = {"fingerprint": fingerprint, "caller": caller, "duration_ms": duration_ms, "rows": 0}
+
+        queries_total.inc(caller=caller)
+        query_duration.observe(duration, caller=caller)
+
+        stats: Optional[RequestQueryStats] = request_stats.get()
+        if stats is not None:
+            stats.add(self.record)
+
+        if duration_ms >= SLOW_QUERY_THRESHOLD_MS:
+            slow_queries_total.inc(caller=caller)
+            logger.warning("Slow query (%.1f ms) in %s: %s", duration_ms, caller, fingerprint)
+
+    def track_fetch(self, count: int, duration: float) -> None:
+        if self.record is None:
+            return
+
+        duration_ms: float = duration * 1000
+        self.record["rows"] += count
+        self.record["duration_ms"] += duration_ms
+
+        if count:
+            query_rows_total.inc(count, caller=self.record["caller"])
+
+        stats: Optional[RequestQueryStats] = request_stats.get()
+        if stats is not None:
+            stats.rows_count += count
+            stats.duration_ms += duration_ms
+
+
+class InstrumentedConnection:
+    def __init__(self, connection: Any) -> None:
+        self.connection: Any = connection
+
+    def __enter__(self) -> "InstrumentedConnection":
+        self.connection.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> Any:
+        return self.connection.__exit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+    def cursor(self) -> InstrumentedCursor:
+        return InstrumentedCursor(self.connection.cursor())
@@ -0,0 +1,107 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs: List[Tuple[str, str]] = list(labels)
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped: List[str] = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " "))
+        for name, value in pairs
+    ]
+    return "{" + ",".join(escaped) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, description: str) -> None:
+        self.name: str = name
+        self.description: str = description
+        self.values: Dict[Labels, float] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key: Labels = tuple(sorted(labels.items()))
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines: List[str] = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            for labels, value in sorted(self.values.items()):
+                lines.append(f"{self.name}{format_labels(labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.name: str = name
+        self.description: str = description
+        self.buckets: Tuple[float, ...] = buckets
+        self.counts: Dict[Labels, List[int]] = {}
+        self.sums: Dict[Labels, float] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key: Labels = tuple(sorted(labels.items()))
+        index: int = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            counts: List[int] = self.counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            counts[index] += 1
+            self.sums[key] = self.sums.get(key, 0.0) + value
+
+    def render(self) -> List[str]:
+        lines: List[str] = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            for labels, counts in sorted(self.counts.items()):
+                cumulative: int = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{format_labels(labels, ('le', str(bound)))} {cumulative}")
+                cumulative += counts[-1]
+                lines.append(f"{self.name}_bucket{format_labels(labels, ('le', '+Inf'))} {cumulative}")
+                lines.append(f"{self.name}_sum{format_labels(labels)} {round(self.sums[labels], 6)}")
+                lines.append(f"{self.name}_count{format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Process-local registry of Prometheus-style metrics.
+
+    Every worker process keeps its own registry, so a scraper sees the worker that served the request.
+    """
+
+    def __init__(self) -> None:
+        self.metrics: Dict[str, object] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def counter(self, name: str, description: str) -> Counter:
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = Counter(name, description)
+            return self.metrics[name]
+
+    def histogram(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        with self.lock:
+            if name not in self.metrics:
+                self.metrics[name] = Histogram(name, description, buckets)
+            return self.metrics[name]
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self.lock:
+            metrics: List[object] = list(self.metrics.values())
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry: MetricsRegistry = MetricsRegistry()
@@ -3,13 +3,20 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple, Union
 
+from .data_versions import bump_data_versions
 from .db_connection import DatabaseConnection
-from .work_manager import WorkManager
+from .event_manager import publish_event
+from .reference_data import reference_data
+from .routing import replica_safe
+from .task_columns import GroupKey, TaskColumns, get_task_columns, to_hours, to_hundredths
+from .task_cube import TaskCube
+from .work_manager import WorkManager, order_keys, works_cache
 
 Tasks = List[Dict[str, Union[str, Decimal]]]
 Data = List[List[Union[str, Decimal]]]
 
 work_manager: WorkManager = WorkManager()
+task_cube: TaskCube = TaskCube()
 
 
 class OrderManager(DatabaseConnection):
@@ -20,7 +27,10 @@ class OrderManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (order_number.strip(), order_name.strip()))
                 order_id: int = cursor.fetchone()[0]
+                publish_event(cursor, "order_added", {"order_id": order_id, "order_number": order_number.strip()})
                 connection.commit()
+        bump_data_versions("orders")
+        reference_data.invalidate("orders")
         return order_id
 
     def order_exists(self, order_number: str, exclude_id: Optional[int] = None) -> bool:
@@ -57,37 +67,17 @@ class OrderManager(DatabaseConnection):
                 return order_numbers
 
     def get_order_number_by_name(self, order_name: str) -> Optional[str]:
-        query: str = "SELECT number FROM orders WHERE name = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (order_name.strip(),))
-
-                res: Optional[Tuple[str]] = cursor.fetchone()
-                if res:
-                    return res[0]
+        return reference_data.get_order_number_by_name(order_name)
 
     def get_order_name_by_number(self, order_number: str) -> Optional[str]:
-        query: str = "SELECT name FROM orders WHERE number = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (order_number.strip(),))
-
-                res: Optional[Tuple[str]] = cursor.fetchone()
-                if res:
-                    return res[0]
+        order: Optional[Tuple[int, str]] = reference_data.get_order(order_number)
+        if order:
+            return order[1]
 
     def get_order_id_by_number(self, order_number: str) -> Optional[int]:
-        query: str = "SELECT id FROM orders WHERE number = ?"
-
-        with self.get_connection() as connection:
-            with connection.cursor() as cursor:
-                cursor.execute(query, (order_number.strip(),))
-
-                res: Optional[Tuple[str]] = cursor.fetchone()
-                if res:
-                    return res[0]
+        order: Optional[Tuple[int, str]] = reference_data.get_order(order_number)
+        if order:
+            return order[0]
 
     def get_order_data_by_id(self, order_id: int) -> Optional[Dict[str, Union[str, int]]]:
         query: str = "SELECT id, number, name FROM orders WHERE id = ?"
@@ -109,8 +99,17 @@ class OrderManager(DatabaseConnection):
 
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
+                # Works are deleted by cascade, their events keep the change feed complete
+                cursor.execute("SELECT id FROM works WHERE order_id = ?", (order_id,))
+                for (work_id,) in cursor.fetchall():
+                    publish_event(cursor, "work_deleted", {"work_id": work_id})
+
                 cursor.execute(query, (order_id,))
+                publish_event(cursor, "order_deleted", {"order_id": order_id})
                 connection.commit()
+        bump_data_versions("orders", "works")
+        works_cache.clear()
+        reference_data.invalidate("orders")
 
     def update_order(self, order_id: int, order_number: str, order_name: str) -> None:
         query: str = "UPDATE orders SET number = ?, name = ? WHERE id = ?"
@@ -119,7 +118,11 @@ class OrderManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (order_number.strip(), order_name.strip(), order_id))
                 connection.commit()
+        bump_data_versions("orders")
+        works_cache.clear()
+        reference_data.invalidate("orders")
 
+    @replica_safe
     def get_orders(
         self,
         order_number: Optional[str] = None,
@@ -157,6 +160,7 @@ class OrderManager(DatabaseConnection):
                 orders: List[Tuple[str]] = cursor.fetchall()
                 return orders
 
+    @replica_safe
     def get_orders_count(self) -> int:
         query: str = "SELECT COUNT(*) FROM orders"
 
@@ -165,6 +169,7 @@ class OrderManager(DatabaseConnection):
                 cursor.execute(query)
                 return cursor.fetchone()[0]
 
+    @replica_safe
     def get_spent_hours_for_2025(self) -> Dict[str, Decimal]:
         query: str = "SELECT order_number, spent_hours FROM hours"
 
@@ -188,32 +193,33 @@ class OrderManager(DatabaseConnection):
                 cursor.execute(query, (order_id,))
                 return cursor.fetchone()[0]
 
+    @replica_safe
     def get_planned_hours_per_order(self, order_numbers: Tuple[str]) -> List:
         if not order_numbers:
             return []
 
-        placeholders: str = ",".join("?" for _ in order_numbers)
-
         query: str = f"""
             SELECT
                 orders.number,
                 orders.name,
                 COALESCE(SUM(works.planned_hours), 0) AS planned_hours
             FROM orders
+            INNER JOIN {order_keys.name} AS filters ON orders.number = filters.order_number
             LEFT JOIN works ON works.order_id = orders.id
-            WHERE orders.number IN ({placeholders})
             GROUP BY orders.number, orders.name
             ORDER BY orders.number
         """
 
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                cursor.execute(query, order_numbers)
+                order_keys.stage(cursor, ((order_number,) for order_number in order_numbers))
+                cursor.execute(query)
                 return cursor.fetchall()
 
+    @replica_safe
     def get_basic_orders_data(
         self,
-        tasks: Tasks,
+        tasks: Optional[Union[Tasks, TaskColumns]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         extended: bool = False,
@@ -223,9 +229,10 @@ class OrderManager(DatabaseConnection):
 
         This function calculates the total spent hours per order based on the provided tasks,
         optionally includes spent hours for the year 2025, if the specified date range requires it.
+        Without tasks, spent hours of all tasks of the date range are read from the task cube.
 
         Args:
-            tasks (Tasks): List of task records, each containing employee details,
+            tasks (Union[Tasks, TaskColumns], optional): List of task records, each containing employee details,
                 order information, and work metrics.
             start_date (datetime): The start date for selecting tasks from the database.
             end_date (datetime): The end date for selecting tasks from the database.
@@ -261,18 +268,23 @@ class OrderManager(DatabaseConnection):
                 return True
             return False
 
-        spent_hours_per_order: Dict[str, Decimal] = defaultdict(Decimal)
+        spent_hours_per_order: Dict[str, int] = defaultdict(int)
 
-        for task in tasks:
-            spent_hours_per_order[task["order_number"]] += task["hours"]
+        if tasks is None:
+            for row in task_cube.get_hours(["order_number"], start_date, end_date):
+                spent_hours_per_order[row["order_number"]] = to_hundredths(row["hours"])
+        else:
+            for (order_number,), spent_hours in get_task_columns(tasks).sum_hours(["order_number"]).items():
+                spent_hours_per_order[order_number] = spent_hours
 
         if extended and period_contains_2025(start_date, end_date):
             spent_hours_for_2025: Dict[str, Decimal] = self.get_spent_hours_for_2025()
 
             for order_number, spent_hours in spent_hours_for_2025.items():
-                spent_hours_per_order[order_number] += spent_hours
+                spent_hours_per_order[order_number] += to_hundredths(spent_hours)
 
-        orders_data: Data = []
+        # Hours of orders and totals are kept in integer hundredths and converted to Decimal on output
+        orders_hours: List[Tuple[str, str, int, int, int]] = []
 
         order_numbers: Tuple[str] = tuple(spent_hours_per_order.keys())
 
@@ -280,29 +292,32 @@ class OrderManager(DatabaseConnection):
             planned_hours_per_order: List = self.get_planned_hours_per_order(order_numbers=order_numbers)
 
             for order_number, order_name, planned_hours in planned_hours_per_order:
-                spent_hours: Decimal = spent_hours_per_order[order_number]
-                remaining_hours: Decimal = planned_hours - spent_hours
-                orders_data.append(
-                    [
-                        order_number,
-                        order_name,
-                        planned_hours,
-                        spent_hours,
-                        remaining_hours,
-                    ]
-                )
+                planned_hours: int = to_hundredths(planned_hours)
+                spent_hours: int = spent_hours_per_order[order_number]
+                orders_hours.append((order_number, order_name, planned_hours, spent_hours, planned_hours - spent_hours))
+
+        orders_data: Data = [
+            [order_number, order_name, to_hours(planned_hours), to_hours(spent_hours), to_hours(remaining_hours)]
+            for order_number, order_name, planned_hours, spent_hours, remaining_hours in orders_hours
+        ]
 
-        planned_hours, spent_hours, remaining_hours = Decimal(0), Decimal(0), Decimal(0)
+        planned_hours, spent_hours, remaining_hours = 0, 0, 0
 
-        for order_data in orders_data:
-            planned_hours += order_data[2]
-            spent_hours += order_data[3]
-            remaining_hours += order_data[4]
+        for order_hours in orders_hours:
+            planned_hours += order_hours[2]
+            spent_hours += order_hours[3]
+            remaining_hours += order_hours[4]
 
-        orders_data.append(["Итого", "", planned_hours, spent_hours, remaining_hours])
+        orders_data.append(["Итого", "", to_hours(planned_hours), to_hours(spent_hours), to_hours(remaining_hours)])
         return orders_data
 
-    def get_detailed_orders_data(self, tasks: Tasks) -> Data:
+    @replica_safe
+    def get_detailed_orders_data(
+        self,
+        tasks: Optional[Union[Tasks, TaskColumns]] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Data:
         """
         Returns order data with detailed information by types of work.
 
@@ -314,24 +329,26 @@ class OrderManager(DatabaseConnection):
         displays all associated work types with their corresponding planned, spent and remaining hours.
 
         This provides detailed view of hour distribution across different work types within each order.
+        Without tasks, spent hours of all tasks of the date range are read from the task cube.
 
         Args:
-            tasks (Tasks): List of task records, each containing employee details,
+            tasks (Union[Tasks, TaskColumns], optional): List of task records, each containing employee details,
                 order information, and work metrics.
+            start_date (datetime, optional): The start date of tasks read from the cube.
+            end_date (datetime, optional): The end date of tasks read from the cube.
 
         Returns:
             orders_data (Data): List of lists, where each inner list contains the data for one specific order,
                 including its number, name, work name, planned hours, spent hours, and remaining hours.
         """
 
-        spent_hours_per_work: Dict[str, Decimal] = defaultdict(Decimal)
-
-        for task in tasks:
-            key: Tuple[str, str] = (
-                task["order_number"],
-                task["work_name"],
-            )
-            spent_hours_per_work[key] += task["hours"]
+        if tasks is None:
+            spent_hours_per_work: Dict[GroupKey, int] = {
+                (row["order_number"], row["work_name"]): to_hundredths(row["hours"])
+                for row in task_cube.get_hours(["order_number", "work_name"], start_date, end_date)
+            }
+        else:
+            spent_hours_per_work: Dict[GroupKey, int] = get_task_columns(tasks).sum_hours(["order_number", "work_name"])
 
         order_numbers, work_names = [], []
 
@@ -348,16 +365,16 @@ class OrderManager(DatabaseConnection):
             )
 
             for order_number, order_name, work_name, planned_hours in planned_hours_per_work:
-                spent_hours: Decimal = spent_hours_per_work[(order_number, work_name)]
-                remaining_hours: Decimal = planned_hours - spent_hours
+                spent_hours: int = spent_hours_per_work.get((order_number, work_name), 0)
+                remaining_hours: int = to_hundredths(planned_hours) - spent_hours
                 orders_data.append(
                     [
                         order_number,
                         order_name,
                         work_name,
                         planned_hours,
-                        spent_hours,
-                        remaining_hours,
+                        to_hours(spent_hours),
+                        to_hours(remaining_hours),
                     ]
                 )
             return orders_data
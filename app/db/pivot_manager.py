@@ -0,0 +1,271 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+from decouple import config
+
+from .archive_manager import get_table_source
+from .cache import TTLCache
+from .data_versions import data_versions
+from .db_connection import DatabaseConnection
+from .routing import replica_safe
+from .task_cube import CUBE_DIMENSIONS, TaskCube, get_month_start
+from .task_manager import TaskManager
+from .work_hours import PENDING_HOURS_JOIN, REMAINING_HOURS_COLUMN
+from .work_manager import order_keys
+
+PIVOT_CACHE_TTL: float = config("PIVOT_CACHE_TTL", default=60, cast=float)
+PIVOT_FETCH_SIZE: int = config("PIVOT_FETCH_SIZE", default=1000, cast=int)
+# Tables whose versions label cached pivots, the same ones the pivot view is tagged with
+PIVOT_CACHE_TABLES: Tuple[str, ...] = ("tasks", "works")
+
+# Result columns of every dimension; works are identified by order number and work name
+PIVOT_DIMENSIONS: Dict[str, Tuple[str, ...]] = {
+    "employee": ("personnel_number", "employee_name"),
+    "department": ("department",),
+    "category": ("employee_category",),
+    "order": ("order_number",),
+    "work": ("order_number", "work_name"),
+    "date": ("operation_date",),
+    "week": ("week",),
+    "month": ("month",),
+}
+PIVOT_MEASURES: Tuple[str, ...] = ("hours", "planned", "remaining")
+# Planned and remaining hours are properties of works, so they are defined only for groups of works
+WORK_DIMENSIONS: Tuple[str, ...] = ("order", "work")
+DATE_COLUMNS: Tuple[str, ...] = ("operation_date", "week", "month")
+# Date columns computed here from operation dates, so several rows of the grouped query make one group
+ROLLED_UP_COLUMNS: Tuple[str, ...] = ("week", "month")
+
+PivotRow = Tuple[Any, ...]
+Filters = Dict[str, Union[str, List[str], None]]
+
+pivot_cache: TTLCache = TTLCache(ttl=PIVOT_CACHE_TTL, max_size=256)
+task_cube: TaskCube = TaskCube()
+task_manager: TaskManager = TaskManager()
+
+
+def get_pivot_columns(dimensions: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(column for dimension in dimensions for column in PIVOT_DIMENSIONS[dimension]))
+
+
+def get_week_start(value: Union[str, date]) -> date:
+    if isinstance(value, str):
+        value = datetime.strptime(value[:10], "%Y-%m-%d").date()
+    return value - timedelta(days=value.weekday())
+
+
+def get_date_value(column: str, value: Union[str, date]) -> Union[str, date]:
+    if column == "week":
+        return get_week_start(value)
+    if column == "month":
+        return get_month_start(value)
+    return value
+
+
+class PivotManager(DatabaseConnection):
+    """
+    Aggregates of tasks hours grouped by arbitrary dimensions, for BI tools.
+
+    Queries grouping only by cube dimensions (department, category, order, work and month) are answered
+    from `task_cube`, other queries are grouped by the database over `tasks`.
+    Results are cached for `PIVOT_CACHE_TTL` seconds under versions of `PIVOT_CACHE_TABLES`, so they are
+    recomputed as soon as tasks or works change in any worker process.
+    """
+
+    @replica_safe
+    def get_pivot(
+        self,
+        dimensions: Sequence[str],
+        measures: Sequence[str],
+        filters: Filters,
+        limit: int,
+    ) -> Tuple[List[str], List[PivotRow], bool]:
+        """
+        Returns tasks hours grouped by the dimensions.
+
+        Args:
+            dimensions (Sequence[str]): Keys of `PIVOT_DIMENSIONS`.
+            measures (Sequence[str]): Items of `PIVOT_MEASURES`. `planned` and `remaining` require
+                grouping by order or work only.
+            filters (Filters): Filters accepted by `TaskManager.build_tasks_filters`.
+            limit (int): Maximum number of rows.
+
+        Returns:
+            columns (List[str]): Dimension columns followed by measures.
+            rows (List[PivotRow]): Rows sorted by dimension columns.
+            truncated (bool): Whether rows beyond the limit were dropped.
+
+        Raises:
+            ValueError: If a dimension or a measure is unknown, a date filter is malformed, or work measures
+                are requested for groups other than orders and works.
+        """
+
+        dimensions = list(dict.fromkeys(dimensions))
+        measures = list(dict.fromkeys(measures))
+
+        if any(dimension not in PIVOT_DIMENSIONS for dimension in dimensions):
+            raise ValueError("Unknown pivot dimension")
+        if not measures or any(measure not in PIVOT_MEASURES for measure in measures):
+            raise ValueError("Unknown pivot measure")
+        if set(measures) - {"hours"} and (not dimensions or set(dimensions) - set(WORK_DIMENSIONS)):
+            raise ValueError("Work measures require grouping by order or work")
+        for name in ("start_date", "end_date"):
+            if filters.get(name):
+                datetime.strptime(filters[name], "%Y-%m-%d")
+
+        cache_key: Hashable = (
+            tuple(dimensions),
+            tuple(measures),
+            tuple(
+                sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items())
+            ),
+            limit,
+        )
+        version: Tuple[int, ...] = tuple(data_versions.get_read_versions(PIVOT_CACHE_TABLES).values())
+        result: Optional[Tuple[List[str], List[PivotRow], bool]] = pivot_cache.get(cache_key, version)
+        if result is not None:
+            return result
+
+        group_columns: List[str] = get_pivot_columns(dimensions)
+
+        if self.is_cube_query(group_columns, filters):
+            hours_per_group: Dict[PivotRow, Decimal] = self.get_cube_hours(group_columns, filters)
+        else:
+            hours_per_group: Dict[PivotRow, Decimal] = self.get_tasks_hours(group_columns, filters, limit)
+
+        groups: List[PivotRow] = sorted(hours_per_group)
+        truncated: bool = len(groups) > limit
+        groups = groups[:limit]
+
+        work_hours: Dict[PivotRow, Tuple[Decimal, Decimal]] = {}
+        if set(measures) - {"hours"}:
+            work_hours = self.get_work_hours(group_columns, groups)
+
+        rows: List[PivotRow] = []
+        for group in groups:
+            planned_hours, remaining_hours = work_hours.get(group, (Decimal(0), Decimal(0)))
+            values: Dict[str, Decimal] = {
+                "hours": hours_per_group[group],
+                "planned": planned_hours,
+                "remaining": remaining_hours,
+            }
+            rows.append(group + tuple(values[measure] for measure in measures))
+
+        result = (group_columns + measures, rows, truncated)
+        pivot_cache.set(cache_key, result, version)
+        return result
+
+    def is_cube_query(self, group_columns: List[str], filters: Filters) -> bool:
+        if not set(group_columns) <= set(CUBE_DIMENSIONS):
+            return False
+        if filters.get("employee_data") or filters.get("order_name"):
+            return False
+
+        return True
+
+    def get_cube_hours(self, group_columns: List[str], filters: Filters) -> Dict[PivotRow, Decimal]:
+        cube_rows: List[Dict[str, Any]] = task_cube.get_hours(
+            group_by=group_columns,
+            start_date=filters.get("start_date"),
+            end_date=filters.get("end_date"),
+            departments=filters.get("departments"),
+            order_numbers=[filters["order_number"]] if filters.get("order_number") else None,
+            work_names=[filters["work_name"]] if filters.get("work_name") else None,
+        )
+        return {tuple(row[column] for column in group_columns): row["hours"] for row in cube_rows}
+
+    def get_tasks_hours(self, group_columns: List[str], filters: Filters, limit: int) -> Dict[PivotRow, Decimal]:
+        """
+        Groups tasks in the database. Weeks and months are rolled up here from dates,
+        so the query does not depend on date functions of the database dialect.
+
+        Groups are ordered by the database and at most `limit` + 1 of them are read, so that the caller
+        can tell whether the result is truncated. Without weeks and months the database returns just
+        these rows with OFFSET/FETCH. Rolled-up groups span several rows of days: rows are read in order
+        until more than `limit` groups are complete, that is until the values of the columns up to the
+        last rolled-up one change.
+        """
+
+        query_columns: List[str] = list(
+            dict.fromkeys("operation_date" if column in DATE_COLUMNS else column for column in group_columns)
+        )
+        conditions, params = task_manager.build_tasks_filters(**filters)
+
+        source: str = get_table_source("tasks", filters.get("start_date"))
+        query: str = f"SELECT {', '.join(query_columns + ['SUM(hours)'])} FROM {source}{conditions}"
+        if query_columns:
+            query += f" GROUP BY {', '.join(query_columns)} ORDER BY {', '.join(query_columns)}"
+
+        rolled_up: List[int] = [index for index, column in enumerate(group_columns) if column in ROLLED_UP_COLUMNS]
+        if query_columns and not rolled_up:
+            query += " OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
+            params = [*params, 0, limit + 1]
+        block_size: int = max(rolled_up, default=-1) + 1
+
+        hours_per_group: Dict[PivotRow, Decimal] = defaultdict(Decimal)
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                task_manager.stage_tasks_filters(cursor, filters.get("departments"))
+                cursor.execute(query, tuple(params))
+
+                block: Optional[PivotRow] = None
+                while True:
+                    rows: List[Tuple[Any, ...]] = cursor.fetchmany(PIVOT_FETCH_SIZE)
+                    if not rows:
+                        break
+
+                    for row in rows:
+                        values: Dict[str, Any] = dict(zip(query_columns, row))
+                        group: PivotRow = tuple(
+                            (
+                                get_date_value(column, values["operation_date"])
+                                if column in DATE_COLUMNS
+                                else values[column]
+                            )
+                            for column in group_columns
+                        )
+                        if rolled_up and group[:block_size] != block:
+                            if len(hours_per_group) > limit:
+                                return hours_per_group
+                            block = group[:block_size]
+                        if row[-1] is not None:
+                            hours_per_group[group] += Decimal(row[-1])
+        return hours_per_group
+
+    def get_work_hours(
+        self, group_columns: List[str], groups: List[PivotRow]
+    ) -> Dict[PivotRow, Tuple[Decimal, Decimal]]:
+        """
+        Returns planned and remaining hours of works of orders in the groups, summed per group.
+        """
+
+        order_numbers: List[str] = list({group[group_columns.index("order_number")] for group in groups})
+        if not order_numbers:
+            return {}
+
+        query: str = f"""
+            SELECT orders.number, works.name, works.planned_hours, {REMAINING_HOURS_COLUMN}
+            FROM works
+            JOIN orders ON works.order_id = orders.id
+            INNER JOIN {order_keys.name} AS filters ON orders.number = filters.order_number
+            {PENDING_HOURS_JOIN}
+        """
+
+        work_hours: Dict[PivotRow, List[Decimal]] = defaultdict(lambda: [Decimal(0), Decimal(0)])
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                order_keys.stage(cursor, ((order_number,) for order_number in order_numbers))
+                cursor.execute(query)
+
+                for order_number, work_name, planned_hours, remaining_hours in cursor.fetchall():
+                    values: Dict[str, str] = {"order_number": order_number, "work_name": work_name}
+                    hours: List[Decimal] = work_hours[tuple(values[column] for column in group_columns)]
+                    hours[0] += planned_hours
+                    hours[1] += remaining_hours
+        return {
+            group: (planned_hours, remaining_hours) for group, (planned_hours, remaining_hours) in work_hours.items()
+        }
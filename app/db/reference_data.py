@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from decouple import config
+
+from .data_versions import DataVersionManager
+from .db_connection import DatabaseConnection
+
+REFERENCE_DATA_CHECK_INTERVAL: float = config("REFERENCE_DATA_CHECK_INTERVAL", default=10, cast=float)
+REFERENCE_DATA_MAX_AGE: float = config("REFERENCE_DATA_MAX_AGE", default=600, cast=float)
+
+# Personnel number -> (name, department, category)
+EmployeesMap = Dict[str, Tuple[str, str, str]]
+# Order number -> (id, name)
+OrdersMap = Dict[str, Tuple[int, str]]
+
+
+def get_lookup_key(value: str) -> str:
+    # Approximates comparison of the default case-insensitive SQL Server collation
+    return value.strip().casefold()
+
+
+def load_departments(cursor: Any) -> List[str]:
+    cursor.execute("SELECT name FROM departments")
+    return list(dict.fromkeys(row[0] for row in cursor.fetchall()))
+
+
+def load_employees(cursor: Any) -> Tuple[EmployeesMap, Dict[str, str]]:
+    cursor.execute("SELECT personnel_number, name, department, category FROM employees ORDER BY id")
+
+    employees: EmployeesMap = {}
+    numbers_by_name: Dict[str, str] = {}
+    for personnel_number, name, department, category in cursor.fetchall():
+        employees.setdefault(get_lookup_key(personnel_number), (name, department, category))
+        numbers_by_name.setdefault(get_lookup_key(name), personnel_number)
+    return employees, numbers_by_name
+
+
+def load_orders(cursor: Any) -> Tuple[OrdersMap, Dict[str, str]]:
+    cursor.execute("SELECT id, number, name FROM orders ORDER BY id")
+
+    orders: OrdersMap = {}
+    numbers_by_name: Dict[str, str] = {}
+    for order_id, number, name in cursor.fetchall():
+        orders.setdefault(get_lookup_key(number), (order_id, name))
+        numbers_by_name.setdefault(get_lookup_key(name), number)
+    return orders, numbers_by_name
+
+
+LOADERS: Dict[str, Callable[[Any], Any]] = {
+    "departments": load_departments,
+    "employees": load_employees,
+    "orders": load_orders,
+}
+
+
+class ReferenceData(DatabaseConnection):
+    """
+    Process-local copy of small tables used by lookups on hot paths: departments, employees
+    by personnel number and orders by number and name.
+
+    A table is loaded entirely on first use and then served from memory. Managers invalidate
+    the copy after their writes, and after commit bump the table's counter in `data_versions`, which
+    is checked at most every `REFERENCE_DATA_CHECK_INTERVAL` seconds, so changes made by other worker processes
+    are picked up within that period. Tables changed outside the application are reloaded
+    after `REFERENCE_DATA_MAX_AGE` seconds.
+    """
+
+    def __init__(self) -> None:
+        self.data_versions: DataVersionManager = DataVersionManager()
+        self.lock: threading.Lock = threading.Lock()
+        self.tables: Dict[str, Tuple[int, float, Any]] = {}
+        self.checked_at: float = 0.0
+
+    def get(self, table_name: str) -> Any:
+        self.check_versions()
+
+        entry: Optional[Tuple[int, float, Any]] = self.tables.get(table_name)
+        if entry is not None and time.monotonic() - entry[1] < REFERENCE_DATA_MAX_AGE:
+            return entry[2]
+
+        version: int = self.data_versions.get_data_versions([table_name])[table_name]
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                data: Any = LOADERS[table_name](cursor)
+
+        with self.lock:
+            self.tables[table_name] = (version, time.monotonic(), data)
+        return data
+
+    def check_versions(self) -> None:
+        if time.monotonic() - self.checked_at < REFERENCE_DATA_CHECK_INTERVAL or not self.tables:
+            return
+        self.checked_at = time.monotonic()
+
+        versions: Dict[str, int] = self.data_versions.get_data_versions(LOADERS)
+        with self.lock:
+            for table_name, (version, _, _) in list(self.tables.items()):
+                if versions[table_name] != version:
+                    del self.tables[table_name]
+
+    def invalidate(self, table_name: str) -> None:
+        with self.lock:
+            self.tables.pop(table_name, None)
+
+    def get_departments(self) -> List[str]:
+        return list(self.get("departments"))
+
+    def get_employee(self, personnel_number: str) -> Optional[Tuple[str, str, str]]:
+        employees, _ = self.get("employees")
+        return employees.get(get_lookup_key(personnel_number))
+
+    def get_personnel_number_by_name(self, employee_name: str) -> Optional[str]:
+        _, numbers_by_name = self.get("employees")
+        return numbers_by_name.get(get_lookup_key(employee_name))
+
+    def get_order(self, order_number: str) -> Optional[Tuple[int, str]]:
+        orders, _ = self.get("orders")
+        return orders.get(get_lookup_key(order_number))
+
+    def get_order_number_by_name(self, order_name: str) -> Optional[str]:
+        _, numbers_by_name = self.get("orders")
+        return numbers_by_name.get(get_lookup_key(order_name))
+
+
+reference_data: ReferenceData = ReferenceData()
@@ -0,0 +1,40 @@
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from decouple import config
+
+DB_READ_ROUTING: bool = config("DB_READ_ROUTING", default=False, cast=bool)
+
+replica_scope: ContextVar[bool] = ContextVar("replica_scope", default=False)
+primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+
+def replica_safe(method: Callable) -> Callable:
+    """
+    Marks a manager read method which tolerates slightly stale data, so that its queries may be served
+    by the read-only connection target (see `app.db.backends.connect`).
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = replica_scope.set(True)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            replica_scope.reset(token)
+
+    return wrapper
+
+
+def pin_to_primary(pinned: bool = True) -> None:
+    """
+    Routes all reads of the current request (context) to the primary database, so that they see
+    the request's own writes.
+    """
+
+    primary_pinned.set(pinned)
+
+
+def use_read_only_target() -> bool:
+    return DB_READ_ROUTING and replica_scope.get() and not primary_pinned.get()
@@ -89,3 +89,124 @@ CREATE TABLE logs (
     created_date DATE NOT NULL DEFAULT CAST(GETDATE() AS DATE),
     created_time TIME(0) NOT NULL DEFAULT CAST(GETDATE() AS TIME)
 );
+
+IF OBJECT_ID('settings', 'U') IS NULL
+CREATE TABLE settings (
+    name NVARCHAR(100) PRIMARY KEY,
+    value NVARCHAR(255) NOT NULL,
+    updated_at DATETIME NOT NULL DEFAULT GETDATE()
+);
+
+IF OBJECT_ID('events', 'U') IS NULL
+CREATE TABLE events (
+    id INT IDENTITY(1,1) PRIMARY KEY,
+    event_type NVARCHAR(50) NOT NULL,
+    payload NVARCHAR(MAX) NOT NULL
+);
+
+IF OBJECT_ID('change_feed_consumers', 'U') IS NULL
+CREATE TABLE change_feed_consumers (
+    name NVARCHAR(100) PRIMARY KEY,
+    last_event_id INT NOT NULL DEFAULT 0
+);
+
+IF OBJECT_ID('event_gaps', 'U') IS NULL
+CREATE TABLE event_gaps (
+    event_id INT PRIMARY KEY,
+    seen_at INT NOT NULL
+);
+
+IF OBJECT_ID('task_submissions', 'U') IS NULL
+CREATE TABLE task_submissions (
+    idempotency_key NVARCHAR(64) PRIMARY KEY,
+    tasks_count INT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT GETDATE()
+);
+
+IF OBJECT_ID('work_hours_deltas', 'U') IS NULL
+CREATE TABLE work_hours_deltas (
+    id INT IDENTITY(1,1) PRIMARY KEY,
+    work_id INT NOT NULL,
+    hours DECIMAL(10,2) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT GETDATE(),
+    FOREIGN KEY (work_id) REFERENCES works(id) ON DELETE CASCADE
+);
+
+IF OBJECT_ID('data_versions', 'U') IS NULL
+CREATE TABLE data_versions (
+    table_name NVARCHAR(100) PRIMARY KEY,
+    version INT NOT NULL DEFAULT 0
+);
+
+INSERT INTO data_versions (table_name)
+SELECT seeded.table_name
+FROM (
+    VALUES ('departments'), ('employees'), ('hours'), ('logs'), ('orders'), ('tasks'), ('users'), ('works')
+) AS seeded (table_name)
+WHERE NOT EXISTS (SELECT 1 FROM data_versions WHERE data_versions.table_name = seeded.table_name);
+
+IF OBJECT_ID('task_cube', 'U') IS NULL
+CREATE TABLE task_cube (
+    id INT IDENTITY(1,1) PRIMARY KEY,
+    month DATE NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    employee_category NVARCHAR(100) NOT NULL,
+    order_number NVARCHAR(255) NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    hours DECIMAL(12,2) NOT NULL DEFAULT 0,
+    tasks_count INT NOT NULL DEFAULT 0
+);
+
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'task_cube_cells')
+BEGIN
+    -- Cells duplicated by concurrent inserts before the cube key was unique are merged into their first row
+    UPDATE task_cube
+    SET hours = cells.hours, tasks_count = cells.tasks_count
+    FROM task_cube
+    JOIN (
+        SELECT MIN(id) AS id, SUM(hours) AS hours, SUM(tasks_count) AS tasks_count
+        FROM task_cube
+        GROUP BY month, department, employee_category, order_number, work_name
+        HAVING COUNT(*) > 1
+    ) AS cells ON cells.id = task_cube.id;
+
+    DELETE FROM task_cube
+    WHERE id NOT IN (
+        SELECT MIN(id) FROM task_cube GROUP BY month, department, employee_category, order_number, work_name
+    );
+
+    IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'task_cube_keys')
+    DROP INDEX task_cube_keys ON task_cube;
+
+    CREATE UNIQUE INDEX task_cube_cells ON task_cube (month, order_number, department, employee_category, work_name);
+END
+
+IF OBJECT_ID('tasks_archive', 'U') IS NULL
+CREATE TABLE tasks_archive (
+    id INT PRIMARY KEY,
+    employee_name NVARCHAR(255) NOT NULL,
+    personnel_number NVARCHAR(100) NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    hours DECIMAL(10,2) NOT NULL DEFAULT 0,
+    order_number NVARCHAR(255) NOT NULL,
+    order_name NVARCHAR(450) NOT NULL,
+    operation_date DATE NOT NULL,
+    employee_category NVARCHAR(100) NOT NULL
+);
+
+IF OBJECT_ID('logs_archive', 'U') IS NULL
+CREATE TABLE logs_archive (
+    id INT PRIMARY KEY,
+    action NVARCHAR(50) NOT NULL,
+    entity_id INT NOT NULL,
+    entity_type NVARCHAR(50) NOT NULL,
+    user_name NVARCHAR(100) NOT NULL,
+    ip_address NVARCHAR(50) NOT NULL,
+    platform NVARCHAR(50) NOT NULL,
+    os_version NVARCHAR(50) NOT NULL,
+    browser NVARCHAR(50) NOT NULL,
+    browser_version NVARCHAR(50) NOT NULL,
+    created_date DATE NOT NULL,
+    created_time TIME(0) NOT NULL
+);
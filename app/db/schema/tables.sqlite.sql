@@ -0,0 +1,170 @@
+CREATE TABLE IF NOT EXISTS departments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name NVARCHAR(100) NOT NULL,
+    is_production BIT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name NVARCHAR(255) NOT NULL,
+    personnel_number NVARCHAR(100) UNIQUE NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    category NVARCHAR(100) NOT NULL,
+    CONSTRAINT check_employee_category
+        CHECK (category IN ('worker', 'specialist', 'manager'))
+);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name NVARCHAR(450) NOT NULL,
+    number NVARCHAR(255) UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS works (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INT NOT NULL,
+    name NVARCHAR(450) NOT NULL,
+    planned_hours DECIMAL(10,2) NOT NULL,
+    spent_hours DECIMAL(10,2) NOT NULL DEFAULT 0,
+    remaining_hours DECIMAL(10,2) GENERATED ALWAYS AS (planned_hours - spent_hours) VIRTUAL,
+    FOREIGN KEY (order_id) REFERENCES orders(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS hours (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_name NVARCHAR(450) NOT NULL,
+    order_number NVARCHAR(255) UNIQUE NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    spent_hours DECIMAL(10,2) NOT NULL DEFAULT 0,
+    created_date DATE NOT NULL DEFAULT CURRENT_DATE,
+    created_time TIME NOT NULL DEFAULT CURRENT_TIME
+);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    employee_name NVARCHAR(255) NOT NULL,
+    personnel_number NVARCHAR(100) NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    hours DECIMAL(10,2) NOT NULL DEFAULT 0,
+    order_number NVARCHAR(255) NOT NULL,
+    order_name NVARCHAR(450) NOT NULL,
+    operation_date DATE NOT NULL DEFAULT CURRENT_DATE,
+    employee_category NVARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name NVARCHAR(255) NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    login NVARCHAR(100) UNIQUE NOT NULL,
+    password_hash NVARCHAR(255),
+    permissions_level NVARCHAR(100) NOT NULL DEFAULT 'standard',
+    is_account_enabled BIT NOT NULL DEFAULT 0,
+    is_factory_worker BIT NOT NULL DEFAULT 0,
+    is_admin BIT NOT NULL DEFAULT 0,
+    CONSTRAINT check_permissions_level
+        CHECK (permissions_level IN ('minimal', 'standard', 'advanced'))
+);
+
+CREATE TABLE IF NOT EXISTS logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    action NVARCHAR(50) NOT NULL,
+    entity_id INT NOT NULL,
+    entity_type NVARCHAR(50) NOT NULL,
+    user_name NVARCHAR(100) NOT NULL,
+    ip_address NVARCHAR(50) NOT NULL,
+    platform NVARCHAR(50) NOT NULL,
+    os_version NVARCHAR(50) NOT NULL,
+    browser NVARCHAR(50) NOT NULL,
+    browser_version NVARCHAR(50) NOT NULL,
+    created_date DATE NOT NULL DEFAULT CURRENT_DATE,
+    created_time TIME NOT NULL DEFAULT CURRENT_TIME
+);
+
+CREATE TABLE IF NOT EXISTS settings (
+    name NVARCHAR(100) PRIMARY KEY,
+    value NVARCHAR(255) NOT NULL,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_type NVARCHAR(50) NOT NULL,
+    payload NVARCHAR(4000) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS change_feed_consumers (
+    name NVARCHAR(100) PRIMARY KEY,
+    last_event_id INT NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS event_gaps (
+    event_id INT PRIMARY KEY,
+    seen_at INT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS task_submissions (
+    idempotency_key NVARCHAR(64) PRIMARY KEY,
+    tasks_count INT NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS work_hours_deltas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    work_id INT NOT NULL,
+    hours DECIMAL(10,2) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (work_id) REFERENCES works(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name NVARCHAR(100) PRIMARY KEY,
+    version INT NOT NULL DEFAULT 0
+);
+
+INSERT OR IGNORE INTO data_versions (table_name)
+VALUES ('departments'), ('employees'), ('hours'), ('logs'), ('orders'), ('tasks'), ('users'), ('works');
+
+CREATE TABLE IF NOT EXISTS task_cube (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    month DATE NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    employee_category NVARCHAR(100) NOT NULL,
+    order_number NVARCHAR(255) NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    hours DECIMAL(12,2) NOT NULL DEFAULT 0,
+    tasks_count INT NOT NULL DEFAULT 0
+);
+
+DROP INDEX IF EXISTS task_cube_keys;
+CREATE UNIQUE INDEX IF NOT EXISTS task_cube_cells
+ON task_cube (month, order_number, department, employee_category, work_name);
+
+CREATE TABLE IF NOT EXISTS tasks_archive (
+    id INTEGER PRIMARY KEY,
+    employee_name NVARCHAR(255) NOT NULL,
+    personnel_number NVARCHAR(100) NOT NULL,
+    department NVARCHAR(100) NOT NULL,
+    work_name NVARCHAR(450) NOT NULL,
+    hours DECIMAL(10,2) NOT NULL DEFAULT 0,
+    order_number NVARCHAR(255) NOT NULL,
+    order_name NVARCHAR(450) NOT NULL,
+    operation_date DATE NOT NULL,
+    employee_category NVARCHAR(100) NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS logs_archive (
+    id INTEGER PRIMARY KEY,
+    action NVARCHAR(50) NOT NULL,
+    entity_id INT NOT NULL,
+    entity_type NVARCHAR(50) NOT NULL,
+    user_name NVARCHAR(100) NOT NULL,
+    ip_address NVARCHAR(50) NOT NULL,
+    platform NVARCHAR(50) NOT NULL,
+    os_version NVARCHAR(50) NOT NULL,
+    browser NVARCHAR(50) NOT NULL,
+    browser_version NVARCHAR(50) NOT NULL,
+    created_date DATE NOT NULL,
+    created_time TIME NOT NULL
+);
@@ -0,0 +1,54 @@
+from typing import Optional, Tuple
+
+from decouple import config
+
+from .cache import TTLCache
+from .db_connection import DatabaseConnection
+
+SETTINGS_CACHE_TTL: float = config("SETTINGS_CACHE_TTL", default=3, cast=float)
+
+settings_cache: TTLCache = TTLCache(ttl=SETTINGS_CACHE_TTL)
+
+
+class SettingManager(DatabaseConnection):
+    """
+    Application settings shared by all worker processes.
+
+    Values are cached for `SETTINGS_CACHE_TTL` seconds, so reading a setting on every request
+    costs one query per worker in that period, and a change made by one worker reaches the others
+    within the same period.
+    """
+
+    def get_setting(self, name: str, default: str = "") -> str:
+        value: Optional[str] = settings_cache.get(name)
+        if value is not None:
+            return value
+
+        query: str = "SELECT value FROM settings WHERE name = ?"
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(query, (name,))
+                record: Optional[Tuple[str]] = cursor.fetchone()
+
+        value = default if record is None else record[0]
+        settings_cache.set(name, value)
+        return value
+
+    def set_setting(self, name: str, value: str) -> None:
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                query: str = "UPDATE settings SET value = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?"
+                cursor.execute(query, (value, name))
+
+                if cursor.rowcount == 0:
+                    query: str = "INSERT INTO settings (name, value) VALUES (?, ?)"
+                    cursor.execute(query, (name, value))
+            connection.commit()
+        settings_cache.invalidate(name)
+
+    def is_maintenance_enabled(self) -> bool:
+        return self.get_setting("maintenance_mode", default="0") == "1"
+
+    def set_maintenance_enabled(self, enabled: bool) -> None:
+        self.set_setting("maintenance_mode", "1" if enabled else "0")
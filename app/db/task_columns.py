@@ -0,0 +1,154 @@
+from decimal import Decimal
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy
+
+# numpy and pandas are imported inside methods: they are needed only for reports,
+# and importing them at module load slows down startup of every worker process.
+
+Task = Dict[str, Union[str, Decimal]]
+Tasks = List[Task]
+GroupKey = Tuple[Any, ...]
+
+
+def to_hundredths(hours: Union[Decimal, float]) -> int:
+    return int((Decimal(hours) * 100).to_integral_value())
+
+
+# Sums of report rows repeat a lot (hours of an employee per day), and Decimals are immutable
+@lru_cache(maxsize=65536)
+def to_hours(hundredths: int) -> Decimal:
+    return Decimal(hundredths).scaleb(-2)
+
+
+class TaskColumns(Sequence):
+    """
+    Tasks of a report with compact columnar views for aggregation.
+
+    Hours are held as integer hundredths in one int64 buffer, and key columns as interned integer ids
+    numbered in sorted order of their values. Views are built on first use and shared by all aggregations
+    of the same tasks, sums are computed by NumPy over the integer buffers, and results are converted
+    to Decimal only for output rows (see `to_hours`). Iterating and indexing give the original task dicts,
+    so the object can be passed wherever tasks are expected.
+
+    Args:
+        tasks (Tasks): List of task records.
+    """
+
+    def __init__(self, tasks: Tasks) -> None:
+        self.tasks: Tasks = tasks
+        self.hundredths: Optional["numpy.ndarray"] = None
+        self.codes: Dict[str, Tuple["numpy.ndarray", "numpy.ndarray"]] = {}
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self.tasks[index]
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self.tasks)
+
+    def get_hundredths(self) -> "numpy.ndarray":
+        import numpy
+
+        if self.hundredths is None:
+            # Tasks have few distinct hours, so each of them is converted to hundredths exactly once
+            hundredths: Dict[Decimal, int] = {}
+            self.hundredths = numpy.fromiter(
+                [
+                    hundredths[hours] if hours in hundredths else hundredths.setdefault(hours, to_hundredths(hours))
+                    for hours in map(itemgetter("hours"), self.tasks)
+                ],
+                numpy.int64,
+                len(self.tasks),
+            )
+        return self.hundredths
+
+    def get_codes(self, column: str) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        """
+        Returns ids of the column values of tasks, numbered in sorted order of the values, and the values.
+        """
+
+        import numpy
+        import pandas
+
+        if column not in self.codes:
+            values: numpy.ndarray = numpy.array(list(map(itemgetter(column), self.tasks)), dtype=object)
+            codes, uniques = pandas.factorize(values, sort=True)
+            self.codes[column] = (codes.astype(numpy.int64), numpy.asarray(uniques, dtype=object))
+        return self.codes[column]
+
+    def get_group_codes(self, columns: Sequence[str], sort: bool = False) -> Tuple["numpy.ndarray", List[List[Any]]]:
+        """
+        Returns ids of groups of tasks with equal values of the columns, and the groups' values.
+
+        Ids of the columns are combined into one integer key per task, so grouping is done by hashing integers.
+
+        Args:
+            columns (Sequence[str]): Grouping columns.
+            sort (bool): Number groups in sorted order of their values instead of the order
+                of their first tasks.
+
+        Returns:
+            group_codes (numpy.ndarray): Group id of every task.
+            group_columns (List[List[Any]]): Values of every column for the groups, in order of the group ids.
+        """
+
+        import numpy
+        import pandas
+
+        if not self.tasks:
+            return numpy.zeros(0, dtype=numpy.int64), [[] for _ in columns]
+
+        keys: numpy.ndarray = numpy.zeros(len(self.tasks), dtype=numpy.int64)
+        keys_count: int = 1
+        for column in columns:
+            codes, values = self.get_codes(column)
+            if keys_count * len(values) >= 2**62:
+                # Combined keys are renumbered densely before they could overflow int64
+                keys, uniques = pandas.factorize(keys)
+                keys_count = len(uniques)
+            keys = keys * len(values) + codes
+            keys_count *= len(values)
+
+        group_codes, group_keys = pandas.factorize(keys, sort=sort)
+        # Index of the first task of every group, from which values of the group's columns are taken
+        first_tasks: numpy.ndarray = numpy.empty(len(group_keys), dtype=numpy.int64)
+        first_tasks[group_codes[::-1]] = numpy.arange(len(keys) - 1, -1, -1)
+
+        group_columns: List[List[Any]] = []
+        for column in columns:
+            codes, values = self.get_codes(column)
+            group_columns.append(values[codes[first_tasks]].tolist())
+        return group_codes.astype(numpy.int64), group_columns
+
+    def group_hours(self, columns: Sequence[str], sort: bool = False) -> Tuple[List[List[Any]], List[int]]:
+        """
+        Returns values of the columns for groups of tasks, as `get_group_codes`, and hours of every group
+        in hundredths. Rows of a report can be zipped from the lists without building a key per group.
+        """
+
+        import numpy
+
+        group_codes, group_columns = self.get_group_codes(columns, sort=sort)
+        # Weights are summed as float64, which is exact for integer sums below 2 ** 53
+        sums: numpy.ndarray = numpy.bincount(
+            group_codes, weights=self.get_hundredths(), minlength=len(group_columns[0])
+        )
+        return group_columns, numpy.rint(sums).astype(numpy.int64).tolist()
+
+    def sum_hours(self, columns: Sequence[str], sort: bool = False) -> Dict[GroupKey, int]:
+        """
+        Returns hours of tasks in hundredths per group of equal values of the columns, keyed by the values.
+        """
+
+        group_columns, hours = self.group_hours(columns, sort=sort)
+        return dict(zip(zip(*group_columns), hours))
+
+
+def get_task_columns(tasks: Union[Tasks, TaskColumns]) -> TaskColumns:
+    return tasks if isinstance(tasks, TaskColumns) else TaskColumns(tasks)
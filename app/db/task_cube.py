@@ -0,0 +1,328 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from decouple import config
+
+from .archive_manager import get_table_source
+from .backends import is_duplicate_key_error
+from .db_connection import DatabaseConnection
+from .routing import replica_safe
+from .setting_manager import SettingManager
+
+TASK_CUBE_REFRESH: str = config("TASK_CUBE_REFRESH", default="incremental")
+
+CUBE_DIMENSIONS: Tuple[str, ...] = ("month", "department", "employee_category", "order_number", "work_name")
+# Month, department, employee category, order number and work name
+CubeKey = Tuple[date, str, str, str, str]
+CubeRow = Dict[str, Union[str, date, int, Decimal]]
+
+BUILT_UNTIL_SETTING: str = "task_cube_built_until"
+
+UPDATE_CELL_QUERY: str = """
+    UPDATE task_cube
+    SET hours = hours + ?, tasks_count = tasks_count + ?
+    WHERE month = ? AND department = ? AND employee_category = ? AND order_number = ? AND work_name = ?
+"""
+INSERT_CELL_QUERY: str = """
+    INSERT INTO task_cube (month, department, employee_category, order_number, work_name, hours, tasks_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+setting_manager: SettingManager = SettingManager()
+
+
+def get_date(value: Union[str, date, datetime]) -> date:
+    if isinstance(value, str):
+        value = datetime.strptime(value[:10], "%Y-%m-%d")
+    return value.date() if isinstance(value, datetime) else value
+
+
+def get_month_start(value: Union[str, date, datetime]) -> date:
+    value = get_date(value)
+    return date(value.year, value.month, 1)
+
+
+def get_next_month_start(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def get_cube_key(task: Dict[str, Any]) -> CubeKey:
+    return (
+        get_month_start(task["operation_date"]),
+        task["department"].strip(),
+        task["employee_category"].strip(),
+        task["order_number"].strip(),
+        task["work_name"].strip(),
+    )
+
+
+def update_task_cube(
+    cursor: Any,
+    added_tasks: Iterable[Dict[str, Any]] = (),
+    removed_tasks: Iterable[Dict[str, Any]] = (),
+) -> None:
+    """
+    Applies added and removed tasks to the cube within the caller's transaction.
+
+    Tasks are aggregated per cube row first, so a batch touches every row once. In the `nightly`
+    refresh mode the cube is left to `TaskCube.rebuild` and task writes do not touch it.
+
+    Cells are unique by their key. A cell missing for the update is inserted, and when a concurrent
+    transaction has inserted it first, the duplicate key error is caught and the update is repeated.
+    Rows of cells stay locked until the caller commits, so concurrent writes of tasks of the same month,
+    department, category and work wait for each other; where that hot spot matters, the `nightly` mode
+    takes the cube out of task writes.
+
+    Args:
+        cursor (Any): Cursor of the caller's transaction.
+        added_tasks (Iterable[Dict[str, Any]]): Inserted tasks, and updated tasks with their new values.
+        removed_tasks (Iterable[Dict[str, Any]]): Deleted tasks, and updated tasks with their previous values.
+    """
+
+    if TASK_CUBE_REFRESH != "incremental":
+        return
+
+    deltas: Dict[CubeKey, List[Union[Decimal, int]]] = defaultdict(lambda: [Decimal(0), 0])
+    for tasks, sign in ((added_tasks, 1), (removed_tasks, -1)):
+        for task in tasks:
+            delta: List[Union[Decimal, int]] = deltas[get_cube_key(task)]
+            delta[0] += sign * task["hours"]
+            delta[1] += sign
+
+    has_removals: bool = False
+    for key, (hours, tasks_count) in deltas.items():
+        if tasks_count == 0 and hours == 0:
+            continue
+        has_removals = has_removals or tasks_count < 0
+
+        cursor.execute(UPDATE_CELL_QUERY, (hours, tasks_count, *key))
+        if cursor.rowcount == 0:
+            try:
+                cursor.execute(INSERT_CELL_QUERY, (*key, hours, tasks_count))
+            except Exception as error:
+                if not is_duplicate_key_error(error):
+                    raise
+                # The cell was inserted by a concurrent transaction after the update found none
+                cursor.execute(UPDATE_CELL_QUERY, (hours, tasks_count, *key))
+
+    if has_removals:
+        cursor.execute("DELETE FROM task_cube WHERE tasks_count <= 0")
+
+
+class TaskCube(DatabaseConnection):
+    """
+    Tasks hours pre-aggregated by month, department, employee category, order and work.
+
+    Aggregates grouping tasks by these dimensions, the pivot and the orders and works sheets of reports,
+    read a few rows per month from `task_cube` instead of scanning all tasks of the period. Employee and
+    timesheet sheets group by employee and date, which the cube does not keep, and aggregate tasks.
+    The cube is authoritative for months before its boundary, later tasks (the current, still changing
+    month) are aggregated from `tasks` on every query:
+
+    - in the `incremental` refresh mode task writes update the cube in their transaction,
+      so the boundary is the start of the current month;
+    - in the `nightly` mode the boundary is the start of the month in which `rebuild` last ran,
+      and changes of earlier tasks appear in reports after the next rebuild.
+
+    Until the first `rebuild` all queries are answered from `tasks`.
+    """
+
+    def get_boundary(self) -> Optional[date]:
+        built_until: str = setting_manager.get_setting(BUILT_UNTIL_SETTING)
+        if not built_until:
+            return None
+        if TASK_CUBE_REFRESH == "incremental":
+            return get_month_start(date.today())
+        return date.fromisoformat(built_until)
+
+    def rebuild(self) -> int:
+        """
+        Recomputes the whole cube from tasks, including archived ones, in one transaction.
+
+        Tasks are grouped by date in the database and rolled up to months here, so the query does not
+        depend on date functions of the database dialect.
+
+        Returns:
+            rows_count (int): Number of cube rows written.
+        """
+
+        query: str = f"""
+            SELECT operation_date, department, employee_category, order_number, work_name, SUM(hours), COUNT(*)
+            FROM {get_table_source("tasks", include_archive=True)}
+            GROUP BY operation_date, department, employee_category, order_number, work_name
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("DELETE FROM task_cube")
+                cursor.execute(query)
+
+                cube: Dict[CubeKey, List[Union[Decimal, int]]] = defaultdict(lambda: [Decimal(0), 0])
+                for (
+                    operation_date,
+                    department,
+                    employee_category,
+                    order_number,
+                    work_name,
+                    hours,
+                    count,
+                ) in cursor.fetchall():
+                    row: List[Union[Decimal, int]] = cube[
+                        (get_month_start(operation_date), department, employee_category, order_number, work_name)
+                    ]
+                    row[0] += hours
+                    row[1] += count
+
+                if hasattr(cursor, "fast_executemany"):
+                    cursor.fast_executemany = True
+
+                query: str = """
+                    INSERT INTO task_cube (month, department, employee_category, order_number, work_name, hours, tasks_count)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """
+                rows: List[Tuple[Any, ...]] = [(*key, hours, count) for key, (hours, count) in cube.items()]
+                if rows:
+                    cursor.executemany(query, rows)
+            connection.commit()
+
+        setting_manager.set_setting(BUILT_UNTIL_SETTING, get_month_start(date.today()).isoformat())
+        return len(rows)
+
+    @replica_safe
+    def get_hours(
+        self,
+        group_by: Sequence[str],
+        start_date: Optional[Union[str, date, datetime]] = None,
+        end_date: Optional[Union[str, date, datetime]] = None,
+        departments: Optional[List[str]] = None,
+        employee_categories: Optional[List[str]] = None,
+        order_numbers: Optional[List[str]] = None,
+        work_names: Optional[List[str]] = None,
+    ) -> List[CubeRow]:
+        """
+        Returns hours and tasks count of tasks grouped by the given cube dimensions.
+
+        Whole months of the period before the cube boundary are read from `task_cube`. The rest of it,
+        partial months at the edges of the period and months from the boundary on, is aggregated from
+        `tasks`, and both parts are merged into one result. Like the cube, a period without a start
+        includes archived tasks.
+
+        Args:
+            group_by (Sequence[str]): Dimensions from `CUBE_DIMENSIONS`, an empty sequence gives the grand total.
+            start_date (optional): First date of the period.
+            end_date (optional): Last date of the period, inclusive.
+            departments, employee_categories, order_numbers, work_names (List[str], optional): Filters
+                by dimension values.
+
+        Returns:
+            rows (List[CubeRow]): Dimension values with `hours` and `tasks_count`, sorted by dimensions.
+        """
+
+        group_by = [dimension for dimension in CUBE_DIMENSIONS if dimension in group_by]
+        start_date = get_date(start_date) if start_date else None
+        # Exclusive upper bound of the period
+        end_before: Optional[date] = get_date(end_date) + timedelta(days=1) if end_date else None
+
+        filters: Dict[str, Optional[List[str]]] = {
+            "department": departments,
+            "employee_category": employee_categories,
+            "order_number": order_numbers,
+            "work_name": work_names,
+        }
+        conditions: str = ""
+        params: List[Any] = []
+        for column, values in filters.items():
+            values = [value.strip() for value in values or [] if value and value.strip()]
+            if values:
+                conditions += f" AND {column} IN ({', '.join('?' for _ in values)})"
+                params.extend(values)
+
+        # Whole months of the period answered by the cube: from `cube_start` (unbounded if None) to `cube_end`
+        cube_start: Optional[date] = None
+        if start_date is not None:
+            cube_start = start_date if start_date.day == 1 else get_next_month_start(get_month_start(start_date))
+        cube_end: Optional[date] = self.get_boundary()
+        if cube_end is not None and end_before is not None:
+            cube_end = min(cube_end, get_month_start(end_before))
+        if cube_end is not None and cube_start is not None and cube_start >= cube_end:
+            cube_end = None
+
+        # Date ranges left to tasks, each with inclusive lower and exclusive upper bound
+        ranges: List[Tuple[Optional[date], Optional[date]]] = [(start_date, end_before)]
+        if cube_end is not None:
+            ranges = [(cube_end, end_before)]
+            if cube_start is not None and start_date < cube_start:
+                ranges.insert(0, (start_date, cube_start))
+
+        totals: Dict[Tuple[Any, ...], List[Union[Decimal, int]]] = defaultdict(lambda: [Decimal(0), 0])
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                if cube_end is not None:
+                    columns: List[str] = group_by + ["SUM(hours)", "SUM(tasks_count)"]
+                    query: str = f"SELECT {', '.join(columns)} FROM task_cube WHERE month < ?{conditions}"
+                    cube_params: List[Any] = [cube_end, *params]
+
+                    if cube_start is not None:
+                        query += " AND month >= ?"
+                        cube_params.append(cube_start)
+                    if group_by:
+                        query += f" GROUP BY {', '.join(group_by)}"
+
+                    cursor.execute(query, tuple(cube_params))
+                    for row in cursor.fetchall():
+                        self.add_totals(totals, row[:-2], row[-2], row[-1])
+
+                ranges = [(lower, upper) for lower, upper in ranges if not (lower and upper and lower >= upper)]
+                if ranges:
+                    raw_group_by: List[str] = [
+                        "operation_date" if dimension == "month" else dimension for dimension in group_by
+                    ]
+                    range_conditions: List[str] = []
+                    range_params: List[Any] = []
+                    for lower, upper in ranges:
+                        bounds: List[str] = []
+                        if lower is not None:
+                            bounds.append("operation_date >= ?")
+                            range_params.append(lower)
+                        if upper is not None:
+                            bounds.append("operation_date < ?")
+                            range_params.append(upper)
+                        range_conditions.append(f"({' AND '.join(bounds or ['1 = 1'])})")
+
+                    lower_bound: Optional[date] = ranges[0][0]
+                    source: str = get_table_source("tasks", lower_bound, include_archive=lower_bound is None)
+                    columns: List[str] = raw_group_by + ["SUM(hours)", "COUNT(*)"]
+                    query: str = (
+                        f"SELECT {', '.join(columns)} FROM {source}"
+                        f" WHERE ({' OR '.join(range_conditions)}){conditions}"
+                    )
+                    if raw_group_by:
+                        query += f" GROUP BY {', '.join(raw_group_by)}"
+
+                    cursor.execute(query, tuple(range_params + params))
+                    for row in cursor.fetchall():
+                        values: Tuple[Any, ...] = tuple(
+                            get_month_start(value) if dimension == "month" else value
+                            for dimension, value in zip(group_by, row)
+                        )
+                        self.add_totals(totals, values, row[-2], row[-1])
+
+        return [
+            {**dict(zip(group_by, values)), "hours": hours, "tasks_count": tasks_count}
+            for values, (hours, tasks_count) in sorted(totals.items())
+            if tasks_count
+        ]
+
+    def add_totals(
+        self,
+        totals: Dict[Tuple[Any, ...], List[Union[Decimal, int]]],
+        values: Tuple[Any, ...],
+        hours: Optional[Decimal],
+        tasks_count: Optional[int],
+    ) -> None:
+        total: List[Union[Decimal, int]] = totals[tuple(values)]
+        total[0] += Decimal(hours or 0)
+        total[1] += tasks_count or 0
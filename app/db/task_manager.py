@@ -1,13 +1,122 @@
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
+from .archive_manager import get_table_source
+from .bulk_keys import KeyTable
+from .data_versions import bump_data_versions
 from .db_connection import DatabaseConnection
 from .employee_manager import EmployeeManager
+from .event_manager import publish_event, publish_events
+from .routing import replica_safe
+from .task_cube import update_task_cube
+from .work_hours import SPENT_HOURS_TABLES, add_spent_hours
+from .work_manager import publish_work_updates, publish_works_updates, works_cache
 
 Tasks = List[Dict[str, Union[str, Decimal]]]
 Data = List[List[Union[str, Decimal]]]
 employee_manager: EmployeeManager = EmployeeManager()
+department_keys: KeyTable = KeyTable("department_keys", {"department": "NVARCHAR(100)"})
+submission_keys: KeyTable = KeyTable("submission_keys", {"idempotency_key": "NVARCHAR(64)"})
+task_keys: KeyTable = KeyTable("task_keys", {"id": "INT"})
+employee_days: KeyTable = KeyTable("employee_days", {"personnel_number": "NVARCHAR(100)", "operation_date": "DATE"})
+submitted_tasks: KeyTable = KeyTable(
+    "submitted_tasks",
+    {
+        "task_index": "INT",
+        "employee_name": "NVARCHAR(255)",
+        "personnel_number": "NVARCHAR(100)",
+        "department": "NVARCHAR(100)",
+        "work_name": "NVARCHAR(450)",
+        "hours": "DECIMAL(10,2)",
+        "order_number": "NVARCHAR(255)",
+        "order_name": "NVARCHAR(450)",
+        "operation_date": "DATE",
+        "employee_category": "NVARCHAR(100)",
+    },
+)
+
+TASKS_SORT_COLUMNS: Tuple[str, ...] = (
+    "employee_name",
+    "personnel_number",
+    "employee_category",
+    "department",
+    "work_name",
+    "hours",
+    "order_number",
+    "order_name",
+    "operation_date",
+)
+
+BULK_OPERATIONS: Tuple[str, ...] = ("reassign", "shift_date", "change_employee", "delete")
+HOURS_PER_DAY: Decimal = Decimal("12.25")
+
+TASK_COLUMNS: str = """
+    id,
+    employee_name,
+    personnel_number,
+    department,
+    work_name,
+    hours,
+    order_number,
+    order_name,
+    operation_date,
+    employee_category
+"""
+
+
+INSERTED_TASK_COLUMNS: str = """
+    employee_name,
+    personnel_number,
+    department,
+    work_name,
+    hours,
+    order_number,
+    order_name,
+    operation_date,
+    employee_category
+"""
+
+
+def get_task_dict(task: Tuple[Any, ...]) -> Dict[str, Union[str, Decimal]]:
+    return {
+        "id": task[0],
+        "employee_name": task[1],
+        "personnel_number": task[2],
+        "department": task[3],
+        "work_name": task[4],
+        "hours": task[5],
+        "order_number": task[6],
+        "order_name": task[7],
+        "operation_date": task[8].strftime("%Y-%m-%d"),
+        "employee_category": task[9],
+    }
+
+
+def get_task_values(index: int, task: Dict[str, Union[str, Decimal]]) -> Tuple[Any, ...]:
+    return (
+        index,
+        task["employee_name"].strip(),
+        task["personnel_number"].strip(),
+        task["department"].strip(),
+        task["work_name"].strip(),
+        task["hours"],
+        task["order_number"].strip(),
+        task["order_name"].strip(),
+        task["operation_date"],
+        task["employee_category"].strip(),
+    )
+
+
+def insert_task(cursor: Any, task: Dict[str, Union[str, Decimal]]) -> int:
+    query: str = f"""
+        INSERT INTO tasks ({INSERTED_TASK_COLUMNS})
+        OUTPUT INSERTED.id
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    cursor.execute(query, get_task_values(0, task)[1:])
+    return cursor.fetchone()[0]
 
 
 class TaskManager(DatabaseConnection):
@@ -23,70 +132,272 @@ class TaskManager(DatabaseConnection):
         operation_date: str,
         employee_category: str,
     ) -> int:
+        task: Dict[str, Union[str, Decimal]] = {
+            "employee_name": employee_name,
+            "personnel_number": personnel_number,
+            "department": department,
+            "work_name": work_name,
+            "hours": hours,
+            "order_number": order_number,
+            "order_name": order_name,
+            "operation_date": operation_date,
+            "employee_category": employee_category,
+        }
+
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                query: str = """
-                    INSERT INTO tasks (
-                        employee_name,
-                        personnel_number,
-                        department,
-                        work_name,
-                        hours,
-                        order_number,
-                        order_name,
-                        operation_date,
-                        employee_category
-                    )
+                task_id: int = insert_task(cursor, task)
+                add_spent_hours(cursor, [(hours, work_name, order_number)])
+
+                task: Dict[str, Union[str, Decimal]] = self.fetch_task(cursor, task_id)
+                update_task_cube(cursor, added_tasks=[task])
+
+                publish_event(cursor, "task_added", {"task": task})
+                publish_work_updates(cursor, "works.name = ? AND orders.number = ?", (work_name, order_number))
+            connection.commit()
+        bump_data_versions("tasks", *SPENT_HOURS_TABLES)
+        works_cache.invalidate(order_number.strip())
+        return task_id
+
+    def add_tasks(self, submissions: Dict[str, Tasks]) -> List[str]:
+        """
+        Inserts tasks of several submissions in one transaction, skipping submissions whose
+        idempotency key was already processed.
+
+        Keys are recorded in `task_submissions` in the same transaction as tasks, so a submission
+        retried after a lost response is never inserted twice. Concurrent requests with the same key
+        fail on the primary key and roll back entirely.
+
+        Tasks of all submissions are staged into `#submitted_tasks` and inserted with one INSERT ... SELECT,
+        their events and the balances of touched works are written with one batch each.
+
+        Args:
+            submissions (Dict[str, Tasks]): Tasks (as accepted by `add_task`) by idempotency key.
+
+        Returns:
+            keys (List[str]): Keys of submissions inserted by this call.
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                submission_keys.stage(cursor, [(key,) for key in submissions])
+                query: str = f"""
+                    SELECT idempotency_key FROM task_submissions
+                    WHERE idempotency_key IN (SELECT idempotency_key FROM {submission_keys.name})
+                """
+                cursor.execute(query)
+                processed_keys: Set[str] = {row[0] for row in cursor.fetchall()}
+
+                new_keys: List[str] = [key for key in submissions if key not in processed_keys]
+                if not new_keys:
+                    return []
+
+                query: str = "INSERT INTO task_submissions (idempotency_key, tasks_count) VALUES (?, ?)"
+                cursor.executemany(query, [(key, len(submissions[key])) for key in new_keys])
+
+                tasks: Tasks = [task for key in new_keys for task in submissions[key]]
+                spent_hours: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+                for task in tasks:
+                    spent_hours[(task["work_name"].strip(), task["order_number"].strip())] += task["hours"]
+
+                submitted_tasks.stage(cursor, (get_task_values(index, task) for index, task in enumerate(tasks)))
+                query: str = f"""
+                    INSERT INTO tasks ({INSERTED_TASK_COLUMNS})
                     OUTPUT INSERTED.id
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    SELECT {INSERTED_TASK_COLUMNS}
+                    FROM {submitted_tasks.name}
+                    ORDER BY task_index
                 """
-                cursor.execute(
-                    query,
-                    (
-                        employee_name.strip(),
-                        personnel_number.strip(),
-                        department.strip(),
-                        work_name.strip(),
-                        hours,
-                        order_number.strip(),
-                        order_name.strip(),
-                        operation_date,
-                        employee_category.strip(),
-                    ),
+                cursor.execute(query)
+                task_ids: List[int] = [row[0] for row in cursor.fetchall()]
+
+                add_spent_hours(
+                    cursor,
+                    [(hours, work_name, order_number) for (work_name, order_number), hours in spent_hours.items()],
                 )
 
-                task_id: int = cursor.fetchone()[0]
+                task_keys.stage(cursor, [(task_id,) for task_id in task_ids])
+                query: str = (
+                    f"SELECT {TASK_COLUMNS} FROM tasks WHERE id IN (SELECT id FROM {task_keys.name}) ORDER BY id"
+                )
+                cursor.execute(query)
+                added_tasks: Tasks = [get_task_dict(task) for task in cursor.fetchall()]
+                update_task_cube(cursor, added_tasks=added_tasks)
 
-                query: str = """
-                    UPDATE works
-                    SET works.spent_hours = works.spent_hours + ?
-                    FROM works
-                    JOIN orders ON works.order_id = orders.id
-                    WHERE works.name = ? AND orders.number = ?
-                """
-                cursor.execute(query, (hours, work_name, order_number))
+                publish_events(cursor, [("task_added", {"task": task}) for task in added_tasks])
+                publish_works_updates(cursor, list(spent_hours))
             connection.commit()
-        return task_id
+        bump_data_versions("tasks", *SPENT_HOURS_TABLES)
+        works_cache.invalidate(*{order_number.strip() for _, order_number in spent_hours})
+        return new_keys
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Deletes a live task. Returns False if there is no such task, archived tasks are never deleted.
+        """
 
-    def delete_task(self, task_id: int) -> None:
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                query: str = "SELECT order_number, work_name, hours FROM tasks WHERE id = ?"
-                cursor.execute(query, (task_id,))
-                order_number, work_name, hours = cursor.fetchone()
+                task: Optional[Dict[str, Union[str, Decimal]]] = self.fetch_task(cursor, task_id)
+                if task is None:
+                    return False
+                order_number, work_name, hours = task["order_number"], task["work_name"], task["hours"]
 
                 query: str = "DELETE FROM tasks WHERE id = ?"
                 cursor.execute(query, (task_id,))
 
-                query: str = """
-                    UPDATE works
-                    SET spent_hours = spent_hours - ?
-                    FROM works
-                    JOIN orders ON works.order_id = orders.id
-                    WHERE works.name = ? AND orders.number = ?
-                """
-                cursor.execute(query, (hours, work_name, order_number))
+                add_spent_hours(cursor, [(-hours, work_name, order_number)])
+                update_task_cube(cursor, removed_tasks=[task])
+
+                publish_event(cursor, "task_deleted", {"task": task})
+                publish_work_updates(cursor, "works.name = ? AND orders.number = ?", (work_name, order_number))
+            connection.commit()
+        bump_data_versions("tasks", *SPENT_HOURS_TABLES)
+        works_cache.invalidate(order_number)
+        return True
+
+    def bulk_update_tasks(
+        self,
+        filters: Dict[str, Any],
+        operation: str,
+        changes: Dict[str, Any],
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Applies one operation to all live tasks matching the filters in a single transaction.
+
+        Operations and their changes:
+            - reassign: `order_number`, `order_name` and `work_name` of the target work;
+            - shift_date: `days` to add to operation dates (negative to move back);
+            - change_employee: `employee_name`, `personnel_number`, `department` and `employee_category`;
+            - delete: no changes.
+
+        Tasks are changed with set-based statements over the staged selection, and spent hours of works
+        are adjusted once per work by the difference of hours before and after the operation.
+        If the operation makes any employee exceed the shift duration on some date, or in a dry run,
+        the transaction is rolled back.
+
+        Args:
+            filters (Dict[str, Any]): Filters accepted by `build_tasks_filters`.
+            operation (str): One of `BULK_OPERATIONS`.
+            changes (Dict[str, Any]): Values of the operation.
+            dry_run (bool): Whether to roll the changes back after checking them.
+
+        Returns:
+            result (Dict[str, Any]): Number and hours of selected tasks, personnel numbers and dates
+                with exceeded shift duration, and whether the changes were committed.
+        """
+
+        conditions, params = self.build_tasks_filters(**filters)
+        result: Dict[str, Any] = {"tasks_count": 0, "hours_total": Decimal(0), "overloads": [], "applied": False}
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self.stage_tasks_filters(cursor, filters.get("departments"))
+                cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks{conditions}", tuple(params))
+                tasks: Tasks = [get_task_dict(task) for task in cursor.fetchall()]
+
+                result["tasks_count"] = len(tasks)
+                result["hours_total"] = sum((task["hours"] for task in tasks), Decimal(0))
+                if not tasks:
+                    return result
+
+                task_keys.stage(cursor, [(task["id"],) for task in tasks])
+                selection: str = f"id IN (SELECT id FROM {task_keys.name})"
+
+                if operation == "delete":
+                    cursor.execute(f"DELETE FROM tasks WHERE {selection}")
+                elif operation == "shift_date":
+                    # Dates are moved starting from the far end, so moved tasks never match a later statement
+                    dates: List[str] = sorted({task["operation_date"] for task in tasks}, reverse=changes["days"] > 0)
+                    cursor.executemany(
+                        f"UPDATE tasks SET operation_date = ? WHERE {selection} AND operation_date = ?",
+                        [(date.fromisoformat(day) + timedelta(days=changes["days"]), day) for day in dates],
+                    )
+                elif operation == "reassign":
+                    cursor.execute(
+                        f"UPDATE tasks SET order_number = ?, order_name = ?, work_name = ? WHERE {selection}",
+                        (changes["order_number"], changes["order_name"], changes["work_name"]),
+                    )
+                elif operation == "change_employee":
+                    query: str = f"""
+                        UPDATE tasks
+                        SET employee_name = ?, personnel_number = ?, department = ?, employee_category = ?
+                        WHERE {selection}
+                    """
+                    cursor.execute(
+                        query,
+                        (
+                            changes["employee_name"],
+                            changes["personnel_number"],
+                            changes["department"],
+                            changes["employee_category"],
+                        ),
+                    )
+                else:
+                    raise ValueError(f"Unknown bulk operation: {operation}")
+
+                updated_tasks: Tasks = []
+                if operation != "delete":
+                    cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE {selection}")
+                    updated_tasks = [get_task_dict(task) for task in cursor.fetchall()]
+
+                if operation in ("shift_date", "change_employee"):
+                    employee_days.stage(
+                        cursor, ((task["personnel_number"], task["operation_date"]) for task in updated_tasks)
+                    )
+                    query: str = f"""
+                        SELECT tasks.personnel_number, tasks.operation_date
+                        FROM tasks
+                        JOIN {employee_days.name} AS changed
+                            ON tasks.personnel_number = changed.personnel_number
+                            AND tasks.operation_date = changed.operation_date
+                        WHERE tasks.operation_date BETWEEN ? AND ?
+                        GROUP BY tasks.personnel_number, tasks.operation_date
+                        HAVING SUM(tasks.hours) > ?
+                    """
+                    operation_dates: List[str] = [task["operation_date"] for task in updated_tasks]
+                    cursor.execute(query, (min(operation_dates), max(operation_dates), HOURS_PER_DAY))
+                    result["overloads"] = [
+                        (personnel_number, operation_date.strftime("%Y-%m-%d"))
+                        for personnel_number, operation_date in cursor.fetchall()
+                    ]
+
+                if dry_run or result["overloads"]:
+                    connection.rollback()
+                    return result
+
+                spent_hours: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+                for task in tasks:
+                    spent_hours[(task["work_name"], task["order_number"])] -= task["hours"]
+                for task in updated_tasks:
+                    spent_hours[(task["work_name"], task["order_number"])] += task["hours"]
+                spent_hours = {work_key: hours for work_key, hours in spent_hours.items() if hours}
+
+                add_spent_hours(
+                    cursor,
+                    [(hours, work_name, order_number) for (work_name, order_number), hours in spent_hours.items()],
+                )
+                update_task_cube(cursor, added_tasks=updated_tasks, removed_tasks=tasks)
+
+                if operation == "delete":
+                    for task in tasks:
+                        publish_event(cursor, "task_deleted", {"task": task})
+                else:
+                    previous_tasks: Dict[int, Dict[str, Union[str, Decimal]]] = {task["id"]: task for task in tasks}
+                    for task in updated_tasks:
+                        publish_event(
+                            cursor, "task_updated", {"task": task, "previous_task": previous_tasks[task["id"]]}
+                        )
+
+                for work_name, order_number in spent_hours:
+                    publish_work_updates(cursor, "works.name = ? AND orders.number = ?", (work_name, order_number))
             connection.commit()
+        bump_data_versions("tasks", *SPENT_HOURS_TABLES)
+
+        works_cache.invalidate(*{order_number for _, order_number in spent_hours})
+        result["applied"] = True
+        return result
 
     def get_task_data_by_id(self, task_id: int) -> Optional[Dict[str, Union[str, Decimal]]]:
         query: str = """
@@ -121,7 +432,12 @@ class TaskManager(DatabaseConnection):
                         "operation_date": task_data[8].strftime("%Y-%m-%d"),
                     }
 
-    def get_tasks(
+    def fetch_task(self, cursor: Any, task_id: int) -> Optional[Dict[str, Union[str, Decimal]]]:
+        cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,))
+        task: Optional[Tuple[Any, ...]] = cursor.fetchone()
+        return None if task is None else get_task_dict(task)
+
+    def build_tasks_filters(
         self,
         departments: Optional[List[str]] = None,
         start_date: Optional[str] = None,
@@ -130,84 +446,181 @@ class TaskManager(DatabaseConnection):
         order_number: Optional[str] = None,
         work_name: Optional[str] = None,
         order_name: Optional[str] = None,
-    ) -> Tasks:
-        base_query: str = """
-            SELECT
-                id,
-                employee_name,
-                personnel_number,
-                department,
-                work_name,
-                hours,
-                order_number,
-                order_name,
-                operation_date,
-                employee_category
-            FROM tasks
-        """
+    ) -> Tuple[str, List[str]]:
+        params: List[str] = []
 
-        if departments:
-            departments: List[str] = list(filter(None, departments))
-            placeholders: str = ",".join(["?"] * len(departments))
-            query: str = f"{base_query} WHERE department IN ({placeholders})"
-            params: List[str] = departments
+        if departments and any(departments):
+            conditions: str = f" WHERE department IN (SELECT department FROM {department_keys.name})"
         else:
-            query: str = f"{base_query} WHERE 1 = 1"
-            params: List[str] = []
+            conditions: str = " WHERE 1 = 1"
 
         if start_date:
-            query += " AND operation_date >= ?"
+            conditions += " AND operation_date >= ?"
             params.append(start_date)
 
         if end_date:
-            query += " AND operation_date <= ?"
+            conditions += " AND operation_date <= ?"
             params.append(end_date)
 
         if employee_data:
             employee_details: Optional[Tuple[str, str]] = employee_manager.get_employee_details(employee_data)
             if employee_details is None:
-                query += " AND employee_name = ?"
+                conditions += " AND employee_name = ?"
                 params.append(employee_data)
             else:
                 _, personnel_number = employee_details
-                query += " AND personnel_number = ?"
+                conditions += " AND personnel_number = ?"
                 params.append(personnel_number)
 
         if order_number:
-            query += " AND order_number = ?"
+            conditions += " AND order_number = ?"
             params.append(order_number.strip())
 
         if work_name:
-            query += " AND work_name = ?"
+            conditions += " AND work_name = ?"
             params.append(work_name.strip())
 
         if order_name:
-            query += " AND order_name = ?"
+            conditions += " AND order_name = ?"
             params.append(order_name.strip())
 
-        query += " ORDER BY employee_name, personnel_number, operation_date"
+        return conditions, params
+
+    def get_task_matcher(
+        self,
+        departments: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        employee_data: Optional[str] = None,
+        order_number: Optional[str] = None,
+        work_name: Optional[str] = None,
+        order_name: Optional[str] = None,
+    ) -> Callable[[Dict[str, Union[str, Decimal]]], bool]:
+        """
+        Returns predicate checking task record against the same filters as `build_tasks_filters` without
+        querying the database. Filters are normalized and employee details resolved once, when the predicate
+        is built, so that it is cheap to apply to every event of a live stream.
+        """
+
+        departments_set: Set[str] = set(filter(None, departments or []))
+        employee_details: Optional[Tuple[str, str]] = (
+            employee_manager.get_employee_details(employee_data) if employee_data else None
+        )
+        order_number = order_number.strip() if order_number else None
+        work_name = work_name.strip() if work_name else None
+        order_name = order_name.strip() if order_name else None
+
+        def matches(task: Dict[str, Union[str, Decimal]]) -> bool:
+            if departments_set and task["department"] not in departments_set:
+                return False
+            if start_date and task["operation_date"] < start_date:
+                return False
+            if end_date and task["operation_date"] > end_date:
+                return False
+            if employee_data and employee_details is None and task["employee_name"] != employee_data:
+                return False
+            if employee_details is not None and task["personnel_number"] != employee_details[1]:
+                return False
+            if order_number and task["order_number"] != order_number:
+                return False
+            if work_name and task["work_name"] != work_name:
+                return False
+            if order_name and task["order_name"] != order_name:
+                return False
+            return True
+
+        return matches
+
+    def stage_tasks_filters(self, cursor: Any, departments: Optional[List[str]] = None) -> None:
+        if departments and any(departments):
+            department_keys.stage(cursor, ((department,) for department in departments if department))
+
+    @replica_safe
+    def get_tasks(
+        self,
+        departments: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        employee_data: Optional[str] = None,
+        order_number: Optional[str] = None,
+        work_name: Optional[str] = None,
+        order_name: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        sort_order: str = "asc",
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Tasks:
+        query: str = f"SELECT {TASK_COLUMNS} FROM {get_table_source('tasks', start_date)}"
+
+        conditions, params = self.build_tasks_filters(
+            departments=departments,
+            start_date=start_date,
+            end_date=end_date,
+            employee_data=employee_data,
+            order_number=order_number,
+            work_name=work_name,
+            order_name=order_name,
+        )
+        query += conditions
+
+        if sort_by in TASKS_SORT_COLUMNS:
+            direction: str = "DESC" if sort_order == "desc" else "ASC"
+            query += f" ORDER BY {sort_by} {direction}, id {direction}"
+        else:
+            query += " ORDER BY employee_name, personnel_number, operation_date, id"
+
+        if limit is not None:
+            query += """
+                OFFSET ? ROWS
+                FETCH NEXT ? ROWS ONLY
+            """
+            params.append(offset or 0)
+            params.append(limit)
 
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
+                self.stage_tasks_filters(cursor, departments)
                 cursor.execute(query, tuple(params))
 
-                tasks: List[Dict[str, str]] = [
-                    {
-                        "id": task[0],
-                        "employee_name": task[1],
-                        "personnel_number": task[2],
-                        "department": task[3],
-                        "work_name": task[4],
-                        "hours": task[5],
-                        "order_number": task[6],
-                        "order_name": task[7],
-                        "operation_date": task[8].strftime("%Y-%m-%d"),
-                        "employee_category": task[9],
-                    }
-                    for task in cursor.fetchall()
-                ]
+                tasks: List[Dict[str, str]] = [get_task_dict(task) for task in cursor.fetchall()]
                 return tasks
 
+    @replica_safe
+    def get_tasks_totals(
+        self,
+        departments: Optional[List[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        employee_data: Optional[str] = None,
+        order_number: Optional[str] = None,
+        work_name: Optional[str] = None,
+        order_name: Optional[str] = None,
+        include_archive: bool = True,
+    ) -> Dict[str, Union[int, Decimal]]:
+        conditions, params = self.build_tasks_filters(
+            departments=departments,
+            start_date=start_date,
+            end_date=end_date,
+            employee_data=employee_data,
+            order_number=order_number,
+            work_name=work_name,
+            order_name=order_name,
+        )
+
+        source: str = get_table_source("tasks", start_date) if include_archive else "tasks"
+        query: str = f"SELECT COUNT(*), COALESCE(SUM(hours), 0) FROM {source}"
+        query += conditions
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self.stage_tasks_filters(cursor, departments)
+                cursor.execute(query, tuple(params))
+                tasks_count, hours_total = cursor.fetchone()
+                return {
+                    "tasks_count": tasks_count,
+                    "hours_total": Decimal(hours_total),
+                }
+
     def update_task(
         self,
         task_id: int,
@@ -218,7 +631,11 @@ class TaskManager(DatabaseConnection):
         order_number: str,
         operation_date: str,
         work_name: str,
-    ) -> None:
+    ) -> bool:
+        """
+        Updates a live task. Returns False if there is no such task, archived tasks are never updated.
+        """
+
         department: str = employee_manager.get_employee_department(personnel_number)
 
         query: str = """
@@ -237,6 +654,10 @@ class TaskManager(DatabaseConnection):
 
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
+                previous_task: Optional[Dict[str, Union[str, Decimal]]] = self.fetch_task(cursor, task_id)
+                if previous_task is None:
+                    return False
+
                 cursor.execute(
                     query,
                     (
@@ -251,8 +672,15 @@ class TaskManager(DatabaseConnection):
                         task_id,
                     ),
                 )
+                task: Dict[str, Union[str, Decimal]] = self.fetch_task(cursor, task_id)
+                update_task_cube(cursor, added_tasks=[task], removed_tasks=[previous_task])
+
+                publish_event(cursor, "task_updated", {"task": task, "previous_task": previous_task})
                 connection.commit()
+        bump_data_versions("tasks")
+        return True
 
+    @replica_safe
     def get_tasks_count(self) -> int:
         query: str = "SELECT COUNT(*) FROM tasks"
 
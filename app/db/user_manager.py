@@ -1,6 +1,7 @@
 import hashlib
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from .data_versions import bump_data_versions
 from .db_connection import DatabaseConnection
 
 
@@ -48,6 +49,7 @@ class UserManager(DatabaseConnection):
                     ),
                 )
                 connection.commit()
+        bump_data_versions("users")
 
     def delete_user(self, user_id: int) -> None:
         query: str = "DELETE FROM users WHERE id = ?"
@@ -56,6 +58,7 @@ class UserManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (user_id,))
                 connection.commit()
+        bump_data_versions("users")
 
     def update_user(
         self,
@@ -89,6 +92,7 @@ class UserManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, tuple(params))
                 connection.commit()
+        bump_data_versions("users")
 
     def reset_user_password(self, user_id: int) -> None:
         query: str = """
@@ -101,6 +105,7 @@ class UserManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (user_id,))
                 connection.commit()
+        bump_data_versions("users")
 
     def register_user(self, login: str, password: str) -> None:
         password_hash: str = hashlib.sha256(password.encode()).hexdigest()
@@ -111,6 +116,7 @@ class UserManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (password_hash, login.strip()))
                 connection.commit()
+        bump_data_versions("users")
 
     def authenticate_user(self, login: str, password: str) -> bool:
         password_hash = hashlib.sha256(password.encode()).hexdigest()
@@ -186,6 +192,7 @@ class UserManager(DatabaseConnection):
             with connection.cursor() as cursor:
                 cursor.execute(query, (is_active, user_id))
                 connection.commit()
+        bump_data_versions("users")
 
     def get_user_data_by_id(self, user_id: int) -> Optional[Dict[str, Union[str, int]]]:
         query: str = """
@@ -0,0 +1,135 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from decouple import config
+
+from .data_versions import bump_data_versions
+from .db_connection import DatabaseConnection
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SPENT_HOURS_ACCOUNTING: str = config("SPENT_HOURS_ACCOUNTING", default="direct")
+SPENT_HOURS_FOLD_INTERVAL: float = config("SPENT_HOURS_FOLD_INTERVAL", default=5, cast=float)
+# Tables whose data versions writers of task hours bump after commit. In the deferred mode works rows
+# are not changed by the writers, and the aggregator bumps the version of works once per fold.
+SPENT_HOURS_TABLES: Tuple[str, ...] = ("works",) if SPENT_HOURS_ACCOUNTING == "direct" else ()
+
+# Hours of tasks not yet folded into works.spent_hours, joined by readers of works balances.
+# The deltas table is empty in the direct accounting mode, so the join costs nothing there.
+PENDING_HOURS_JOIN: str = """
+    LEFT JOIN (
+        SELECT work_id, SUM(hours) AS hours
+        FROM work_hours_deltas
+        GROUP BY work_id
+    ) AS pending_hours ON pending_hours.work_id = works.id
+"""
+SPENT_HOURS_COLUMN: str = "works.spent_hours + COALESCE(pending_hours.hours, 0)"
+REMAINING_HOURS_COLUMN: str = "works.remaining_hours - COALESCE(pending_hours.hours, 0)"
+
+ADD_SPENT_HOURS_QUERY: str = """
+    UPDATE works
+    SET works.spent_hours = works.spent_hours + ?
+    FROM works
+    JOIN orders ON works.order_id = orders.id
+    WHERE works.name = ? AND orders.number = ?
+"""
+
+ADD_HOURS_DELTA_QUERY: str = """
+    INSERT INTO work_hours_deltas (work_id, hours)
+    SELECT works.id, ?
+    FROM works
+    JOIN orders ON works.order_id = orders.id
+    WHERE works.name = ? AND orders.number = ?
+"""
+
+
+def add_spent_hours(cursor: Any, spent_hours: Iterable[Tuple[Decimal, str, str]]) -> None:
+    """
+    Adds hours of tasks to their works within the caller's transaction.
+
+    In the `direct` accounting mode works rows are updated at once. In the `deferred` mode hours are
+    appended to the insert-only `work_hours_deltas` log, so concurrent task writes do not wait for locks
+    on popular works rows; the log is folded into works by `spent_hours_aggregator`.
+
+    Callers bump data versions of `SPENT_HOURS_TABLES` after their commit.
+
+    Args:
+        cursor (Any): Cursor of the caller's transaction.
+        spent_hours (Iterable[Tuple[Decimal, str, str]]): Hours (negative for removed tasks), work name
+            and order number.
+    """
+
+    if SPENT_HOURS_ACCOUNTING == "deferred":
+        cursor.executemany(ADD_HOURS_DELTA_QUERY, list(spent_hours))
+        spent_hours_aggregator.start()
+    else:
+        cursor.executemany(ADD_SPENT_HOURS_QUERY, list(spent_hours))
+
+
+def discard_pending_hours(cursor: Any, conditions: str, params: Tuple[Any, ...]) -> None:
+    """
+    Drops pending deltas of works matching the conditions, for writes that set spent hours explicitly.
+    """
+
+    query: str = f"DELETE FROM work_hours_deltas WHERE work_id IN (SELECT works.id FROM works WHERE {conditions})"
+    cursor.execute(query, params)
+
+
+class SpentHoursAggregator(DatabaseConnection):
+    """
+    Background thread folding `work_hours_deltas` into `works.spent_hours`.
+
+    Every `SPENT_HOURS_FOLD_INTERVAL` seconds deltas are deleted with OUTPUT of their values and added
+    to works in the same transaction, so each works row is updated once per interval instead of once
+    per task. Deletion claims deltas atomically, so aggregators of several worker processes
+    never fold the same delta twice. The data version of works is bumped once per fold, after commit.
+
+    The thread is started by the first deferred write of the process, after fork.
+    """
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.pid: Optional[int] = None
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is not None and self.pid == os.getpid():
+                return
+            self.pid = os.getpid()
+            self.thread = threading.Thread(target=self.run, name="spent-hours-aggregator", daemon=True)
+            self.thread.start()
+
+    def run(self) -> None:
+        while True:
+            time.sleep(SPENT_HOURS_FOLD_INTERVAL)
+            try:
+                self.fold()
+            except Exception:
+                logger.exception("Failed to fold work hours deltas")
+
+    def fold(self) -> int:
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("DELETE FROM work_hours_deltas OUTPUT DELETED.work_id, DELETED.hours")
+                deltas: List[Tuple[int, Decimal]] = cursor.fetchall()
+                if not deltas:
+                    return 0
+
+                hours_per_work: Dict[int, Decimal] = defaultdict(Decimal)
+                for work_id, hours in deltas:
+                    hours_per_work[work_id] += hours
+
+                query: str = "UPDATE works SET spent_hours = spent_hours + ? WHERE id = ?"
+                cursor.executemany(query, [(hours, work_id) for work_id, hours in hours_per_work.items()])
+            connection.commit()
+        bump_data_versions("works")
+        return len(deltas)
+
+
+spent_hours_aggregator: SpentHoursAggregator = SpentHoursAggregator()
@@ -1,7 +1,86 @@
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from decouple import config
+
+from .bulk_keys import KeyTable
+from .cache import TTLCache
+from .data_versions import bump_data_versions, data_versions
 from .db_connection import DatabaseConnection
+from .event_manager import publish_event, publish_events
+from .routing import replica_safe
+from .work_hours import PENDING_HOURS_JOIN, REMAINING_HOURS_COLUMN, SPENT_HOURS_COLUMN
+
+WorkRow = Tuple[int, str, Decimal, Decimal, Decimal]
+# Order number, order name and work name
+WorkKey = Tuple[str, str, str]
+
+WORKS_CACHE_TTL: float = config("WORKS_CACHE_TTL", default=60, cast=float)
+
+# Tables whose versions label cached works, the same ones conditional views of works are tagged with
+WORKS_CACHE_TABLES: Tuple[str, ...] = ("works", "orders")
+
+works_cache: TTLCache = TTLCache(ttl=WORKS_CACHE_TTL)
+order_keys: KeyTable = KeyTable("order_keys", {"order_number": "NVARCHAR(255)"})
+work_ids_table: KeyTable = KeyTable("work_ids", {"id": "INT"})
+work_keys: KeyTable = KeyTable("work_keys", {"order_number": "NVARCHAR(255)", "work_name": "NVARCHAR(450)"})
+
+
+def publish_work_updates(cursor: Any, conditions: str, params: Tuple[Any, ...]) -> None:
+    """
+    Publishes current hour balances of works matching the conditions as `work_updated` events.
+    """
+
+    query: str = f"""
+        SELECT
+            works.id,
+            orders.number,
+            works.name,
+            works.planned_hours,
+            {SPENT_HOURS_COLUMN} AS spent_hours,
+            {REMAINING_HOURS_COLUMN} AS remaining_hours
+        FROM works
+        JOIN orders ON works.order_id = orders.id
+        {PENDING_HOURS_JOIN}
+        WHERE {conditions}
+    """
+
+    cursor.execute(query, params)
+    publish_events(
+        cursor,
+        [
+            (
+                "work_updated",
+                {
+                    "work_id": work_id,
+                    "order_number": order_number,
+                    "work_name": work_name,
+                    "planned_hours": planned_hours,
+                    "spent_hours": spent_hours,
+                    "remaining_hours": remaining_hours,
+                },
+            )
+            for work_id, order_number, work_name, planned_hours, spent_hours, remaining_hours in cursor.fetchall()
+        ],
+    )
+
+
+def publish_works_updates(cursor: Any, works: List[Tuple[str, str]]) -> None:
+    """
+    Publishes balances of several works, given as work name and order number, with one query.
+    """
+
+    if not works:
+        return
+
+    work_keys.stage(cursor, ((order_number, work_name) for work_name, order_number in works))
+    conditions: str = f"""
+        EXISTS (
+            SELECT 1 FROM {work_keys.name} AS filters
+            WHERE filters.order_number = orders.number AND filters.work_name = works.name
+        )
+    """
+    publish_work_updates(cursor, conditions, ())
 
 
 class WorkManager(DatabaseConnection):
@@ -14,7 +93,10 @@ class WorkManager(DatabaseConnection):
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(query, (order_id, work_name.strip(), planned_hours))
+                publish_work_updates(cursor, "works.order_id = ? AND works.name = ?", (order_id, work_name.strip()))
                 connection.commit()
+        bump_data_versions("works")
+        works_cache.clear()
 
     def update_work(self, work_id: int, work_name: str, planned_hours: Decimal) -> None:
         query: str = "UPDATE works SET name = ?, planned_hours = ? WHERE id = ?"
@@ -22,7 +104,10 @@ class WorkManager(DatabaseConnection):
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(query, (work_name.strip(), planned_hours, work_id))
+                publish_work_updates(cursor, "works.id = ?", (work_id,))
                 connection.commit()
+        bump_data_versions("works")
+        works_cache.clear()
 
     def delete_work(self, work_id: int) -> None:
         query: str = "DELETE FROM works WHERE id = ?"
@@ -30,7 +115,10 @@ class WorkManager(DatabaseConnection):
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
                 cursor.execute(query, (work_id,))
+                publish_event(cursor, "work_deleted", {"work_id": work_id})
                 connection.commit()
+        bump_data_versions("works")
+        works_cache.clear()
 
     def work_exists(self, order_id: int, work_name: str, exclude_id: Optional[int] = None) -> bool:
         query: str = """
@@ -51,6 +139,7 @@ class WorkManager(DatabaseConnection):
                 record: Optional[Tuple[str]] = cursor.fetchone()
                 return record is not None
 
+    @replica_safe
     def get_works(
         self,
         order_id: Optional[int] = None,
@@ -58,16 +147,17 @@ class WorkManager(DatabaseConnection):
         work_name: Optional[str] = None,
         page: Optional[int] = None,
     ) -> List[Tuple[Any]]:
-        query: str = """
+        query: str = f"""
             SELECT
                 works.id,
                 orders.number,
                 works.name,
                 works.planned_hours,
-                works.spent_hours,
-                works.remaining_hours
+                {SPENT_HOURS_COLUMN} AS spent_hours,
+                {REMAINING_HOURS_COLUMN} AS remaining_hours
             FROM works
             JOIN orders ON works.order_id = orders.id
+            {PENDING_HOURS_JOIN}
         """
 
         conditions: List[str] = []
@@ -105,10 +195,17 @@ class WorkManager(DatabaseConnection):
                 return works
 
     def get_work_data_by_id(self, work_id: int) -> Optional[Dict[str, Union[str, int]]]:
-        query: str = """
-            SELECT id, order_id, name, planned_hours, spent_hours, remaining_hours
+        query: str = f"""
+            SELECT
+                works.id,
+                works.order_id,
+                works.name,
+                works.planned_hours,
+                {SPENT_HOURS_COLUMN} AS spent_hours,
+                {REMAINING_HOURS_COLUMN} AS remaining_hours
             FROM works
-            WHERE id = ?
+            {PENDING_HOURS_JOIN}
+            WHERE works.id = ?
         """
 
         with self.get_connection() as connection:
@@ -127,15 +224,16 @@ class WorkManager(DatabaseConnection):
                     }
 
     def get_works_for_order_by_number(self, order_number: str) -> List[Dict[str, Union[str, Decimal]]]:
-        query: str = """
+        query: str = f"""
             SELECT
                 works.id,
                 works.name,
                 works.planned_hours,
-                works.spent_hours,
-                works.remaining_hours
+                {SPENT_HOURS_COLUMN} AS spent_hours,
+                {REMAINING_HOURS_COLUMN} AS remaining_hours
             FROM works
             JOIN orders ON works.order_id = orders.id
+            {PENDING_HOURS_JOIN}
             WHERE orders.number = ?
         """
 
@@ -155,6 +253,89 @@ class WorkManager(DatabaseConnection):
                 ]
                 return works
 
+    def get_works_per_order(self, order_numbers: List[str]) -> Dict[str, List[WorkRow]]:
+        """
+        Returns works of several orders as rows of id, name, planned, spent and remaining hours.
+
+        Works of each order are cached in `works_cache` under versions of `WORKS_CACHE_TABLES`, so entries
+        written by any worker process are dropped once the versions change, and local writes invalidate
+        them at once. Only orders missing from the cache are queried, all of them with a single statement.
+
+        Args:
+            order_numbers (List[str]): Numbers of orders.
+
+        Returns:
+            works_per_order (Dict[str, List[WorkRow]]): Works rows per order number,
+                unknown orders and orders without works have empty list.
+        """
+
+        works_per_order: Dict[str, List[WorkRow]] = {}
+        missing_numbers: List[str] = []
+        # Read before the works, so that entries are never labeled with versions newer than their data
+        version: Tuple[int, ...] = tuple(data_versions.get_read_versions(WORKS_CACHE_TABLES).values())
+
+        for order_number in dict.fromkeys(number.strip() for number in order_numbers):
+            works: Optional[List[WorkRow]] = works_cache.get(order_number, version)
+            if works is None:
+                missing_numbers.append(order_number)
+            else:
+                works_per_order[order_number] = works
+
+        if not missing_numbers:
+            return works_per_order
+
+        query: str = f"""
+            SELECT
+                filters.order_number,
+                works.id,
+                works.name,
+                works.planned_hours,
+                {SPENT_HOURS_COLUMN} AS spent_hours,
+                {REMAINING_HOURS_COLUMN} AS remaining_hours
+            FROM orders
+            INNER JOIN {order_keys.name} AS filters ON orders.number = filters.order_number
+            INNER JOIN works ON works.order_id = orders.id
+            {PENDING_HOURS_JOIN}
+            ORDER BY filters.order_number, works.id
+        """
+
+        # Rows carry the staged key rather than orders.number, which may differ from the requested number
+        # in case or trailing spaces under the database collation
+        fetched_works: Dict[str, List[WorkRow]] = {order_number: [] for order_number in missing_numbers}
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                order_keys.stage(cursor, ((order_number,) for order_number in missing_numbers))
+                cursor.execute(query)
+                for order_number, *work in cursor.fetchall():
+                    fetched_works[order_number].append(tuple(work))
+
+        for order_number, works in fetched_works.items():
+            works_cache.set(order_number, works, version)
+
+        works_per_order.update(fetched_works)
+        return works_per_order
+
+    def get_works_by_ids(self, work_ids: List[int]) -> Dict[int, WorkKey]:
+        if not work_ids:
+            return {}
+
+        query: str = f"""
+            SELECT works.id, orders.number, orders.name, works.name
+            FROM works
+            JOIN orders ON works.order_id = orders.id
+            WHERE works.id IN (SELECT id FROM {work_ids_table.name})
+        """
+
+        with self.get_connection() as connection:
+            with connection.cursor() as cursor:
+                work_ids_table.stage(cursor, ((work_id,) for work_id in work_ids))
+                cursor.execute(query)
+                return {
+                    work_id: (order_number, order_name, work_name)
+                    for work_id, order_number, order_name, work_name in cursor.fetchall()
+                }
+
     def get_work_names_by_partial_match(self, query: str, order_id: int) -> List[str]:
 
         query_string: str = "SELECT name FROM works WHERE name LIKE ? AND order_id = ?"
@@ -165,14 +346,11 @@ class WorkManager(DatabaseConnection):
                 work_names: List[str] = [data[0] for data in cursor.fetchall()]
                 return work_names
 
+    @replica_safe
     def get_planned_hours_per_work(self, order_numbers: List[str], work_names: List[str]) -> List:
         if not order_numbers or not work_names:
             return []
 
-        pairs: List[Tuple[str, str]] = list(zip(order_numbers, work_names))
-
-        placeholders: str = ",".join(["(?, ?)" for _ in pairs])
-
         query: str = f"""
             SELECT
                 orders.number,
@@ -181,14 +359,13 @@ class WorkManager(DatabaseConnection):
                 works.planned_hours
             FROM orders
             INNER JOIN works ON orders.id = works.order_id
-            INNER JOIN (VALUES {placeholders}) AS filters(order_number, work_name)
+            INNER JOIN {work_keys.name} AS filters
             ON orders.number = filters.order_number AND works.name = filters.work_name
             ORDER BY orders.number, works.name
         """
 
-        params: List[str] = [item for pair in pairs for item in pair]
-
         with self.get_connection() as connection:
             with connection.cursor() as cursor:
-                cursor.execute(query, params)
+                work_keys.stage(cursor, zip(order_numbers, work_names))
+                cursor.execute(query)
                 return cursor.fetchall()
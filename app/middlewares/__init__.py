@@ -1,6 +1,12 @@
 from flask import Flask
 
+from .compression import compress_responses
+from .cross_origin import allow_cross_origin
 from .maintenance import check_maintenance
+from .profiling import profile_requests
+from .query_metrics import collect_query_metrics
+from .read_routing import route_reads
+from .static_assets import fingerprint_static_assets
 from .user_status import check_user_status
 
 
@@ -0,0 +1,76 @@
+import gzip
+from typing import Callable, Optional, Tuple
+
+from flask import Flask, request
+from werkzeug.wrappers import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES: Tuple[str, ...] = (
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "image/svg+xml",
+)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    encodings: Tuple[str, ...] = tuple(item.split(";")[0].strip() for item in accept_encoding.lower().split(","))
+    if brotli is not None and "br" in encodings:
+        return "br"
+    if "gzip" in encodings:
+        return "gzip"
+    return None
+
+
+def compress_responses(app: Flask) -> Callable:
+    """
+    Compresses text responses above `COMPRESSION_MIN_SIZE` bytes with brotli (when the optional
+    `brotli` package is installed) or gzip, depending on the Accept-Encoding request header.
+    """
+
+    @app.after_request
+    def compress(response: Response) -> Response:
+        if (
+            response.status_code != 200
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+            or response.is_streamed
+            and not response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or request.method == "HEAD"
+        ):
+            return response
+
+        encoding: Optional[str] = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        response.vary.add("Accept-Encoding")
+
+        if encoding is None:
+            return response
+
+        # Static files are sent as file wrappers, read them to compress the content.
+        response.direct_passthrough = False
+        data: bytes = response.get_data()
+
+        if len(data) < app.config["COMPRESSION_MIN_SIZE"]:
+            return response
+
+        if encoding == "br":
+            response.set_data(brotli.compress(data, quality=app.config["COMPRESSION_LEVEL"]))
+        else:
+            response.set_data(gzip.compress(data, compresslevel=app.config["COMPRESSION_LEVEL"]))
+
+        response.headers["Content-Encoding"] = encoding
+
+        # Compressed body differs from the original one, but it is semantically equivalent.
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    return compress
@@ -0,0 +1,22 @@
+from typing import Callable, Optional, Sequence
+
+from flask import Flask, request
+from werkzeug.wrappers import Response
+
+
+def allow_cross_origin(app: Flask, origins: Sequence[str]) -> Callable:
+    """
+    Lets pages of the given origins read responses with credentials (session cookie), as pages of
+    the main server do reading live updates from the events server.
+    """
+
+    @app.after_request
+    def add_cross_origin_headers(response: Response) -> Response:
+        origin: Optional[str] = request.headers.get("Origin")
+        if origin in origins:
+            response.headers["Access-Control-Allow-Origin"] = origin
+            response.headers["Access-Control-Allow-Credentials"] = "true"
+        response.vary.add("Origin")
+        return response
+
+    return add_cross_origin_headers
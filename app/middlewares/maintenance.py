@@ -1,17 +1,24 @@
 from typing import Callable, Optional, Tuple
 
 from flask import Flask, render_template, request
+from flask_login import current_user
+
+from app.db import db_manager
 
 
 def check_maintenance(app: Flask) -> Callable:
     @app.before_request
     def wrapper() -> Optional[str]:
-        MAINTENANCE_MODE = app.config.get("MAINTENANCE_MODE", False)
+        excluded_routes: Tuple[str] = ("/static", "/logout", "/health")
+
+        if request.path == "/" or request.path.startswith(excluded_routes):
+            return None
 
-        excluded_routes: Tuple[str] = ("/static", "/logout")
+        # Administrators keep access to switch maintenance mode off.
+        if current_user.is_authenticated and current_user.is_admin:
+            return None
 
-        if MAINTENANCE_MODE:
-            if request.path != "/" and not request.path.startswith(excluded_routes):
-                return render_template("maintenance/maintenance.html"), 503
+        if db_manager.settings.is_maintenance_enabled():
+            return render_template("maintenance/maintenance.html"), 503
 
     return wrapper
@@ -0,0 +1,39 @@
+from typing import Callable, Optional
+
+from flask import Flask, g, request
+from flask_login import current_user
+from werkzeug.wrappers import Response
+
+from app.utils.profiler import RequestProfiler
+
+
+def profile_requests(app: Flask) -> Callable:
+    @app.before_request
+    def start_profiling() -> None:
+        mode: Optional[str] = request.headers.get("X-Profile") or request.args.get("profile")
+
+        if not mode or not current_user.is_authenticated or not current_user.is_admin:
+            return
+
+        profiler: RequestProfiler = RequestProfiler(
+            directory=app.config["PROFILES_DIR"],
+            name=request.endpoint or "unknown",
+            trace_memory=mode == "memory" or bool(request.args.get("export")),
+        )
+        if profiler.start():
+            g.profiler = profiler
+
+    @app.after_request
+    def stop_profiling(response: Response) -> Response:
+        profiler: Optional[RequestProfiler] = g.pop("profiler", None)
+        if profiler is not None:
+            response.headers["X-Profile-Id"] = profiler.stop()
+        return response
+
+    @app.teardown_request
+    def release_profiler(error: Optional[BaseException]) -> None:
+        profiler: Optional[RequestProfiler] = g.pop("profiler", None)
+        if profiler is not None:
+            profiler.stop()
+
+    return stop_profiling
@@ -0,0 +1,55 @@
+import time
+from typing import Callable, Optional
+
+from flask import Flask, g, request
+from werkzeug.wrappers import Response
+
+from app.db.instrumentation import RequestQueryStats, request_stats
+from app.db.metrics import Counter, Histogram, registry
+
+requests_total: Counter = registry.counter("http_requests_total", "Number of served HTTP requests.")
+request_duration: Histogram = registry.histogram("http_request_duration_seconds", "Duration of HTTP requests.")
+request_queries: Histogram = registry.histogram(
+    "http_request_db_queries",
+    "Number of SQL statements per HTTP request.",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+
+def collect_query_metrics(app: Flask) -> Callable:
+    @app.before_request
+    def start_collection() -> None:
+        g.request_started = time.perf_counter()
+        request_stats.set(RequestQueryStats())
+
+    @app.after_request
+    def finish_collection(response: Response) -> Response:
+        stats: Optional[RequestQueryStats] = request_stats.get()
+        started: Optional[float] = g.get("request_started")
+
+        if stats is None or started is None:
+            return response
+
+        duration: float = time.perf_counter() - started
+        endpoint: str = request.endpoint or "unknown"
+
+        requests_total.inc(endpoint=endpoint, method=request.method, status=str(response.status_code))
+        request_duration.observe(duration, endpoint=endpoint)
+        request_queries.observe(stats.queries_count, endpoint=endpoint)
+
+        response.headers.add(
+            "Server-Timing",
+            'db;dur={:.2f};desc="{} queries, {} rows", app;dur={:.2f}'.format(
+                stats.duration_ms,
+                stats.queries_count,
+                stats.rows_count,
+                duration * 1000 - stats.duration_ms,
+            ),
+        )
+        return response
+
+    @app.teardown_request
+    def reset_collection(error: Optional[BaseException]) -> None:
+        request_stats.set(None)
+
+    return finish_collection
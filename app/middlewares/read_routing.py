@@ -0,0 +1,39 @@
+import time
+from typing import Callable, Tuple
+
+from decouple import config
+from flask import Flask, request, session
+from werkzeug.wrappers import Response
+
+from app.db.routing import pin_to_primary
+
+DB_READ_AFTER_WRITE_WINDOW: float = config("DB_READ_AFTER_WRITE_WINDOW", default=10, cast=float)
+SAFE_METHODS: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS")
+
+
+def route_reads(app: Flask) -> Callable:
+    """
+    Preserves read-your-writes while replica-safe reads are routed to the read-only database.
+
+    Requests which may write (POST and other unsafe methods) read only from the primary database.
+    The time of the last such request is kept in the session, and requests of the same user within
+    `DB_READ_AFTER_WRITE_WINDOW` seconds after it (for example, the page shown by the redirect after
+    a form submission) are pinned to the primary too, so that replication lag does not hide the user's changes.
+    """
+
+    @app.before_request
+    def pin_reads() -> None:
+        if request.method not in SAFE_METHODS:
+            pin_to_primary()
+            return
+
+        last_write_at: float = session.get("last_write_at", 0)
+        pin_to_primary(time.time() - last_write_at < DB_READ_AFTER_WRITE_WINDOW)
+
+    @app.after_request
+    def remember_write(response: Response) -> Response:
+        if request.method not in SAFE_METHODS:
+            session["last_write_at"] = time.time()
+        return response
+
+    return pin_reads
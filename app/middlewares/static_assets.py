@@ -0,0 +1,51 @@
+from typing import Any, Callable, Dict, Set, Tuple
+
+import click
+from flask import Flask, request
+from werkzeug.wrappers import Response
+
+from app.utils.assets import ASSETS_DIRECTORY, AssetsBuilder, load_manifest
+
+IMMUTABLE_CACHE_CONTROL: str = "public, max-age=31536000, immutable"
+# Service workers registered for the whole site, while their scripts are served from the static folder
+SERVICE_WORKER_FILES: Tuple[str, ...] = ("js/task_queue_worker.js",)
+
+
+def fingerprint_static_assets(app: Flask) -> Callable:
+    """
+    Makes `url_for("static", ...)` return hashed file names built by `flask build-assets`
+    and serves hashed files with far-future immutable caching.
+
+    Without built manifest static files are served under their original names.
+
+    Scripts of `SERVICE_WORKER_FILES` are sent with `Service-Worker-Allowed: /`, so that they may control
+    pages outside of the static folder.
+    """
+
+    manifest: Dict[str, str] = load_manifest(app.static_folder)
+    service_worker_files: Set[str] = set(SERVICE_WORKER_FILES)
+    service_worker_files.update(
+        f"{ASSETS_DIRECTORY}/{manifest[filename]}" for filename in SERVICE_WORKER_FILES if filename in manifest
+    )
+
+    @app.url_defaults
+    def use_hashed_filename(endpoint: str, values: Dict[str, Any]) -> None:
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = f"{ASSETS_DIRECTORY}/{manifest[values['filename']]}"
+
+    @app.after_request
+    def cache_hashed_files(response: Response) -> Response:
+        if request.endpoint == "static" and response.status_code in (200, 304):
+            filename: str = (request.view_args or {}).get("filename", "")
+            if filename.startswith(ASSETS_DIRECTORY + "/"):
+                response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+            if filename in service_worker_files:
+                response.headers["Service-Worker-Allowed"] = "/"
+        return response
+
+    @app.cli.command("build-assets")
+    def build_assets() -> None:
+        built_manifest: Dict[str, str] = AssetsBuilder(app.static_folder).build()
+        click.echo(f"Built {len(built_manifest)} static files into {ASSETS_DIRECTORY}/")
+
+    return cache_hashed_files
@@ -3,11 +3,9 @@ from typing import Callable, Optional
 from flask import Flask, flash, redirect, url_for
 from flask_login import current_user, logout_user
 
-from app.db import DatabaseManager
+from app.db import db_manager
 from app.utils import MESSAGES
 
-db_manager: DatabaseManager = DatabaseManager()
-
 
 def check_user_status(app: Flask) -> Callable:
     @app.before_request
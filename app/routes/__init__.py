@@ -3,6 +3,8 @@ from flask import Flask
 from .auth import auth_bp
 from .control import control_bp
 from .employees import employees_bp
+from .events import events_bp
+from .health import health_bp
 from .orders import orders_bp
 from .tasks import tasks_bp
 
@@ -11,5 +13,7 @@ def register_routes(app: Flask) -> None:
     app.register_blueprint(control_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(employees_bp)
+    app.register_blueprint(events_bp)
+    app.register_blueprint(health_bp)
     app.register_blueprint(orders_bp)
     app.register_blueprint(tasks_bp)
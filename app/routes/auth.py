@@ -4,12 +4,11 @@ from flask import Blueprint, flash, redirect, render_template, request, session,
 from flask_login import current_user, login_user, logout_user
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
+from app.db import db_manager
 from app.models import User
 from app.utils import MESSAGES
 
 auth_bp: Blueprint = Blueprint("auth", __name__)
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @auth_bp.route("/", methods=["GET", "POST"])
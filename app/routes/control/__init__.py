@@ -1,40 +1,60 @@
-from typing import Dict
+from typing import Dict, Union
 
-from flask import Blueprint, render_template
+from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
+from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
-from app.utils import permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, admin_required, permission_required
 
+from .changes import changes_bp
 from .employees import employees_bp
 from .hours import hours_bp
 from .logs import logs_bp
+from .metrics import metrics_bp
 from .orders import orders_bp
+from .pivot import pivot_bp
+from .profiles import profiles_bp
 from .reports import reports_bp
 from .users import users_bp
 from .works import works_bp
 
 control_bp: Blueprint = Blueprint("control", __name__, url_prefix="/control")
 
+control_bp.register_blueprint(changes_bp)
 control_bp.register_blueprint(employees_bp)
 control_bp.register_blueprint(hours_bp)
 control_bp.register_blueprint(logs_bp)
+control_bp.register_blueprint(metrics_bp)
 control_bp.register_blueprint(orders_bp)
+control_bp.register_blueprint(pivot_bp)
+control_bp.register_blueprint(profiles_bp)
 control_bp.register_blueprint(reports_bp)
 control_bp.register_blueprint(users_bp)
 control_bp.register_blueprint(works_bp)
 
-db_manager: DatabaseManager = DatabaseManager()
-
 
 @control_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
 def index() -> str:
-    context: Dict[str, int] = {
+    context: Dict[str, Union[str, int, bool]] = {
         "user_name": current_user.name,
         "orders_count": db_manager.orders.get_orders_count(),
         "employees_count": db_manager.employees.get_employees_count(),
         "tasks_count": db_manager.tasks.get_tasks_count(),
+        "maintenance_enabled": db_manager.settings.is_maintenance_enabled(),
     }
     return render_template("control/index.html", **context)
+
+
+@control_bp.route("/maintenance", methods=["POST"])
+@login_required
+@admin_required
+def toggle_maintenance() -> Response:
+    enabled: bool = request.form.get("enabled") == "1"
+    db_manager.settings.set_maintenance_enabled(enabled)
+
+    message_key: str = "maintenance_enabled" if enabled else "maintenance_disabled"
+    flash(message=MESSAGES["maintenance"][message_key], category="warning" if enabled else "info")
+    return redirect(url_for("control.index"))
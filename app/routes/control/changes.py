@@ -0,0 +1,77 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from decouple import config
+from flask import Blueprint, Response, jsonify, request
+from flask_login import login_required
+
+from app.db import db_manager
+from app.db.change_feed import CHANGE_ENTITIES, Change
+from app.utils import MESSAGES, generate_json, generate_ndjson, permission_required
+
+CHANGES_PAGE_SIZE: int = config("CHANGES_PAGE_SIZE", default=1000, cast=int)
+CHANGES_MAX_PAGE_SIZE: int = 10000
+CHANGES_CHUNK_SIZE: int = 500
+
+changes_bp: Blueprint = Blueprint("changes", __name__, url_prefix="/changes")
+
+
+@changes_bp.route("", methods=["GET"])
+@login_required
+@permission_required(["advanced"])
+def get_changes() -> Union[Response, Tuple[Response, int]]:
+    """
+    Returns task and work changes of the `consumer` following the watermark `after` (the consumer's
+    acknowledged watermark by default) as JSON (`format=json`, default) or newline-delimited JSON
+    (`format=ndjson`): a header with the new `watermark` and `has_more`, then change records.
+    Responds 410 with the current watermark when the consumer has to resynchronize from a full export.
+    """
+
+    consumer: str = request.args.get("consumer", "").strip()
+    after: Optional[int] = request.args.get("after", type=int)
+    limit: int = request.args.get("limit", CHANGES_PAGE_SIZE, type=int)
+    entities: List[str] = request.args.getlist("entities[]") or list(CHANGE_ENTITIES)
+    output_format: str = request.args.get("format", "json")
+
+    if (
+        not consumer
+        or after is not None
+        and after < 0
+        or not 0 < limit <= CHANGES_MAX_PAGE_SIZE
+        or set(entities) - set(CHANGE_ENTITIES)
+        or output_format not in ("json", "ndjson")
+    ):
+        return jsonify({"error": MESSAGES["changes"]["invalid_query"]}), 400
+
+    result: Optional[Tuple[List[Change], int, bool]] = db_manager.changes.get_changes(consumer, after, limit, entities)
+    if result is None:
+        watermark: int = db_manager.events.get_last_event_id()
+        return jsonify({"error": MESSAGES["changes"]["expired"], "watermark": watermark}), 410
+
+    changes, watermark, has_more = result
+    header: Dict[str, Any] = {"consumer": consumer, "watermark": watermark, "has_more": has_more}
+
+    if output_format == "ndjson":
+        return Response(generate_ndjson(header, changes, CHANGES_CHUNK_SIZE), mimetype="application/x-ndjson")
+    return Response(generate_json(header, "changes", changes, CHANGES_CHUNK_SIZE), mimetype="application/json")
+
+
+@changes_bp.route("/ack", methods=["POST"])
+@login_required
+@permission_required(["advanced"])
+def acknowledge_changes() -> Union[Response, Tuple[Response, int]]:
+    """
+    Stores the `watermark` of the `consumer` after it has applied the changes, so that the next request
+    without `after` continues from it and events before it may be cleaned up.
+    """
+
+    data: Dict[str, Any] = request.get_json(silent=True) or request.form
+    consumer: str = str(data.get("consumer", "")).strip()
+
+    try:
+        watermark: int = int(data.get("watermark"))
+        if not consumer:
+            raise ValueError("Consumer is required")
+        db_manager.changes.acknowledge(consumer, watermark)
+    except (TypeError, ValueError):
+        return jsonify({"error": MESSAGES["changes"]["invalid_query"]}), 400
+    return jsonify({"consumer": consumer, "watermark": watermark})
@@ -4,16 +4,16 @@ from flask import Blueprint, flash, jsonify, redirect, render_template, request,
 from flask_login import login_required
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, permission_required
 
 employees_bp: Blueprint = Blueprint("employees", __name__, url_prefix="/employees")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @employees_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
+@conditional_response("employees")
 def employees_table() -> Response:
     employee_name: str = request.args.get("employee_name")
     personnel_number: str = request.args.get("personnel_number")
@@ -47,6 +47,7 @@ def employees_table() -> Response:
 
 @employees_bp.route("/names", methods=["GET"])
 @login_required
+@conditional_response("employees")
 def get_employee_names() -> Response:
     query: str = request.args.get("query", "")
     employee_names: List[str] = db_manager.employees.get_employee_names_by_partial_match(query)
@@ -55,6 +56,7 @@ def get_employee_names() -> Response:
 
 @employees_bp.route("/numbers", methods=["GET"])
 @login_required
+@conditional_response("employees")
 def get_personnel_numbers() -> Response:
     query: str = request.args.get("query", "")
     personnel_numbers: List[str] = db_manager.employees.get_personnel_numbers_by_partial_match(query)
@@ -63,6 +65,7 @@ def get_personnel_numbers() -> Response:
 
 @employees_bp.route("/<string:personnel_number>/name", methods=["GET"])
 @login_required
+@conditional_response("employees")
 def get_employee_name(personnel_number: str) -> Response:
     employee_name: str = db_manager.employees.get_employee_name_by_number(personnel_number)
     return jsonify({"employee_name": employee_name})
@@ -70,6 +73,7 @@ def get_employee_name(personnel_number: str) -> Response:
 
 @employees_bp.route("/<string:employee_name>/number", methods=["GET"])
 @login_required
+@conditional_response("employees")
 def get_personnel_number(employee_name: str) -> Response:
     personnel_number: str = db_manager.employees.get_personnel_number_by_name(employee_name)
     return jsonify({"personnel_number": personnel_number})
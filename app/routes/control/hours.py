@@ -4,11 +4,10 @@ from typing import Dict, List, Tuple, Union
 from flask import Blueprint, Response, flash, redirect, render_template, request, url_for
 from flask_login import login_required
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, permission_required
 
 hours_bp: Blueprint = Blueprint("hours", __name__, url_prefix="/hours")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @hours_bp.route("/add", methods=["GET", "POST"])
@@ -42,6 +41,7 @@ def delete_hours(hours_id: int, order_number: str, work_name: str) -> Response:
 @hours_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
+@conditional_response("hours")
 def hours_table() -> str:
     hours_list: List[Tuple[str]] = db_manager.hours.get_hours_list()
 
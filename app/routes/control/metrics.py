@@ -0,0 +1,14 @@
+from flask import Blueprint, Response
+from flask_login import login_required
+
+from app.db.metrics import registry
+from app.utils import admin_required
+
+metrics_bp: Blueprint = Blueprint("metrics", __name__, url_prefix="/metrics")
+
+
+@metrics_bp.route("", methods=["GET"])
+@login_required
+@admin_required
+def metrics() -> Response:
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -1,21 +1,20 @@
 from decimal import Decimal
 from typing import Dict, List, Tuple, Union
 
-import pandas
 from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import login_required
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, permission_required
 
 orders_bp: Blueprint = Blueprint("orders", __name__, url_prefix="/orders")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @orders_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
+@conditional_response("orders")
 def orders_table() -> str:
     order_number: str = request.args.get("order_number")
     order_name: str = request.args.get("order_name")
@@ -71,6 +70,8 @@ def add_order() -> str:
         order_id: int = db_manager.orders.add_order(**args)
 
         if file_upload:
+            import pandas
+
             dataframe: pandas.DataFrame = pandas.read_excel(file_upload, header=None)
 
             for work_name, planned_hours in dataframe.itertuples(index=False, name=None):
@@ -146,6 +147,7 @@ def delete_order(order_id: int) -> Response:
 
 @orders_bp.route("/names", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_names() -> Response:
     query: str = request.args.get("query", "")
     order_names: List[str] = db_manager.orders.get_order_names_by_partial_match(query)
@@ -154,6 +156,7 @@ def get_order_names() -> Response:
 
 @orders_bp.route("/numbers", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_numbers() -> Response:
     query: str = request.args.get("query", "")
     order_numbers: List[str] = db_manager.orders.get_order_numbers_by_partial_match(query)
@@ -162,6 +165,7 @@ def get_order_numbers() -> Response:
 
 @orders_bp.route("/<string:order_number>/name", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_name(order_number: str) -> Response:
     order_name: str = db_manager.orders.get_order_name_by_number(order_number)
     return jsonify({"order_name": order_name})
@@ -169,6 +173,7 @@ def get_order_name(order_number: str) -> Response:
 
 @orders_bp.route("/<string:order_name>/number", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_number(order_name: str) -> Response:
     order_number: str = db_manager.orders.get_order_number_by_name(order_name)
     return jsonify({"order_number": order_number})
@@ -0,0 +1,54 @@
+from typing import Dict, List, Tuple, Union
+
+from decouple import config
+from flask import Blueprint, Response, jsonify, request
+from flask_login import login_required
+
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, generate_json, generate_ndjson, permission_required
+
+PIVOT_MAX_ROWS: int = config("PIVOT_MAX_ROWS", default=50000, cast=int)
+PIVOT_CHUNK_SIZE: int = 1000
+
+pivot_bp: Blueprint = Blueprint("pivot", __name__, url_prefix="/pivot")
+
+
+@pivot_bp.route("", methods=["GET"])
+@login_required
+@permission_required(["advanced"])
+@conditional_response("tasks", "works")
+def pivot() -> Union[Response, Tuple[Response, int]]:
+    """
+    Returns tasks hours grouped by `dimensions[]` with `measures[]` as JSON (`format=json`, default)
+    or newline-delimited JSON (`format=ndjson`), streamed in chunks. Filters are the same as in the tasks table.
+    """
+
+    filters: Dict[str, Union[str, List[str]]] = {
+        "departments": request.args.getlist("departments[]"),
+        "start_date": request.args.get("start_date"),
+        "end_date": request.args.get("end_date"),
+        "employee_data": request.args.get("employee_data"),
+        "order_number": request.args.get("order_number"),
+        "work_name": request.args.get("work_name"),
+        "order_name": request.args.get("order_name"),
+    }
+    output_format: str = request.args.get("format", "json")
+    limit: int = min(request.args.get("limit", PIVOT_MAX_ROWS, type=int), PIVOT_MAX_ROWS)
+
+    if output_format not in ("json", "ndjson") or limit <= 0:
+        return jsonify({"error": MESSAGES["pivot"]["invalid_query"]}), 400
+
+    try:
+        columns, rows, truncated = db_manager.pivot.get_pivot(
+            dimensions=request.args.getlist("dimensions[]"),
+            measures=request.args.getlist("measures[]") or ["hours"],
+            filters=filters,
+            limit=limit,
+        )
+    except ValueError:
+        return jsonify({"error": MESSAGES["pivot"]["invalid_query"]}), 400
+
+    header: Dict[str, Union[List[str], bool]] = {"columns": columns, "truncated": truncated}
+    if output_format == "ndjson":
+        return Response(generate_ndjson(header, rows, PIVOT_CHUNK_SIZE), mimetype="application/x-ndjson")
+    return Response(generate_json(header, "rows", rows, PIVOT_CHUNK_SIZE), mimetype="application/json")
@@ -0,0 +1,30 @@
+import re
+from typing import Dict, List
+
+from flask import Blueprint, abort, current_app, jsonify, send_from_directory
+from flask_login import login_required
+from werkzeug.wrappers import Response
+
+from app.utils import admin_required
+from app.utils.profiler import PROFILE_EXTENSIONS, get_profiles
+
+profiles_bp: Blueprint = Blueprint("profiles", __name__, url_prefix="/profiles")
+
+
+@profiles_bp.route("", methods=["GET"])
+@login_required
+@admin_required
+def profiles_list() -> Response:
+    profiles: List[Dict[str, object]] = get_profiles(current_app.config["PROFILES_DIR"])
+    return jsonify(profiles)
+
+
+@profiles_bp.route("/<string:profile_id>/<string:kind>", methods=["GET"])
+@login_required
+@admin_required
+def download_profile(profile_id: str, kind: str) -> Response:
+    if kind not in PROFILE_EXTENSIONS or not re.fullmatch(r"[\w-]+", profile_id):
+        abort(404)
+
+    filename: str = profile_id + PROFILE_EXTENSIONS[kind]
+    return send_from_directory(current_app.config["PROFILES_DIR"], filename, as_attachment=True)
@@ -6,14 +6,15 @@ from typing import Dict, List, Union
 from flask import Blueprint, render_template, request, send_file
 from flask_login import login_required
 
-from app.db import DatabaseManager
-from app.utils import get_report_file, permission_required
+from app.db import db_manager
+from app.db.employee_manager import Timesheet
+from app.db.task_columns import TaskColumns
+from app.utils import get_report_file, get_timesheet_file, permission_required
 
 Tasks = List[Dict[str, Union[str, Decimal]]]
 Data = List[List[Union[str, Decimal]]]
 
 reports_bp: Blueprint = Blueprint("reports", __name__, url_prefix="/reports")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @reports_bp.route("", methods=["GET"])
@@ -28,24 +29,38 @@ def reports() -> str:
     if end_date:
         end_date: Union[str, datetime] = datetime.strptime(end_date, "%Y-%m-%d")
 
-    if request.args.get("export"):
+    if request.args.get("export") == "timesheet":
         tasks: Tasks = db_manager.tasks.get_tasks(start_date=start_date, end_date=end_date)
+        timesheets: List[Timesheet] = db_manager.employees.get_timesheet_data(tasks=tasks)
+
+        file: BytesIO = get_timesheet_file(timesheets)
+        timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        return send_file(file, download_name=f"timesheet_{timestamp}.xlsx", as_attachment=True)
+
+    if request.args.get("export"):
+        # Columns of the tasks are interned once and shared by all aggregations of the report
+        tasks: TaskColumns = TaskColumns(db_manager.tasks.get_tasks(start_date=start_date, end_date=end_date))
 
         tasks_data: Data = db_manager.tasks.get_tasks_data(tasks=tasks)
         employees_data: Data = db_manager.employees.get_employees_data(tasks=tasks)
+        timesheets: List[Timesheet] = db_manager.employees.get_timesheet_data(tasks=tasks)
+        # Orders and works sheets are grouped by cube dimensions and read from the task cube
         basic_orders_data: Data = db_manager.orders.get_basic_orders_data(
-            tasks=tasks,
             start_date=start_date,
             end_date=end_date,
             extended=True,
         )
-        detailed_orders_data: Data = db_manager.orders.get_detailed_orders_data(tasks=tasks)
+        detailed_orders_data: Data = db_manager.orders.get_detailed_orders_data(
+            start_date=start_date,
+            end_date=end_date,
+        )
 
         file: BytesIO = get_report_file(
             tasks_data=tasks_data,
             employees_data=employees_data,
             basic_orders_data=basic_orders_data,
             detailed_orders_data=detailed_orders_data,
+            timesheets=timesheets,
         )
         timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         return send_file(file, download_name=f"{timestamp}.xlsx", as_attachment=True)
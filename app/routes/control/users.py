@@ -5,16 +5,16 @@ from flask import Blueprint, flash, jsonify, redirect, render_template, request,
 from flask_login import login_required
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, permission_required
 
 users_bp: Blueprint = Blueprint("users", __name__, url_prefix="/users")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @users_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
+@conditional_response("users")
 def users_table() -> str:
     user_name: str = request.args.get("user_name")
     user_login: str = request.args.get("user_login")
@@ -169,6 +169,7 @@ def reset_user_password(user_id: int) -> Response:
 
 @users_bp.route("/names", methods=["GET"])
 @login_required
+@conditional_response("users")
 def get_user_names() -> Response:
     query: str = request.args.get("query", "")
     user_names: List[str] = db_manager.users.get_user_names_by_partial_match(query)
@@ -177,6 +178,7 @@ def get_user_names() -> Response:
 
 @users_bp.route("/logins", methods=["GET"])
 @login_required
+@conditional_response("users")
 def get_user_logins() -> Response:
     query: str = request.args.get("query", "")
     user_logins: List[str] = db_manager.users.get_user_logins_by_partial_match(query)
@@ -185,6 +187,7 @@ def get_user_logins() -> Response:
 
 @users_bp.route("/<string:user_login>/name", methods=["GET"])
 @login_required
+@conditional_response("users")
 def get_user_name(user_login: str) -> Response:
     user_name: str = db_manager.users.get_user_name_by_login(user_login)
     return jsonify({"user_name": user_name})
@@ -192,6 +195,7 @@ def get_user_name(user_login: str) -> Response:
 
 @users_bp.route("/<string:user_name>/login", methods=["GET"])
 @login_required
+@conditional_response("users")
 def get_user_login(user_name: str) -> Response:
     user_login: str = db_manager.users.get_user_login_by_name(user_name)
     return jsonify({"user_login": user_login})
@@ -4,16 +4,16 @@ from typing import Dict, List, Tuple, Union
 from flask import Blueprint, Response, flash, jsonify, redirect, render_template, request, url_for
 from flask_login import login_required
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, permission_required
+from app.db import db_manager
+from app.utils import MESSAGES, conditional_response, permission_required
 
 works_bp: Blueprint = Blueprint("works", __name__, url_prefix="/works")
-db_manager: DatabaseManager = DatabaseManager()
 
 
 @works_bp.route("", methods=["GET"])
 @login_required
 @permission_required(["advanced"])
+@conditional_response("works", "orders")
 def works_table() -> str:
     order_id: int = request.args.get("order_id", type=int)
 
@@ -132,6 +132,7 @@ def delete_work(work_id: int) -> Response:
 
 @works_bp.route("/names", methods=["GET"])
 @login_required
+@conditional_response("works", "orders")
 def get_work_names() -> Response:
     query: str = request.args.get("query", "")
     order_number: str = request.args.get("order_number", "")
@@ -0,0 +1,178 @@
+import json
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
+
+from decouple import config
+from flask import Blueprint, Response, jsonify, request
+from flask_login import login_required
+
+from app.db import db_manager
+from app.db.event_manager import Event
+from app.utils import MESSAGES
+from app.utils.event_hub import Subscription, event_hub
+
+SSE_HEARTBEAT_INTERVAL: float = config("SSE_HEARTBEAT_INTERVAL", default=15, cast=float)
+SSE_STREAM_DURATION: float = config("SSE_STREAM_DURATION", default=300, cast=float)
+SSE_RETRY_MS: int = 3000
+EVENTS_LONG_POLL_TIMEOUT: float = config("EVENTS_LONG_POLL_TIMEOUT", default=20, cast=float)
+EVENTS_RETRY_AFTER: int = config("EVENTS_RETRY_AFTER", default=30, cast=int)
+LONG_POLL_MAX_EVENTS: int = 500
+
+TASK_EVENTS: Tuple[str, ...] = ("task_added", "task_updated", "task_deleted")
+
+TaskMatcher = Callable[[Dict[str, Any]], bool]
+
+events_bp: Blueprint = Blueprint("events", __name__, url_prefix="/events")
+
+
+def get_stream_filters() -> Dict[str, Union[str, List[str]]]:
+    return {
+        "departments": request.args.getlist("departments[]"),
+        "start_date": request.args.get("start_date"),
+        "end_date": request.args.get("end_date"),
+        "employee_data": request.args.get("employee_data"),
+        "order_number": request.args.get("order_number"),
+        "work_name": request.args.get("work_name"),
+        "order_name": request.args.get("order_name"),
+    }
+
+
+def filter_event(event: Event, task_matcher: TaskMatcher) -> Optional[Event]:
+    """
+    Returns task event marked with `matched` and `previous_matched` flags telling whether the task
+    (before and after the change) matches the subscriber's filters, or None if neither does.
+    Other events are returned unchanged.
+    """
+
+    event_id, event_type, payload = event
+    if event_type not in TASK_EVENTS:
+        return event
+
+    matched: bool = payload.get("task") is not None and task_matcher(payload["task"])
+    previous_matched: bool = payload.get("previous_task") is not None and task_matcher(payload["previous_task"])
+
+    if not matched and not previous_matched:
+        return None
+    return event_id, event_type, dict(payload, matched=matched, previous_matched=previous_matched)
+
+
+def format_event(event: Event) -> str:
+    event_id, event_type, payload = event
+    data: str = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    # The id is the resume point of the browser, which must not skip events committed late
+    return f"id: {event_hub.get_cursor(event_id)}\nevent: {event_type}\ndata: {data}\n\n"
+
+
+def get_busy_response() -> Tuple[Response, int]:
+    response: Response = jsonify({"error": MESSAGES["events"]["busy"]})
+    response.headers["Retry-After"] = str(EVENTS_RETRY_AFTER)
+    return response, 503
+
+
+def stream_events(
+    subscription: Subscription,
+    task_matcher: TaskMatcher,
+    event_types: List[str],
+) -> Generator[str, None, None]:
+    finish_at: float = time.monotonic() + SSE_STREAM_DURATION
+
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+
+    # Stream is closed periodically, so that a request thread is not held forever;
+    # browser reconnects automatically and continues from the Last-Event-ID.
+    while time.monotonic() < finish_at and not subscription.overflowed:
+        event: Optional[Event] = subscription.get(timeout=SSE_HEARTBEAT_INTERVAL)
+
+        if event is None:
+            yield ": heartbeat\n\n"
+        elif not event_types or event[1] in event_types:
+            filtered_event: Optional[Event] = filter_event(event, task_matcher)
+            if filtered_event is not None:
+                yield format_event(filtered_event)
+
+
+@events_bp.route("/stream", methods=["GET"])
+@login_required
+def stream() -> Union[Response, Tuple[Response, int]]:
+    """
+    Streams events as server-sent events. On the main server a stream holds a worker thread for up to
+    `SSE_STREAM_DURATION`, so pages open it only while a live view is visible (works modal) and use
+    `/events/poll` otherwise; the events server (`create_events_app`) waits in greenlets instead.
+    """
+
+    if not event_hub.acquire_stream():
+        return get_busy_response()
+
+    header: Optional[str] = request.headers.get("Last-Event-ID")
+    last_event_id: Optional[int] = int(header) if header and header.isdigit() else None
+
+    # Filters are resolved once per subscription, not for every event
+    task_matcher: TaskMatcher = db_manager.tasks.get_task_matcher(**get_stream_filters())
+    subscription: Subscription = event_hub.subscribe(last_event_id)
+
+    def close() -> None:
+        event_hub.unsubscribe(subscription)
+        event_hub.release_stream()
+
+    response: Response = Response(
+        stream_events(subscription, task_matcher, request.args.getlist("events[]")),
+        mimetype="text/event-stream",
+    )
+    # Called by the server when the response is closed, even if the stream has not been started
+    response.call_on_close(close)
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@events_bp.route("/poll", methods=["GET"])
+@login_required
+def poll() -> Union[Response, Tuple[Response, int]]:
+    """
+    Long polling of events following `after`: waits up to `EVENTS_LONG_POLL_TIMEOUT` seconds for events,
+    then returns them with `last_event_id` to pass as `after` of the next request. Events committed late
+    may be returned again by the next request, so clients skip ids they have already applied.
+    Without `after`, returns at once the current last event id to start from.
+    """
+
+    after: Optional[int] = request.args.get("after", type=int)
+    if after is None:
+        return jsonify({"last_event_id": db_manager.events.get_last_event_id(), "events": []})
+
+    if not event_hub.acquire_stream():
+        return get_busy_response()
+
+    try:
+        task_matcher: TaskMatcher = db_manager.tasks.get_task_matcher(**get_stream_filters())
+        event_types: List[str] = request.args.getlist("events[]")
+        subscription: Subscription = event_hub.subscribe(after)
+
+        try:
+            events: List[Event] = []
+            last_event_id: int = after
+            timeout: float = EVENTS_LONG_POLL_TIMEOUT
+
+            while len(events) < LONG_POLL_MAX_EVENTS:
+                event: Optional[Event] = subscription.get(timeout=timeout)
+                if event is None:
+                    break
+                last_event_id = max(last_event_id, event[0])
+                if not event_types or event[1] in event_types:
+                    filtered_event: Optional[Event] = filter_event(event, task_matcher)
+                    if filtered_event is not None:
+                        events.append(filtered_event)
+                        # Once there is something to return, only events already queued are added
+                        timeout = 0
+        finally:
+            event_hub.unsubscribe(subscription)
+    finally:
+        event_hub.release_stream()
+
+    return jsonify(
+        {
+            "last_event_id": max(after, event_hub.get_cursor(last_event_id)),
+            "events": [
+                {"id": event_id, "type": event_type, "data": payload} for event_id, event_type, payload in events
+            ],
+        }
+    )
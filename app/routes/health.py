@@ -0,0 +1,20 @@
+from typing import Tuple
+
+from flask import Blueprint, jsonify
+from werkzeug.wrappers import Response
+
+from app.db import db_manager
+
+health_bp: Blueprint = Blueprint("health", __name__, url_prefix="/health")
+
+
+@health_bp.route("", methods=["GET"])
+def liveness() -> Response:
+    return jsonify({"status": "ok"})
+
+
+@health_bp.route("/ready", methods=["GET"])
+def readiness() -> Tuple[Response, int]:
+    if not db_manager.check_connection():
+        return jsonify({"status": "unavailable", "database": "unavailable"}), 503
+    return jsonify({"status": "ok", "database": "ok"}), 200
@@ -1,17 +1,28 @@
-from typing import List
+import json
+from typing import Any, Dict, List, Tuple
 
 from flask import Blueprint, jsonify, request
 from flask_login import login_required
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
+from app.db import db_manager
+from app.utils import conditional_response
 
 orders_bp: Blueprint = Blueprint("orders", __name__, url_prefix="/orders")
-db_manager: DatabaseManager = DatabaseManager()
+
+WORKS_COLUMNS: Tuple[str, ...] = ("work_id", "work_name", "planned_hours", "spent_hours", "remaining_hours")
+
+
+def make_works_response(payload: Dict[str, Any]) -> Response:
+    return Response(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=str),
+        mimetype="application/json",
+    )
 
 
 @orders_bp.route("/names", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_names() -> Response:
     query: str = request.args.get("query", "")
     order_names: List[str] = db_manager.orders.get_order_names_by_partial_match(query)
@@ -20,6 +31,7 @@ def get_order_names() -> Response:
 
 @orders_bp.route("/numbers", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_numbers() -> Response:
     query: str = request.args.get("query", "")
     order_numbers: List[str] = db_manager.orders.get_order_numbers_by_partial_match(query)
@@ -28,6 +40,7 @@ def get_order_numbers() -> Response:
 
 @orders_bp.route("/<string:order_number>/name", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_name(order_number: str) -> Response:
     order_name: str = db_manager.orders.get_order_name_by_number(order_number)
     return jsonify({"order_name": order_name})
@@ -35,6 +48,7 @@ def get_order_name(order_number: str) -> Response:
 
 @orders_bp.route("/<string:order_name>/number", methods=["GET"])
 @login_required
+@conditional_response("orders")
 def get_order_number(order_name: str) -> Response:
     order_number: str = db_manager.orders.get_order_number_by_name(order_name)
     return jsonify({"order_number": order_number})
@@ -42,6 +56,18 @@ def get_order_number(order_name: str) -> Response:
 
 @orders_bp.route("/<string:order_number>/works", methods=["GET"])
 @login_required
+@conditional_response("works", "orders")
 def get_works_for_order(order_number: str) -> Response:
-    works: List[str] = db_manager.works.get_works_for_order_by_number(order_number)
-    return jsonify(works)
+    works_per_order: Dict[str, List[Tuple[Any, ...]]] = db_manager.works.get_works_per_order([order_number])
+    return make_works_response({"columns": WORKS_COLUMNS, "rows": works_per_order[order_number.strip()]})
+
+
+@orders_bp.route("/works", methods=["GET"])
+@login_required
+@conditional_response("works", "orders")
+def get_works_for_orders() -> Response:
+    order_numbers: List[str] = sorted(
+        set(filter(None, (number.strip() for number in request.args.getlist("numbers[]"))))
+    )
+    works_per_order: Dict[str, List[Tuple[Any, ...]]] = db_manager.works.get_works_per_order(order_numbers)
+    return make_works_response({"columns": WORKS_COLUMNS, "orders": works_per_order})
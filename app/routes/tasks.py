@@ -1,35 +1,50 @@
 from datetime import datetime
 from decimal import Decimal
 from io import BytesIO
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-from flask import Blueprint, flash, redirect, render_template, request, send_file, url_for
+from flask import Blueprint, abort, flash, jsonify, redirect, render_template, request, send_file, url_for
 from flask_login import login_required
+from werkzeug.datastructures import MultiDict
 from werkzeug.wrappers import Response
 
-from app.db import DatabaseManager
-from app.utils import MESSAGES, get_report_file, permission_required
+from app.db import db_manager
+from app.db.work_manager import WorkKey
+from app.utils import MESSAGES, conditional_response, get_report_file, permission_required
 
 Tasks = List[Dict[str, Union[str, Decimal]]]
 Data = List[List[Union[str, Decimal]]]
-GroupedData = Dict[str, Dict[str, Union[str, Dict[str, Decimal]]]]
 
 tasks_bp: Blueprint = Blueprint("tasks", __name__, url_prefix="/tasks")
-db_manager: DatabaseManager = DatabaseManager()
 
 
-@tasks_bp.route("/table", methods=["GET"])
-@login_required
-def tasks_table() -> Union[str, Response]:
+TASKS_PAGE_SIZE: int = 100
+TASKS_WINDOW_MAX_SIZE: int = 500
+TASKS_BATCH_MAX_SIZE: int = 100
+TASKS_SUBMISSION_MAX_EMPLOYEES: int = 50
+BULK_OVERLOADS_SHOWN: int = 10
+TASKS_COLUMNS: Tuple[str, ...] = (
+    "id",
+    "employee_name",
+    "personnel_number",
+    "employee_category",
+    "department",
+    "work_name",
+    "hours",
+    "order_number",
+    "order_name",
+    "operation_date",
+)
+
+
+def get_tasks_filters(default_date: str) -> Dict[str, Union[str, List[str]]]:
     start_date: str = request.args.get("start_date")
     end_date: str = request.args.get("end_date")
 
-    default_date: str = datetime.today().strftime("%Y-%m-%d")
-
     if not start_date and not end_date:
         start_date = end_date = default_date
 
-    args: Dict[str, Union[str, List[str]]] = {
+    return {
         "departments": request.args.getlist("departments[]"),
         "start_date": start_date,
         "end_date": end_date,
@@ -39,85 +54,224 @@ def tasks_table() -> Union[str, Response]:
         "order_name": request.args.get("order_name"),
     }
 
-    tasks: Tasks = db_manager.tasks.get_tasks(**args)
-    departments: List[str] = db_manager.employees.get_departments()
+
+def get_table_params(source: MultiDict) -> Dict[str, Union[str, List[str]]]:
+    return {
+        "departments[]": source.getlist("departments[]"),
+        "start_date": source.get("start_date"),
+        "end_date": source.get("end_date"),
+        "employee_data": source.get("employee_data"),
+        "order_number": source.get("order_number"),
+        "work_name": source.get("work_name"),
+        "order_name": source.get("order_name"),
+        "sort_by": source.get("sort_by"),
+        "sort_order": source.get("sort_order"),
+        "page": source.get("page"),
+    }
+
+
+@tasks_bp.route("/table", methods=["GET"])
+@login_required
+@conditional_response("tasks", "employees")
+def tasks_table() -> Union[str, Response]:
+    default_date: str = datetime.today().strftime("%Y-%m-%d")
+    args: Dict[str, Union[str, List[str]]] = get_tasks_filters(default_date)
 
     if request.args.get("export"):
+        tasks: Tasks = db_manager.tasks.get_tasks(**args)
         tasks_data: Tasks = db_manager.tasks.get_tasks_data(tasks=tasks)
         basic_orders_data: Data = db_manager.orders.get_basic_orders_data(tasks=tasks)
         file: BytesIO = get_report_file(tasks_data=tasks_data, basic_orders_data=basic_orders_data)
         timestamp: str = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         return send_file(file, download_name=f"{timestamp}.xlsx", as_attachment=True)
 
-    context: Dict[str, Union[str, Tasks]] = {
+    sort_by: str = request.args.get("sort_by")
+    sort_order: str = request.args.get("sort_order", "asc")
+
+    totals: Dict[str, Union[int, Decimal]] = db_manager.tasks.get_tasks_totals(**args)
+    total_pages: int = max((totals["tasks_count"] + TASKS_PAGE_SIZE - 1) // TASKS_PAGE_SIZE, 1)
+    page: int = min(max(request.args.get("page", 1, int), 1), total_pages)
+
+    tasks: Tasks = db_manager.tasks.get_tasks(
+        **args,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        offset=(page - 1) * TASKS_PAGE_SIZE,
+        limit=TASKS_PAGE_SIZE,
+    )
+    departments: List[str] = db_manager.employees.get_departments()
+
+    table_params: Dict[str, Union[str, List[str]]] = get_table_params(request.args)
+    table_params.pop("page")
+
+    context: Dict[str, Union[str, int, Tasks]] = {
         "tasks": tasks,
         "departments": departments,
         "default_date": default_date,
+        "page": page,
+        "page_size": TASKS_PAGE_SIZE,
+        "total_pages": total_pages,
+        "tasks_count": totals["tasks_count"],
+        "hours_total": totals["hours_total"],
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "table_params": table_params,
     }
     return render_template("tasks/tasks_table.html", **context)
 
 
-@tasks_bp.route("/add", methods=["GET", "POST"])
+@tasks_bp.route("/rows", methods=["GET"])
+@login_required
+@conditional_response("tasks", "employees")
+def tasks_rows() -> Response:
+    """
+    Returns a window of rows of the tasks table for lazy loading on scroll, with the table's filters and sorting.
+    The first window also carries the totals of all matching tasks.
+    """
+
+    default_date: str = datetime.today().strftime("%Y-%m-%d")
+    args: Dict[str, Union[str, List[str]]] = get_tasks_filters(default_date)
+
+    offset: int = max(request.args.get("offset", 0, int), 0)
+    limit: int = min(max(request.args.get("limit", TASKS_PAGE_SIZE, int), 1), TASKS_WINDOW_MAX_SIZE)
+
+    tasks: Tasks = db_manager.tasks.get_tasks(
+        **args,
+        sort_by=request.args.get("sort_by"),
+        sort_order=request.args.get("sort_order", "asc"),
+        offset=offset,
+        limit=limit,
+    )
+
+    payload: Dict[str, Union[int, List]] = {
+        "offset": offset,
+        "columns": TASKS_COLUMNS,
+        "rows": [[task[column] for column in TASKS_COLUMNS] for task in tasks],
+    }
+
+    if offset == 0:
+        payload.update(db_manager.tasks.get_tasks_totals(**args))
+    return jsonify(payload)
+
+
+def get_submissions_work_ids(submissions: List[Dict]) -> List[int]:
+    work_ids: Set[int] = set()
+    for submission in submissions:
+        works: Any = submission.get("works") if isinstance(submission, dict) else None
+        for entry in works if isinstance(works, list) else []:
+            work_id: Any = entry.get("work_id") if isinstance(entry, dict) else None
+            if isinstance(work_id, int) and not isinstance(work_id, bool):
+                work_ids.add(work_id)
+    return sorted(work_ids)
+
+
+def parse_submission(submission: Dict, works: Dict[int, WorkKey]) -> Tasks:
+    """
+    Validates a submission of the task entry form in a single pass and converts it to tasks.
+
+    Submission is `{"key", "personnel_numbers": [...], "operation_date": "YYYY-MM-DD",
+    "works": [{"order_number", "work_id", "hours"}]}`: every listed employee gets a task
+    for every work with non-zero hours.
+
+    Args:
+        submission (Dict): Submission decoded from JSON.
+        works (Dict[int, WorkKey]): Order number, order name and work name by work id,
+            for all works referenced by the batch.
+
+    Raises:
+        ValueError: If the submission is malformed or fails validation, with a message to show to the user.
+    """
+
+    try:
+        personnel_numbers: List[str] = list(dict.fromkeys(number.strip() for number in submission["personnel_numbers"]))
+        entries: List[Tuple[str, int, Decimal]] = [
+            (entry["order_number"].strip(), entry["work_id"], Decimal(str(entry["hours"])))
+            for entry in submission["works"]
+        ]
+        operation_date: str = submission.get("operation_date") or datetime.now().strftime("%Y-%m-%d")
+        datetime.strptime(operation_date, "%Y-%m-%d")
+    except (KeyError, TypeError, AttributeError, ValueError, ArithmeticError):
+        raise ValueError(MESSAGES["tasks"]["invalid_submission"])
+
+    if not personnel_numbers or len(personnel_numbers) > TASKS_SUBMISSION_MAX_EMPLOYEES:
+        raise ValueError(MESSAGES["tasks"]["invalid_submission"])
+
+    employees: List[Tuple[str, str, str, str]] = []
+    for personnel_number in personnel_numbers:
+        employee: Optional[Tuple[str, str, str]] = db_manager.employees.get_employee_attributes(personnel_number)
+        if employee is None:
+            raise ValueError(MESSAGES["tasks"]["employee_not_found"])
+        employees.append((personnel_number, *employee))
+
+    total_hours: Decimal = Decimal(0)
+    for order_number, work_id, hours in entries:
+        if not hours.is_finite():
+            raise ValueError(MESSAGES["tasks"]["invalid_submission"])
+        if hours < Decimal(0):
+            raise ValueError(MESSAGES["tasks"]["hours_less_than_zero"])
+        if work_id not in works or works[work_id][0] != order_number:
+            raise ValueError(MESSAGES["tasks"]["work_not_found"])
+        total_hours += hours
+
+    # Every employee of the submission books the same works, so the limit applies to the sum of hours once.
+    if total_hours > Decimal(12.25):
+        raise ValueError(MESSAGES["tasks"]["hours_exceed_limit"])
+
+    tasks: Tasks = [
+        {
+            "employee_name": employee_name,
+            "personnel_number": personnel_number,
+            "department": department,
+            "work_name": works[work_id][2],
+            "hours": hours,
+            "order_number": order_number,
+            "order_name": works[work_id][1],
+            "operation_date": operation_date,
+            "employee_category": category,
+        }
+        for personnel_number, employee_name, department, category in employees
+        for order_number, work_id, hours in entries
+        if hours
+    ]
+    if not tasks:
+        raise ValueError(MESSAGES["tasks"]["no_tasks_provided"])
+    return tasks
+
+
+@tasks_bp.route("/add", methods=["GET"])
 @login_required
 @permission_required(["advanced", "standard"])
-def add_task() -> Union[str, Response]:
-    if request.method == "POST":
-        employee_data: str = request.form.get("employee_data")
-        operation_date: str = request.form.get("operation_date")
-        order_names: List[str] = request.form.getlist("order_name[]")
-        order_numbers: List[str] = request.form.getlist("order_number[]")
+def add_task() -> str:
+    return render_template("tasks/add_task.html")
 
-        if not operation_date:
-            operation_date: str = datetime.now().strftime("%Y-%m-%d")
 
-        employee_details: Tuple[str, str] = db_manager.employees.get_employee_details(employee_data)
-        employee_name, personnel_number = employee_details
+@tasks_bp.route("/batch", methods=["POST"])
+@login_required
+@permission_required(["advanced", "standard"])
+def add_tasks_batch() -> Tuple[Response, int]:
+    submissions: List[Dict] = (request.get_json(silent=True) or {}).get("submissions")
+    if not isinstance(submissions, list) or len(submissions) > TASKS_BATCH_MAX_SIZE:
+        return jsonify({"error": MESSAGES["tasks"]["invalid_submission"]}), 400
 
-        employee_department: str = db_manager.employees.get_employee_department(personnel_number)
-        employee_category: str = db_manager.employees.get_employee_category(personnel_number)
+    works: Dict[int, WorkKey] = db_manager.works.get_works_by_ids(get_submissions_work_ids(submissions))
 
-        grouped_data: GroupedData = {
-            order_number: {
-                "order_name": order_name,
-                "works": {
-                    work_name.split("][")[1].rstrip("]"): Decimal(spent_hours)
-                    for work_name, spent_hours in request.form.items()
-                    if spent_hours and work_name.startswith(f"work_hours[{order_number}]")
-                },
-            }
-            for order_number, order_name in zip(order_numbers, order_names)
-        }
+    results: Dict[str, Dict[str, str]] = {}
+    valid_submissions: Dict[str, Tasks] = {}
 
-        total_spent_hours: Decimal = Decimal(0)
-
-        for order_data in grouped_data.values():
-            for spent_hours in order_data["works"].values():
-                if spent_hours < Decimal(0):
-                    flash(message=MESSAGES["tasks"]["hours_less_than_zero"], category="error")
-                    return render_template("tasks/add_task.html")
-                total_spent_hours += spent_hours
-
-        if total_spent_hours > Decimal(12.25):
-            flash(message=MESSAGES["tasks"]["hours_exceed_limit"], category="error")
-            return render_template("tasks/add_task.html")
-
-        for order_number, order_data in grouped_data.items():
-            for work_name, spent_hours in order_data["works"].items():
-                args: Dict[str, Union[str, Decimal]] = {
-                    "employee_name": employee_name,
-                    "personnel_number": personnel_number,
-                    "department": employee_department,
-                    "work_name": work_name,
-                    "hours": spent_hours,
-                    "order_number": order_number,
-                    "order_name": order_data["order_name"],
-                    "operation_date": operation_date,
-                    "employee_category": employee_category,
-                }
-                db_manager.tasks.add_task(**args)
-        flash(message="Задания успешно добавлены.", category="info")
-        return redirect(url_for("tasks.add_task"))
-    return render_template("tasks/add_task.html")
+    for submission in submissions:
+        key: str = str(submission.get("key") or "") if isinstance(submission, dict) else ""
+        if not key or len(key) > 64:
+            return jsonify({"error": MESSAGES["tasks"]["invalid_submission"]}), 400
+
+        try:
+            valid_submissions[key] = parse_submission(submission, works)
+        except ValueError as error:
+            results[key] = {"status": "rejected", "message": str(error)}
+
+    created_keys: List[str] = db_manager.tasks.add_tasks(valid_submissions) if valid_submissions else []
+    for key in valid_submissions:
+        results[key] = {"status": "created" if key in created_keys else "duplicate"}
+    return jsonify({"results": results}), 200
 
 
 @tasks_bp.route("/edit/<int:task_id>", methods=["GET", "POST"])
@@ -125,6 +279,9 @@ def add_task() -> Union[str, Response]:
 @permission_required(["advanced", "standard"])
 def edit_task(task_id: int) -> Union[str, Response]:
     task_data: Dict[str, Union[str, Decimal]] = db_manager.tasks.get_task_data_by_id(task_id)
+    # Archived tasks are listed in the table, but they are read-only
+    if task_data is None:
+        abort(404)
 
     context: Dict[str, Union[str, Decimal]] = {
         "employee_name": task_data["employee_name"],
@@ -199,17 +356,10 @@ def edit_task(task_id: int) -> Union[str, Response]:
             "operation_date": operation_date,
             "work_name": work_name,
         }
-        db_manager.tasks.update_task(**args)
-
-        params: Dict[str, str] = {
-            "departments[]": request.args.getlist("departments[]"),
-            "start_date": request.args.get("start_date"),
-            "end_date": request.args.get("end_date"),
-            "employee_data": request.args.get("employee_data"),
-            "order_number": request.args.get("order_number"),
-            "work_name": request.args.get("work_name"),
-            "order_name": request.args.get("order_name"),
-        }
+        if not db_manager.tasks.update_task(**args):
+            flash(message=MESSAGES["tasks"]["task_not_found"], category="warning")
+
+        params: Dict[str, str] = get_table_params(request.args)
         return redirect(url_for("tasks.tasks_table", **params))
     return render_template("tasks/edit_task.html", **context)
 
@@ -218,14 +368,107 @@ def edit_task(task_id: int) -> Union[str, Response]:
 @login_required
 @permission_required(["advanced", "standard"])
 def delete_task(task_id: str) -> Response:
-    params: Dict[str, str] = {
-        "departments[]": request.form.getlist("departments[]"),
-        "start_date": request.form.get("start_date"),
-        "end_date": request.form.get("end_date"),
-        "employee_data": request.form.get("employee_data"),
-        "order_number": request.form.get("order_number"),
-        "work_name": request.form.get("work_name"),
-        "order_name": request.form.get("order_name"),
-    }
-    db_manager.tasks.delete_task(task_id)
+    params: Dict[str, str] = get_table_params(request.args)
+    if not db_manager.tasks.delete_task(task_id):
+        flash(message=MESSAGES["tasks"]["task_not_found"], category="warning")
     return redirect(url_for("tasks.tasks_table", **params))
+
+
+def get_bulk_changes(operation: str, form: MultiDict) -> Optional[Dict[str, Union[str, int]]]:
+    """
+    Validates values of a bulk operation, flashing a message and returning None if they are invalid.
+    """
+
+    if operation == "delete":
+        return {}
+
+    if operation == "shift_date":
+        days: Optional[int] = form.get("days", type=int)
+        if not days:
+            flash(message=MESSAGES["tasks"]["invalid_bulk_operation"], category="warning")
+            return None
+        return {"days": days}
+
+    if operation == "reassign":
+        order_number: str = (form.get("order_number") or "").strip()
+        work_name: str = (form.get("work_name") or "").strip()
+        order_id: Optional[int] = db_manager.orders.get_order_id_by_number(order_number) if order_number else None
+        if order_id is None or not db_manager.works.work_exists(order_id, work_name):
+            flash(message=MESSAGES["tasks"]["work_not_found"], category="warning")
+            return None
+        return {
+            "order_number": order_number,
+            "order_name": db_manager.orders.get_order_name_by_number(order_number),
+            "work_name": work_name,
+        }
+
+    if operation == "change_employee":
+        employee_details: Optional[Tuple[str, str]] = db_manager.employees.get_employee_details(
+            form.get("employee_data") or ""
+        )
+        if employee_details is None:
+            flash(message=MESSAGES["employees"]["invalid_employee_format"], category="warning")
+            return None
+
+        attributes: Optional[Tuple[str, str, str]] = db_manager.employees.get_employee_attributes(employee_details[1])
+        if attributes is None:
+            flash(message=MESSAGES["employees"]["employee_not_found"], category="warning")
+            return None
+
+        employee_name, department, employee_category = attributes
+        return {
+            "employee_name": employee_name,
+            "personnel_number": employee_details[1],
+            "department": department,
+            "employee_category": employee_category,
+        }
+
+    flash(message=MESSAGES["tasks"]["invalid_bulk_operation"], category="warning")
+    return None
+
+
+@tasks_bp.route("/bulk", methods=["GET", "POST"])
+@login_required
+@permission_required(["advanced"])
+def bulk_tasks() -> Union[str, Response]:
+    default_date: str = datetime.today().strftime("%Y-%m-%d")
+    args: Dict[str, Union[str, List[str]]] = get_tasks_filters(default_date)
+
+    table_params: Dict[str, Union[str, List[str]]] = get_table_params(request.args)
+    table_params.pop("page")
+
+    if request.method == "POST":
+        operation: str = request.form.get("operation")
+        changes: Optional[Dict[str, Union[str, int]]] = get_bulk_changes(operation, request.form)
+
+        if changes is not None:
+            dry_run: bool = request.form.get("dry_run") == "1"
+            result: Dict[str, Any] = db_manager.tasks.bulk_update_tasks(args, operation, changes, dry_run=dry_run)
+
+            if not result["tasks_count"]:
+                flash(message=MESSAGES["tasks"]["no_tasks_selected"], category="warning")
+            elif result["overloads"]:
+                overloads: str = ", ".join(
+                    f"{number} ({day})" for number, day in result["overloads"][:BULK_OVERLOADS_SHOWN]
+                )
+                if len(result["overloads"]) > BULK_OVERLOADS_SHOWN:
+                    overloads += ", …"
+                flash(message=MESSAGES["tasks"]["bulk_hours_exceed_limit"].format(overloads), category="warning")
+            elif dry_run:
+                message: str = MESSAGES["tasks"]["bulk_checked"].format(result["tasks_count"], result["hours_total"])
+                flash(message=message, category="info")
+            else:
+                message: str = MESSAGES["tasks"]["bulk_applied"].format(result["tasks_count"], result["hours_total"])
+                flash(message=message, category="info")
+                return redirect(url_for("tasks.bulk_tasks", **table_params))
+
+    # Bulk operations change live tasks only, archived tasks are read-only
+    totals: Dict[str, Union[int, Decimal]] = db_manager.tasks.get_tasks_totals(**args, include_archive=False)
+
+    context: Dict[str, Any] = {
+        "tasks_count": totals["tasks_count"],
+        "hours_total": totals["hours_total"],
+        "filters": args,
+        "table_params": table_params,
+    }
+    return render_template("tasks/bulk_tasks.html", **context)
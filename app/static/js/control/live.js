@@ -0,0 +1,29 @@
+// Live updates of control panel counters from change events, see app/routes/events.py
+
+import { pollEvents } from "../live.js";
+
+const COUNTER_DELTAS = {
+    task_added: ["tasks", 1],
+    task_deleted: ["tasks", -1],
+    order_added: ["orders", 1],
+    order_deleted: ["orders", -1],
+    employee_added: ["employees", 1],
+    employee_deleted: ["employees", -1],
+};
+
+export function configureLiveCounters() {
+    const cards = document.querySelector(".overview-cards[data-events-url]");
+    if (!cards) {
+        return;
+    }
+
+    const handlers = {};
+    Object.entries(COUNTER_DELTAS).forEach(([eventType, [counter, delta]]) => {
+        handlers[eventType] = () => {
+            const element = cards.querySelector(`[data-counter="${counter}"]`);
+            element.textContent = parseInt(element.textContent, 10) + delta;
+        };
+    });
+
+    pollEvents(cards.dataset.eventsUrl, handlers);
+}
@@ -11,6 +11,7 @@ import {
     configureWorkListHandlers
 } from "./events.js";
 import { configureSuggestionInputs, configureSuggestionHandlers } from "./suggestions.js"
+import { configureLiveCounters } from "./live.js";
 
 
 function scheduleFlashMessageHide() {
@@ -34,6 +35,8 @@ configureUserStatusSwitchHandler();
 configureSuggestionInputs();
 configureUserConfirmationModal();
 
+configureLiveCounters();
+
 configureSuggestionHandlers([
     {
         inputSelector: ".order-name",
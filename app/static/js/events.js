@@ -120,22 +120,21 @@ export function configureScrollToTopButton() {
 
 
 export function configureHoursSelection() {
-    const hours = document.querySelectorAll(".hours");
-    const hoursTotal = document.querySelector(".hours-total");
-    const resetButton = document.querySelector(".reset-hours-total-button");
     const hoursTotalContainer = document.querySelector(".hours-total-container");
+    if (!hoursTotalContainer) return;
 
-    if (!hoursTotal || !resetButton || !hoursTotalContainer || hours.length === 0) return;
+    const hoursTotal = hoursTotalContainer.querySelector(".hours-total");
+    const resetButton = hoursTotalContainer.querySelector(".reset-hours-total-button");
+
+    if (!hoursTotal || !resetButton) return;
 
     function updateSum() {
         let sum = 0;
         let selectedCount = 0;
 
-        hours.forEach(cell => {
-            if (cell.classList.contains("selected")) {
-                sum += parseFloat(cell.dataset.hours) || 0;
-                selectedCount++;
-            }
+        document.querySelectorAll(".hours.selected").forEach(cell => {
+            sum += parseFloat(cell.dataset.hours) || 0;
+            selectedCount++;
         });
 
         hoursTotal.textContent = sum.toFixed(2);
@@ -147,16 +146,20 @@ export function configureHoursSelection() {
         }
     }
 
-    hours.forEach(cell => {
-        cell.style.cursor = "pointer";
-        cell.addEventListener("click", () => {
-            cell.classList.toggle("selected");
-            updateSum();
-        });
+    // Appended rows are cloned from the rendered ones, so they inherit the cursor
+    document.querySelectorAll("td.hours").forEach(cell => cell.style.cursor = "pointer");
+
+    // Delegated so that rows appended on scroll are selectable too
+    document.addEventListener("click", (event) => {
+        const cell = event.target.closest("td.hours");
+        if (!cell) return;
+
+        cell.classList.toggle("selected");
+        updateSum();
     });
 
     resetButton.addEventListener("click", () => {
-        hours.forEach(cell => cell.classList.remove("selected"));
+        document.querySelectorAll(".hours.selected").forEach(cell => cell.classList.remove("selected"));
         updateSum();
     });
 }
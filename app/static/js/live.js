@@ -0,0 +1,162 @@
+// Live updates of pages from change events, see app/routes/events.py
+
+const POLL_ERROR_DELAY_MS = 5000;
+const STREAM_RETRY_DELAY_MS = 30000;
+
+function sleep(milliseconds) {
+    return new Promise(resolve => setTimeout(resolve, milliseconds));
+}
+
+// Long polling of events: one short request at a time instead of a stream holding a server thread.
+// Events committed late may be returned again, so ids already applied are skipped.
+export async function pollEvents(url, handlers) {
+    let after = null;
+    let appliedIds = new Set();
+
+    while (true) {
+        const pollUrl = new URL(url, window.location.origin);
+        if (after !== null) {
+            pollUrl.searchParams.set("after", after);
+        }
+
+        let response;
+        try {
+            // Events may be served by a separate server, which needs the session cookie as well
+            response = await fetch(pollUrl, { headers: { Accept: "application/json" }, credentials: "include" });
+        } catch {
+            await sleep(POLL_ERROR_DELAY_MS);
+            continue;
+        }
+
+        if (response.status === 503) {
+            const retryAfter = parseInt(response.headers.get("Retry-After"), 10);
+            await sleep((retryAfter || 30) * 1000);
+            continue;
+        }
+        if (!response.ok) {
+            await sleep(POLL_ERROR_DELAY_MS);
+            continue;
+        }
+
+        const data = await response.json();
+        data.events.forEach(event => {
+            if (!appliedIds.has(event.id) && handlers[event.type]) {
+                handlers[event.type](event.data);
+            }
+            appliedIds.add(event.id);
+        });
+
+        after = data.last_event_id;
+        appliedIds = new Set([...appliedIds].filter(id => id > after));
+    }
+}
+
+function updateTasksSummary(summary, countDelta, hoursDelta) {
+    const countElement = summary.querySelector(".tasks-count");
+    const hoursElement = summary.querySelector(".hours-total");
+
+    countElement.textContent = parseInt(countElement.textContent, 10) + countDelta;
+    hoursElement.textContent = (parseFloat(hoursElement.textContent) + hoursDelta).toFixed(2);
+}
+
+function updateTaskRow(row, task) {
+    row.querySelectorAll("[data-field]").forEach(cell => {
+        cell.textContent = task[cell.dataset.field] || "-";
+    });
+    row.querySelector(".hours").dataset.hours = task.hours;
+}
+
+export function configureLiveTasksTable() {
+    const summary = document.querySelector(".tasks-summary[data-events-url]");
+    if (!summary) {
+        return;
+    }
+
+    const notice = summary.querySelector(".tasks-refresh-notice");
+
+    pollEvents(summary.dataset.eventsUrl, {
+        task_added: data => {
+            if (data.matched) {
+                updateTasksSummary(summary, 1, parseFloat(data.task.hours));
+                notice.style.display = "inline";
+            }
+        },
+
+        task_updated: data => {
+            const countDelta = (data.matched ? 1 : 0) - (data.previous_matched ? 1 : 0);
+            const hoursDelta = (data.matched ? parseFloat(data.task.hours) : 0)
+                - (data.previous_matched ? parseFloat(data.previous_task.hours) : 0);
+            updateTasksSummary(summary, countDelta, hoursDelta);
+
+            const row = document.querySelector(`tr[data-task-id="${data.task.id}"]`);
+            if (row && data.matched) {
+                updateTaskRow(row, data.task);
+            } else if (row) {
+                row.remove();
+            } else if (data.matched) {
+                notice.style.display = "inline";
+            }
+        },
+
+        task_deleted: data => {
+            updateTasksSummary(summary, -1, -parseFloat(data.task.hours));
+
+            const row = document.querySelector(`tr[data-task-id="${data.task.id}"]`);
+            if (row) {
+                row.remove();
+            }
+        },
+    });
+}
+
+// The works modal shows hours changing while the user fills the form, so it gets a stream,
+// opened only while the modal is visible
+export function configureLiveWorksModal() {
+    const modal = document.querySelector(".works-modal-container[data-events-url]");
+    if (!modal || !window.EventSource) {
+        return;
+    }
+
+    let source = null;
+    let retryTimer = null;
+
+    function updateWork(event) {
+        const work = JSON.parse(event.data);
+        if (modal.dataset.orderNumber !== work.order_number) {
+            return;
+        }
+
+        const row = modal.querySelector(`tbody tr[data-work-id="${work.work_id}"]`);
+        if (row) {
+            row.cells[1].textContent = work.planned_hours;
+            row.cells[2].textContent = work.spent_hours;
+            row.cells[3].textContent = work.remaining_hours;
+        }
+    }
+
+    function openStream() {
+        source = new EventSource(modal.dataset.eventsUrl, { withCredentials: true });
+        source.addEventListener("work_updated", updateWork);
+        // A refused stream (503 when the server is busy) is not reconnected by the browser
+        source.addEventListener("error", () => {
+            if (source.readyState === EventSource.CLOSED) {
+                source = null;
+                retryTimer = setTimeout(toggleStream, STREAM_RETRY_DELAY_MS);
+            }
+        });
+    }
+
+    function toggleStream() {
+        clearTimeout(retryTimer);
+        const visible = modal.style.display === "block";
+
+        if (visible && !source) {
+            openStream();
+        } else if (!visible && source) {
+            source.close();
+            source = null;
+        }
+    }
+
+    new MutationObserver(toggleStream).observe(modal, { attributes: true, attributeFilter: ["style"] });
+}
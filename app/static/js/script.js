@@ -7,8 +7,17 @@ import {
     configureHoursSelection,
     configureDropdownCheckboxListener
 } from "./events.js";
-import { configureTaskCreateHandler, configureTaskDeleteHandler } from "./tasks.js";
+import {
+    configureEmployeeCreateHandler,
+    configureTaskCreateHandler,
+    configureTaskDeleteHandler,
+    configureLazyTasksTable,
+    configureTaskQueue,
+    getWorkHours,
+    setWorkHours
+} from "./tasks.js";
 import { configureSuggestionInputs, configureOrderSuggestionHandlers } from "./suggestions.js";
+import { configureLiveTasksTable, configureLiveWorksModal } from "./live.js";
 
 
 function scheduleFlashMessageHide() {
@@ -21,6 +30,24 @@ function scheduleFlashMessageHide() {
 
 scheduleFlashMessageHide();
 
+
+function fetchOrderWorks(orderNumber) {
+    // Works of all orders on the form are fetched by one request, repeated opens are revalidated by ETag
+    const orderNumbers = new Set([orderNumber]);
+    document.querySelectorAll(".task-fields .order-number").forEach(input => {
+        if (input.value.trim()) orderNumbers.add(input.value.trim());
+    });
+
+    const params = new URLSearchParams();
+    [...orderNumbers].sort().forEach(number => params.append("numbers[]", number));
+
+    return fetch(`/orders/works?${params}`)
+        .then(response => response.json())
+        .then(data => (data.orders[orderNumber] || []).map(
+            row => Object.fromEntries(data.columns.map((column, index) => [column, row[index]]))
+        ));
+}
+
 configureSuggestionListBlurHandler();
 configureSuggestionListEscapeHandler();
 configureFilterResetHandler();
@@ -29,8 +56,14 @@ configurePasswordToggle();
 configureScrollToTopButton();
 configureHoursSelection();
 
+configureEmployeeCreateHandler();
 configureTaskCreateHandler();
 configureTaskDeleteHandler();
+configureLazyTasksTable();
+configureTaskQueue();
+
+configureLiveTasksTable();
+configureLiveWorksModal();
 
 configureSuggestionInputs();
 configureOrderSuggestionHandlers();
@@ -67,36 +100,21 @@ document.addEventListener("click", function(event) {
             return;
         }
 
-        fetch(`/orders/${orderNumber}/works`)
-            .then(response => response.json())
+        fetchOrderWorks(orderNumber)
             .then(data => {
                 const modal = document.querySelector(".works-modal-container");
                 const tbody = modal.querySelector("tbody");
 
                 const modalTitle = modal.querySelector("#works-modal-title");
                 modalTitle.textContent = `Заказ №${orderNumber}`; // Можно добавить и название: `${orderName} (№${orderNumber})`
+                modal.dataset.orderNumber = orderNumber;
 
                 tbody.innerHTML = "";
 
-                const hiddenContainer = document.querySelector("#hidden-work-hours-container");
-
                 data.forEach(work => {
-                    const hiddenInputName = `work_hours[${orderNumber}][${work.work_name}]`;
-                    let existingInput = hiddenContainer.querySelector(`input[name="${CSS.escape(hiddenInputName)}"]`);
-
-                    // если нет — создаем
-                    if (!existingInput) {
-                        existingInput = document.createElement("input");
-                        existingInput.type = "hidden";
-                        existingInput.name = hiddenInputName;
-                        hiddenContainer.appendChild(existingInput);
-                    }
-
-                    // берем значение из существующего инпута
-                    const value = existingInput.value || "";
-
-                    // создаем строку в модалке
+                    // создаем строку в модалке, значение берем из уже введенных часов
                     const row = document.createElement("tr");
+                    row.dataset.workId = work.work_id;
                     row.innerHTML = `
                         <td style="width: 280px;">${work.work_name}</td>
                         <td>${work.planned_hours}</td>
@@ -106,17 +124,16 @@ document.addEventListener("click", function(event) {
                             <input
                                 style="height: 18px; width: 140px; padding-left: 4px;"
                                 type="number"
-                                name="work_hours[${orderNumber}][${work.work_name}]"
                                 min="0"
                                 max="12.25"
                                 step="0.01"
-                                value="${value}"
+                                value="${getWorkHours(orderNumber, work.work_id)}"
                             />
                         </td>
                     `;
 
                     row.querySelector("input").addEventListener("input", event => {
-                        existingInput.value = event.target.value;
+                        setWorkHours(orderNumber, work.work_id, event.target.value);
                     });
 
                     tbody.appendChild(row);
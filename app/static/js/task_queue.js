@@ -0,0 +1,123 @@
+// Persistent queue of task entry form submissions.
+// Submissions are stored in IndexedDB with an idempotency key and sent to /tasks/batch in batches,
+// both from the page and from the service worker (task_queue_worker.js) when connection is restored.
+// The server skips keys it has already processed, so a submission may be safely sent more than once.
+
+const DATABASE_NAME = "worktime";
+const STORE_NAME = "task_submissions";
+const BATCH_SIZE = 50;
+
+export const SYNC_TAG = "task-queue";
+
+
+function openQueue() {
+    return new Promise((resolve, reject) => {
+        const request = indexedDB.open(DATABASE_NAME, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(STORE_NAME, { keyPath: "key" });
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+
+function runTransaction(mode, callback) {
+    return openQueue().then(database => new Promise((resolve, reject) => {
+        const transaction = database.transaction(STORE_NAME, mode);
+        const result = callback(transaction.objectStore(STORE_NAME));
+        transaction.oncomplete = () => {
+            database.close();
+            resolve(result && "result" in result ? result.result : undefined);
+        };
+        transaction.onerror = () => {
+            database.close();
+            reject(transaction.error);
+        };
+    }));
+}
+
+
+export function createSubmissionKey() {
+    // crypto.randomUUID is available only in secure contexts, terminals may open the application over plain HTTP
+    const bytes = crypto.getRandomValues(new Uint8Array(16));
+    return [...bytes].map(byte => byte.toString(16).padStart(2, "0")).join("");
+}
+
+
+export function enqueueSubmission(submission) {
+    const queuedSubmission = { ...submission, key: createSubmissionKey(), queuedAt: Date.now() };
+    return runTransaction("readwrite", store => store.add(queuedSubmission)).then(() => queuedSubmission);
+}
+
+
+export function getQueuedSubmissions() {
+    return runTransaction("readonly", store => store.getAll())
+        .then(submissions => submissions.sort((first, second) => first.queuedAt - second.queuedAt));
+}
+
+
+export function removeSubmissions(keys) {
+    return runTransaction("readwrite", store => keys.forEach(key => store.delete(key)));
+}
+
+
+function markRejected(submissions) {
+    return runTransaction("readwrite", store => submissions.forEach(submission => store.put(submission)));
+}
+
+
+export function sendBatch(submissions) {
+    return fetch("/tasks/batch", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        credentials: "same-origin",
+        body: JSON.stringify({
+            submissions: submissions.map(({ key, personnel_numbers, operation_date, works }) => (
+                { key, personnel_numbers, operation_date, works }
+            ))
+        })
+    }).then(response => {
+        // Expired session redirects to the login page, submissions stay queued until the user logs in again
+        if (!response.ok || response.redirected) {
+            throw new Error(`Task queue sync failed with status ${response.status}`);
+        }
+        return response.json();
+    });
+}
+
+
+let flushing = null;
+
+export function flushTaskQueue() {
+    // Concurrent calls share one pass over the queue
+    if (flushing) return flushing;
+
+    flushing = (async () => {
+        const pending = (await getQueuedSubmissions()).filter(submission => !submission.rejected);
+        const rejected = [];
+
+        for (let start = 0; start < pending.length; start += BATCH_SIZE) {
+            const batch = pending.slice(start, start + BATCH_SIZE);
+            const { results } = await sendBatch(batch);
+
+            const processedKeys = [];
+            const batchRejected = [];
+            batch.forEach(submission => {
+                const result = results[submission.key];
+                if (result && result.status === "rejected") {
+                    batchRejected.push({ ...submission, rejected: result.message });
+                } else if (result) {
+                    processedKeys.push(submission.key);
+                }
+            });
+
+            await removeSubmissions(processedKeys);
+            await markRejected(batchRejected);
+            rejected.push(...batchRejected);
+        }
+        return rejected;
+    })().finally(() => {
+        flushing = null;
+    });
+
+    return flushing;
+}
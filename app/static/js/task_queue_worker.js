@@ -0,0 +1,18 @@
+// Service worker sending queued task submissions when connection is restored, even if the page was closed
+
+import { SYNC_TAG, flushTaskQueue } from "./task_queue.js";
+
+
+function notifyClients() {
+    return self.clients.matchAll({ type: "window", includeUncontrolled: true })
+        .then(clients => clients.forEach(client => client.postMessage({ type: SYNC_TAG })));
+}
+
+
+self.addEventListener("install", () => self.skipWaiting());
+
+self.addEventListener("sync", event => {
+    if (event.tag === SYNC_TAG) {
+        event.waitUntil(flushTaskQueue().then(notifyClients));
+    }
+});
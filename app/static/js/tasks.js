@@ -1,4 +1,15 @@
-import { processInput, processSelection, updateOrderName, updateOrderNumber } from "./utils.js";
+import { configureInputField, processInput, processSelection, updateOrderName, updateOrderNumber } from "./utils.js";
+import {
+    SYNC_TAG,
+    enqueueSubmission,
+    flushTaskQueue,
+    getQueuedSubmissions,
+    createSubmissionKey,
+    removeSubmissions,
+    sendBatch
+} from "./task_queue.js";
+
+const QUEUE_SYNC_INTERVAL = 30000;
 
 
 export function configureTaskCreateHandler() {
@@ -168,3 +179,266 @@ export function configureTaskDeleteHandler() {
         if (event.target === modal) closeModal();
     });
 }
+
+
+// Rows past the rendered page are appended window by window from /tasks/rows as the table is scrolled
+export function configureLazyTasksTable() {
+    const table = document.querySelector(".tasks-table[data-rows-url]");
+    const sentinel = document.querySelector(".tasks-rows-sentinel");
+
+    if (!table || !sentinel || !("IntersectionObserver" in window)) return;
+
+    const tbody = table.querySelector("tbody");
+    const rowTemplate = tbody.querySelector("tr[data-task-id]");
+    const tasksCount = parseInt(table.dataset.tasksCount, 10) || 0;
+    const categories = JSON.parse(table.dataset.categories || "{}");
+    let nextOffset = parseInt(table.dataset.nextOffset, 10) || 0;
+    let loading = false;
+
+    if (!rowTemplate || nextOffset >= tasksCount) return;
+
+    function setTaskId(element, attribute, taskId) {
+        const url = new URL(element.getAttribute(attribute), window.location.origin);
+        url.pathname = url.pathname.replace(/\/\d+$/, `/${taskId}`);
+        element.setAttribute(attribute, url.pathname + url.search);
+    }
+
+    function createRow(task, number) {
+        const row = rowTemplate.cloneNode(true);
+        row.dataset.taskId = task.id;
+        row.querySelector(".row-number").textContent = number;
+        row.querySelector(".employee-category").textContent = categories[task.employee_category] || "-";
+
+        row.querySelectorAll("[data-field]").forEach(cell => {
+            cell.textContent = task[cell.dataset.field] || "-";
+        });
+
+        const hours = row.querySelector(".hours");
+        hours.dataset.hours = task.hours || 0;
+        hours.classList.remove("selected");
+
+        row.querySelectorAll("a[href]").forEach(link => setTaskId(link, "href", task.id));
+        row.querySelectorAll("form[action]").forEach(form => setTaskId(form, "action", task.id));
+        return row;
+    }
+
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) loadRows();
+    }, { rootMargin: "400px" });
+
+    function loadRows() {
+        if (loading || nextOffset >= tasksCount) return;
+        loading = true;
+
+        const url = new URL(table.dataset.rowsUrl, window.location.origin);
+        url.searchParams.set("offset", nextOffset);
+
+        fetch(url)
+            .then(response => response.json())
+            .then(data => {
+                data.rows.forEach((values, index) => {
+                    const task = Object.fromEntries(data.columns.map((column, i) => [column, values[i]]));
+                    tbody.appendChild(createRow(task, data.offset + index + 1));
+                });
+                nextOffset = data.rows.length ? data.offset + data.rows.length : tasksCount;
+
+                // Once rows are appended on scroll the page links would repeat them
+                const pagination = document.querySelector(".pagination-container");
+                if (pagination) pagination.style.display = "none";
+
+                loading = false;
+                if (nextOffset >= tasksCount) {
+                    observer.disconnect();
+                    return;
+                }
+                // Re-observing reports the sentinel again if it is still in view after the append
+                observer.unobserve(sentinel);
+                observer.observe(sentinel);
+            })
+            .catch(error => {
+                loading = false;
+                console.error("Failed to load tasks rows:", error);
+            });
+    }
+
+    observer.observe(sentinel);
+}
+
+
+// Hours entered in the works modal: order number -> work id -> hours
+const workHours = new Map();
+
+
+export function getWorkHours(orderNumber, workId) {
+    const orderWorks = workHours.get(orderNumber);
+    return (orderWorks && orderWorks.get(workId)) || "";
+}
+
+
+export function setWorkHours(orderNumber, workId, hours) {
+    if (!workHours.has(orderNumber)) workHours.set(orderNumber, new Map());
+    workHours.get(orderNumber).set(workId, hours);
+}
+
+
+function collectSubmission(form) {
+    const personnelNumbers = [];
+    for (const input of form.querySelectorAll(".employee-data")) {
+        const matched = input.value.trim().match(/\((\d+)\)$/);
+        if (!matched) {
+            input.classList.add("field-error");
+            input.focus();
+            return null;
+        }
+        personnelNumbers.push(matched[1]);
+    }
+
+    const works = [];
+    form.querySelectorAll(".task-fields .order-number").forEach(input => {
+        const orderNumber = input.value.trim();
+        (workHours.get(orderNumber) || new Map()).forEach((hours, workId) => {
+            if (hours) works.push({ order_number: orderNumber, work_id: workId, hours });
+        });
+    });
+
+    return {
+        personnel_numbers: personnelNumbers,
+        operation_date: form.querySelector("[name='operation_date']").value,
+        works
+    };
+}
+
+
+function resetTaskForm(form) {
+    form.reset();
+
+    const [, ...extraEmployees] = form.querySelectorAll(".employee-group");
+    const [, ...extraTasks] = form.querySelectorAll(".task-fields");
+    [...extraEmployees, ...extraTasks].forEach(field => field.remove());
+
+    workHours.clear();
+}
+
+
+export function configureEmployeeCreateHandler() {
+    const addEmployeeButton = document.getElementById("add-employee-button");
+    const employeesContainer = document.getElementById("employees-container");
+
+    if (!addEmployeeButton || !employeesContainer) return;
+
+    addEmployeeButton.addEventListener("click", () => {
+        const employeeGroup = employeesContainer.querySelector(".employee-group").cloneNode(true);
+        const employeeInput = employeeGroup.querySelector(".employee-data");
+        const suggestionsList = employeeGroup.querySelector(".employee-data-suggestions");
+
+        employeeInput.value = "";
+        employeeInput.classList.remove("field-error");
+        suggestionsList.innerHTML = "";
+        configureInputField(employeeInput, suggestionsList, "/employees");
+
+        employeesContainer.appendChild(employeeGroup);
+        employeeInput.focus();
+    });
+}
+
+
+function showQueueMessage(text, category) {
+    const container = document.querySelector(".flashed-messages");
+    const message = document.createElement("div");
+    message.className = category;
+    message.textContent = text;
+    container.appendChild(message);
+    setTimeout(() => message.classList.add("hide"), 8000);
+}
+
+
+export function configureTaskQueue() {
+    const form = document.getElementById("tasks-form");
+    if (!form) return;
+
+    const status = document.querySelector(".task-queue-status");
+    const queueAvailable = Boolean(window.indexedDB);
+
+    const updateStatus = () => getQueuedSubmissions().then(submissions => {
+        const pendingCount = submissions.filter(submission => !submission.rejected).length;
+        status.textContent = pendingCount ? `${status.dataset.label}: ${pendingCount}` : "";
+    });
+
+    const showRejected = () => getQueuedSubmissions().then(submissions => {
+        const rejected = submissions.filter(submission => submission.rejected);
+        rejected.forEach(submission => showQueueMessage(
+            `${status.dataset.rejectedLabel} (${submission.label}, ${submission.operation_date || "-"}): ` +
+            submission.rejected,
+            "error"
+        ));
+        return removeSubmissions(rejected.map(submission => submission.key));
+    });
+
+    const requestBackgroundSync = () => {
+        if (!navigator.serviceWorker) return;
+        navigator.serviceWorker.ready
+            .then(registration => registration.sync && registration.sync.register(SYNC_TAG))
+            .catch(() => {});
+    };
+
+    const syncQueue = () => flushTaskQueue()
+        .then(showRejected)
+        .catch(requestBackgroundSync)
+        .finally(updateStatus);
+
+    // Without IndexedDB the submission is sent at once and kept in the form if it fails
+    const sendSubmission = submission => sendBatch([{ ...submission, key: createSubmissionKey() }])
+        .then(({ results }) => {
+            const [result] = Object.values(results);
+            if (result.status === "rejected") {
+                showQueueMessage(result.message, "error");
+                return;
+            }
+            resetTaskForm(form);
+            showQueueMessage(status.dataset.sentLabel, "info");
+        })
+        .catch(() => showQueueMessage(status.dataset.failedLabel, "error"));
+
+    form.addEventListener("submit", event => {
+        event.preventDefault();
+
+        const submission = collectSubmission(form);
+        if (!submission) return;
+
+        if (!submission.works.length) {
+            showQueueMessage(status.dataset.noWorksLabel, "error");
+            return;
+        }
+
+        if (!queueAvailable) {
+            sendSubmission(submission);
+            return;
+        }
+
+        submission.label = [...form.querySelectorAll(".employee-data")].map(input => input.value.trim()).join(", ");
+        enqueueSubmission(submission).then(() => {
+            resetTaskForm(form);
+            showQueueMessage(status.dataset.queuedLabel, "info");
+            syncQueue();
+        });
+    });
+
+    if (!queueAvailable) return;
+
+    if (navigator.serviceWorker) {
+        // The worker script is served from /static with Service-Worker-Allowed, so that its scope covers the form page
+        navigator.serviceWorker.register(form.dataset.queueWorkerUrl, { type: "module", scope: "/" }).catch(() => {});
+        navigator.serviceWorker.addEventListener("message", event => {
+            if (event.data && event.data.type === SYNC_TAG) showRejected().finally(updateStatus);
+        });
+    }
+
+    window.addEventListener("online", syncQueue);
+    setInterval(() => {
+        getQueuedSubmissions().then(submissions => {
+            if (submissions.length) syncQueue();
+        });
+    }, QUEUE_SYNC_INTERVAL);
+
+    syncQueue();
+}
@@ -1,10 +1,12 @@
 from flask import Flask
 
+from .conditional import conditional_response
 from .errors import handle_error_404
+from .json_stream import generate_json, generate_ndjson
 from .messages import MESSAGES
-from .permissions import permission_required
-from .reports import get_report_file
-from .template_filters import zip_iterables
+from .permissions import admin_required, permission_required
+from .reports import get_report_file, get_timesheet_file
+from .template_filters import events_url_for, zip_iterables
 
 
 def register_error_handlers(app: Flask) -> None:
@@ -13,3 +15,4 @@ def register_error_handlers(app: Flask) -> None:
 
 def register_template_filters(app: Flask) -> None:
     app.jinja_env.filters["zip_iterables"] = zip_iterables
+    app.jinja_env.globals["events_url_for"] = events_url_for
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Pattern, Set
+
+ASSETS_DIRECTORY: str = "dist"
+MANIFEST_FILENAME: str = "manifest.json"
+
+CSS_REFERENCE_PATTERN: Pattern[str] = re.compile(r"""url\(\s*(["']?)(?P<path>[^"')]+)\1\s*\)""")
+JS_REFERENCE_PATTERN: Pattern[str] = re.compile(r"""\b(?:from|import)\s*(["'])(?P<path>\.{1,2}/[^"']+)\1""")
+
+
+def get_reference_pattern(filename: str) -> Pattern[str]:
+    if filename.endswith(".css"):
+        return CSS_REFERENCE_PATTERN
+    if filename.endswith(".js"):
+        return JS_REFERENCE_PATTERN
+
+
+def is_local_reference(path: str) -> bool:
+    return not re.match(r"^(?:[a-z]+:|/|#)", path, re.IGNORECASE)
+
+
+def get_hashed_filename(filename: str, content: bytes) -> str:
+    name, extension = os.path.splitext(filename)
+    return f"{name}.{hashlib.md5(content).hexdigest()[:12]}{extension}"
+
+
+class AssetsBuilder:
+    """
+    Copies static files to `<static_folder>/dist` under names containing hash of their content.
+
+    References between files (`url(...)` in stylesheets and relative `import` in modules) are
+    rewritten to hashed names before hashing the referencing file, so a change of any file changes
+    names of all files depending on it. Hashed files never change and may be cached forever.
+
+    Args:
+        static_folder (str): Application static folder.
+    """
+
+    def __init__(self, static_folder: str) -> None:
+        self.static_folder: str = static_folder
+        self.output_folder: str = os.path.join(static_folder, ASSETS_DIRECTORY)
+        self.manifest: Dict[str, str] = {}
+        self.building: Set[str] = set()
+
+    def build(self) -> Dict[str, str]:
+        for filename in self.get_source_files():
+            self.build_file(filename)
+
+        self.remove_stale_files()
+
+        with open(file=os.path.join(self.output_folder, MANIFEST_FILENAME), mode="w", encoding="utf-8") as file:
+            json.dump(self.manifest, file, indent=4, sort_keys=True)
+        return self.manifest
+
+    def get_source_files(self) -> List[str]:
+        filenames: List[str] = []
+        for directory, directories, files in os.walk(self.static_folder):
+            if os.path.abspath(directory) == os.path.abspath(self.static_folder):
+                directories[:] = [name for name in directories if name != ASSETS_DIRECTORY]
+            for name in files:
+                path: str = os.path.relpath(os.path.join(directory, name), self.static_folder)
+                filenames.append(path.replace(os.sep, "/"))
+        return sorted(filenames)
+
+    def build_file(self, filename: str) -> str:
+        if filename in self.manifest:
+            return self.manifest[filename]
+        if filename in self.building:
+            raise ValueError(f"Circular reference between static files: {filename}")
+
+        self.building.add(filename)
+
+        with open(file=os.path.join(self.static_folder, filename), mode="rb") as file:
+            content: bytes = file.read()
+
+        pattern: Pattern[str] = get_reference_pattern(filename)
+        if pattern is not None:
+            content = pattern.sub(lambda matched: self.rewrite_reference(filename, matched), content.decode()).encode()
+
+        hashed_filename: str = get_hashed_filename(filename, content)
+        output_path: str = os.path.join(self.output_folder, hashed_filename)
+
+        if not os.path.exists(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            with open(file=output_path, mode="wb") as file:
+                file.write(content)
+
+        self.building.discard(filename)
+        self.manifest[filename] = hashed_filename
+        return hashed_filename
+
+    def rewrite_reference(self, filename: str, matched: re.Match) -> str:
+        reference: str = matched.group("path")
+        if not is_local_reference(reference):
+            return matched.group(0)
+
+        path, suffix = re.match(r"^([^?#]*)(.*)$", reference).groups()
+        target: str = os.path.normpath(os.path.join(os.path.dirname(filename), path)).replace(os.sep, "/")
+
+        if not os.path.isfile(os.path.join(self.static_folder, target)):
+            return matched.group(0)
+
+        hashed_path: str = path[: len(path) - len(os.path.basename(path))] + os.path.basename(self.build_file(target))
+        start, end = matched.span("path")
+        offset: int = matched.start()
+        return matched.group(0)[: start - offset] + hashed_path + suffix + matched.group(0)[end - offset :]
+
+    def remove_stale_files(self) -> None:
+        built_files: Set[str] = set(self.manifest.values())
+        for directory, _, files in os.walk(self.output_folder):
+            for name in files:
+                path: str = os.path.relpath(os.path.join(directory, name), self.output_folder).replace(os.sep, "/")
+                if path not in built_files and path != MANIFEST_FILENAME:
+                    os.remove(os.path.join(directory, name))
+
+
+def load_manifest(static_folder: str) -> Dict[str, str]:
+    path: str = os.path.join(static_folder, ASSETS_DIRECTORY, MANIFEST_FILENAME)
+    if not os.path.isfile(path):
+        return {}
+
+    with open(file=path, mode="r", encoding="utf-8") as file:
+        return json.load(file)
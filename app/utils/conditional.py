@@ -0,0 +1,80 @@
+import hashlib
+import os
+from datetime import date
+from functools import lru_cache, wraps
+from typing import Dict, List, Tuple
+
+from flask import make_response, request, session
+from flask_login import current_user
+from werkzeug.wrappers import Response
+
+from app.db import db_manager
+
+APP_DIRECTORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_EXTENSIONS: Tuple[str, ...] = (".py", ".html", ".json")
+
+
+@lru_cache(maxsize=None)
+def get_code_version() -> str:
+    """
+    Returns hash of names, sizes and modification times of the application sources, so that ETags
+    issued before a deploy do not match pages rendered by the new code.
+
+    Sources are walked once per process, on the first conditional request rather than at import.
+    """
+
+    stats: List[str] = []
+    for directory, directories, files in os.walk(APP_DIRECTORY):
+        directories[:] = sorted(name for name in directories if name not in ("__pycache__", "static"))
+        for filename in sorted(files):
+            if filename.endswith(SOURCE_EXTENSIONS):
+                stat: os.stat_result = os.stat(os.path.join(directory, filename))
+                stats.append(f"{os.path.join(directory, filename)}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha1("\n".join(stats).encode()).hexdigest()
+
+
+def conditional_response(*table_names: str) -> callable:
+    """
+    Answers GET requests with an ETag derived from versions of the tables the view reads
+    (see `app.db.data_versions`), and with 304 Not Modified, without calling the view,
+    when the client already has the current representation.
+
+    Besides the versions, the tag covers the request path with its query string, the user and their
+    permissions level, the current date (default filters) and the code version. Responses carrying
+    flashed messages are never tagged, since they depend on the session rather than on data.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if request.method != "GET" or session.get("_flashes"):
+                return function(*args, **kwargs)
+
+            versions: Dict[str, int] = db_manager.data_versions.get_read_versions(table_names)
+            etag: str = hashlib.sha1(
+                "|".join(
+                    [
+                        get_code_version(),
+                        request.full_path,
+                        str(current_user.get_id()),
+                        str(getattr(current_user, "permissions_level", "")),
+                        date.today().isoformat(),
+                        *(f"{name}={version}" for name, version in sorted(versions.items())),
+                    ]
+                ).encode()
+            ).hexdigest()
+
+            if request.if_none_match.contains_weak(etag):
+                response: Response = Response(status=304)
+            else:
+                response: Response = make_response(function(*args, **kwargs))
+                if response.status_code != 200 or session.get("_flashes"):
+                    return response
+
+            response.set_etag(etag)
+            response.headers["Cache-Control"] = "private, no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,197 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+from decouple import config
+
+from app.db.event_manager import Event, EventManager
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+EVENTS_POLL_INTERVAL: float = config("EVENTS_POLL_INTERVAL", default=1, cast=float)
+# Time after which an id missing among committed events is taken for a rolled back transaction
+EVENTS_GAP_TIMEOUT: float = config("EVENTS_GAP_TIMEOUT", default=30, cast=float)
+SUBSCRIPTION_QUEUE_SIZE: int = 1000
+# Waiting live update requests hold a worker thread each, so only a part of the threads may wait
+EVENTS_MAX_STREAMS: int = config("EVENTS_MAX_STREAMS", default=2, cast=int)
+
+
+class Subscription:
+    """
+    Queue of events for one subscriber.
+
+    Events missed while reconnecting are taken into the backlog, which is consumed before the queue:
+    from the recent events of the hub, or from the events table when the hub does not hold them all,
+    in which case duplicates of backlog events in the queue are skipped.
+
+    Subscription which fell behind by more than `SUBSCRIPTION_QUEUE_SIZE` events is marked as overflowed:
+    its stream is closed and the client reconnects, catching up from the events table by Last-Event-ID.
+    """
+
+    def __init__(self) -> None:
+        self.events: queue.Queue = queue.Queue(maxsize=SUBSCRIPTION_QUEUE_SIZE)
+        self.backlog: List[Event] = []
+        self.backlog_ids: Set[int] = set()
+        self.overflowed: bool = False
+
+    def put(self, event: Event) -> None:
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: float) -> Optional[Event]:
+        if self.backlog:
+            return self.backlog.pop(0)
+
+        while True:
+            try:
+                event: Event = self.events.get(timeout=timeout)
+            except queue.Empty:
+                return None
+            if event[0] not in self.backlog_ids:
+                return event
+
+
+class EventHub:
+    """
+    Process-local fan-out of change events to subscribers (server-sent events streams).
+
+    Managers record events in the `events` table within their transactions. While the process has
+    subscribers, a single background thread reads new events every `EVENTS_POLL_INTERVAL` seconds
+    and puts them into queues of all subscribers. The cost of a change is one query per worker process,
+    regardless of the number of open dashboards, and events written by any worker process reach all of them.
+
+    The last `SUBSCRIPTION_QUEUE_SIZE` delivered events are kept in memory, so that reconnecting streams
+    and long polling requests resuming from a recent event get their backlog without a query.
+
+    Ids of events are assigned at insert, so an event may be committed after events with greater ids
+    have been delivered. The hub therefore keeps its watermark (`last_event_id`) below the first missing id
+    and re-reads events after it, skipping ids already delivered, until the missing id appears or has been
+    missing for `EVENTS_GAP_TIMEOUT` seconds, as `ChangeFeed` does for its consumers.
+
+    Requests waiting for events take one of `EVENTS_MAX_STREAMS` slots of the process (see `acquire_stream`),
+    so that they never occupy all threads of a worker.
+    """
+
+    def __init__(self) -> None:
+        self.event_manager: EventManager = EventManager()
+        self.subscriptions: Set[Subscription] = set()
+        self.lock: threading.Lock = threading.Lock()
+        self.thread: Optional[threading.Thread] = None
+        self.last_event_id: Optional[int] = None
+        # Ids above the watermark already delivered, and missing ones with the time they were first missed
+        self.delivered_ids: Set[int] = set()
+        self.gaps: Dict[int, float] = {}
+        # Delivered events in order of delivery; every delivered id above `recent_floor` is among them
+        self.recent: Deque[Event] = deque()
+        self.recent_floor: Optional[int] = None
+        self.streams: threading.BoundedSemaphore = threading.BoundedSemaphore(EVENTS_MAX_STREAMS)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        subscription: Subscription = Subscription()
+
+        with self.lock:
+            self.subscriptions.add(subscription)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.poll, name="event-hub", daemon=True)
+                self.thread.start()
+
+            if last_event_id is None:
+                return subscription
+            # Events are delivered under the lock, so none of them is missed or repeated between the two
+            if self.recent_floor is not None and last_event_id >= self.recent_floor:
+                subscription.backlog = sorted(event for event in self.recent if event[0] > last_event_id)
+                return subscription
+
+        # The hub started after the event, or the subscriber fell behind the recent events
+        subscription.backlog = self.event_manager.get_events(last_event_id, limit=SUBSCRIPTION_QUEUE_SIZE)
+        subscription.backlog_ids = {event[0] for event in subscription.backlog}
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self.lock:
+            self.subscriptions.discard(subscription)
+
+    def acquire_stream(self) -> bool:
+        return self.streams.acquire(blocking=False)
+
+    def release_stream(self) -> None:
+        self.streams.release()
+
+    def get_cursor(self, event_id: int) -> int:
+        """
+        Returns id to resume from after the event: the event id, or the watermark while an earlier id
+        may still be committed. Resuming from it may repeat events, which clients skip by id.
+        """
+
+        last_event_id: Optional[int] = self.last_event_id
+        return event_id if last_event_id is None else min(event_id, last_event_id)
+
+    def poll(self) -> None:
+        while True:
+            with self.lock:
+                if not self.subscriptions:
+                    # Next subscribers catch up by their own Last-Event-ID, so the hub starts over from the end
+                    self.thread = None
+                    self.last_event_id = None
+                    self.delivered_ids.clear()
+                    self.gaps.clear()
+                    self.recent.clear()
+                    self.recent_floor = None
+                    return
+
+            try:
+                if self.last_event_id is None:
+                    last_event_id: int = self.event_manager.get_last_event_id()
+                    with self.lock:
+                        self.last_event_id = self.recent_floor = last_event_id
+
+                events: List[Event] = self.event_manager.get_events(self.last_event_id, limit=SUBSCRIPTION_QUEUE_SIZE)
+                with self.lock:
+                    for event in events:
+                        if event[0] not in self.delivered_ids:
+                            self.deliver(event)
+
+                self.advance_watermark()
+            except Exception:
+                logger.exception("Failed to read change events")
+
+            time.sleep(EVENTS_POLL_INTERVAL)
+
+    def deliver(self, event: Event) -> None:
+        for subscription in self.subscriptions:
+            subscription.put(event)
+        self.delivered_ids.add(event[0])
+
+        self.recent.append(event)
+        if len(self.recent) > SUBSCRIPTION_QUEUE_SIZE:
+            self.recent_floor = max(self.recent_floor, self.recent.popleft()[0])
+
+    def advance_watermark(self) -> None:
+        """
+        Moves the watermark over delivered ids and over ids missing for longer than `EVENTS_GAP_TIMEOUT`.
+        """
+
+        if not self.delivered_ids:
+            return
+
+        now: float = time.monotonic()
+        for event_id in range(self.last_event_id + 1, max(self.delivered_ids)):
+            if event_id not in self.delivered_ids:
+                self.gaps.setdefault(event_id, now)
+
+        next_event_id: int = self.last_event_id + 1
+        while next_event_id in self.delivered_ids or (
+            next_event_id in self.gaps and now - self.gaps[next_event_id] >= EVENTS_GAP_TIMEOUT
+        ):
+            self.delivered_ids.discard(next_event_id)
+            self.gaps.pop(next_event_id, None)
+            next_event_id += 1
+        self.last_event_id = next_event_id - 1
+
+
+event_hub: EventHub = EventHub()
@@ -0,0 +1,34 @@
+import json
+from typing import Any, Dict, Generator, Sequence
+
+JSON_STREAM_CHUNK_SIZE: int = 1000
+
+
+def dump(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def generate_json(
+    header: Dict[str, Any], key: str, items: Sequence[Any], chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Generator[str, None, None]:
+    """
+    Streams a JSON object of the header fields followed by the `key` array of items, in chunks of items.
+    """
+
+    yield dump(header)[:-1] + ("," if header else "") + f"{dump(key)}:["
+    for start in range(0, len(items), chunk_size):
+        chunk: str = ",".join(dump(item) for item in items[start : start + chunk_size])
+        yield ("," if start else "") + chunk
+    yield "]}"
+
+
+def generate_ndjson(
+    header: Dict[str, Any], items: Sequence[Any], chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Generator[str, None, None]:
+    """
+    Streams newline-delimited JSON: the header line followed by a line per item, in chunks of items.
+    """
+
+    yield dump(header) + "\n"
+    for start in range(0, len(items), chunk_size):
+        yield "".join(dump(item) + "\n" for item in items[start : start + chunk_size])
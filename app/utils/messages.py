@@ -31,6 +31,10 @@ MESSAGES: Dict[str, Dict[str, str]] = {
         "employee_added": "Сотрудник успешно добавлен.",
         "employee_updated": "Работник успешно изменен.",
     },
+    "maintenance": {
+        "maintenance_enabled": "Режим технического обслуживания включен. Пользователи не имеют доступа к системе.",
+        "maintenance_disabled": "Режим технического обслуживания выключен.",
+    },
     "orders": {
         "order_added": "Заказ успешно добавлен.",
         "order_updated": "Заказ успешно изменен.",
@@ -61,8 +65,36 @@ MESSAGES: Dict[str, Dict[str, str]] = {
             "Суммарное количество часов превышает продолжительность смены работника. "
             "Уменьшите общее время выполнения заданий."
         ),
+        "employee_not_found": "Работник не найден. Выберите работника из списка подсказок.",
+        "invalid_submission": "Некорректные данные заданий. Заполните форму заново.",
+        "work_not_found": "Работа не найдена в заказе. Возможно, она была удалена или перенесена.",
+        "task_not_found": "Задание не найдено. Возможно, оно было удалено или перенесено в архив.",
+        "no_tasks_selected": "Нет заданий, соответствующих фильтрам. Измените фильтры и повторите попытку.",
+        "invalid_bulk_operation": "Некорректные параметры операции. Проверьте введенные значения.",
+        "bulk_hours_exceed_limit": (
+            "Операция не выполнена: суммарное количество часов превысит продолжительность смены "
+            "у сотрудников (таб. номер и дата): {}."
+        ),
+        "bulk_checked": "Проверка пройдена. Операция затронет заданий: {}, суммарно часов: {}.",
+        "bulk_applied": "Операция выполнена. Изменено заданий: {}, суммарно часов: {}.",
     },
     "hours": {
         "hours_added": "Часы успешно добавлены.",
     },
+    "pivot": {
+        "invalid_query": (
+            "Некорректный запрос сводных данных. Проверьте измерения, показатели, формат и даты. "
+            "Плановые и оставшиеся часы доступны только при группировке по заказам и работам."
+        ),
+    },
+    "events": {
+        "busy": "Слишком много открытых обновлений в реальном времени. Повторите попытку позже.",
+    },
+    "changes": {
+        "invalid_query": "Некорректный запрос изменений. Укажите потребителя, водяной знак, лимит и формат.",
+        "expired": (
+            "Изменения после указанного водяного знака уже удалены. "
+            "Выполните полную выгрузку и подтвердите текущий водяной знак."
+        ),
+    },
 }
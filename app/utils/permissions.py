@@ -17,3 +17,13 @@ def permission_required(allowed_levels: List[str]) -> callable:
         return wrapper
 
     return decorator
+
+
+def admin_required(function: callable) -> callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not current_user.is_admin:
+            return MESSAGES["auth"]["access_denied"]
+        return function(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,126 @@
+import cProfile
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from types import FrameType
+from typing import Dict, List, Optional
+
+PROFILE_EXTENSIONS: Dict[str, str] = {
+    "pstats": ".prof",
+    "folded": ".folded",
+    "memory": ".memory.txt",
+}
+
+profiling_lock: threading.Lock = threading.Lock()
+
+
+class RequestProfiler:
+    """
+    Profiles a single request with cProfile, a stack sampler and optionally tracemalloc.
+
+    Profiles are saved to `directory` as:
+        - <profile_id>.prof: cProfile statistics, readable by pstats, snakeviz or tuna;
+        - <profile_id>.folded: sampled call stacks in collapsed format, readable by flamegraph.pl or speedscope;
+        - <profile_id>.memory.txt: top allocation sites and traced memory peak (only when memory tracing is on).
+
+    Only one request is profiled at a time, because cProfile does not allow concurrent profilers.
+
+    Args:
+        directory (str): Directory for profile files.
+        name (str): Human-readable part of the profile identifier (usually endpoint name).
+        trace_memory (bool): Whether to take tracemalloc snapshot of the request.
+        sampling_interval (float): Interval between stack samples, in seconds.
+    """
+
+    def __init__(self, directory: str, name: str, trace_memory: bool = False, sampling_interval: float = 0.005) -> None:
+        self.directory: str = directory
+        self.profile_id: str = "{}_{}".format(datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f"), name.replace(".", "-"))
+        self.trace_memory: bool = trace_memory
+        self.sampling_interval: float = sampling_interval
+
+        self.profile: cProfile.Profile = cProfile.Profile()
+        self.samples: Counter = Counter()
+        self.thread_id: int = threading.get_ident()
+        self.stop_event: threading.Event = threading.Event()
+        self.sampler: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        if not profiling_lock.acquire(blocking=False):
+            return False
+
+        if self.trace_memory:
+            tracemalloc.start(25)
+
+        self.sampler = threading.Thread(target=self.sample, name="request-profiler-sampler", daemon=True)
+        self.sampler.start()
+        self.profile.enable()
+        return True
+
+    def stop(self) -> str:
+        try:
+            self.profile.disable()
+            self.stop_event.set()
+            self.sampler.join()
+
+            os.makedirs(self.directory, exist_ok=True)
+            self.profile.dump_stats(self.get_path("pstats"))
+            self.write_folded_stacks()
+
+            if self.trace_memory:
+                self.write_memory_report()
+                tracemalloc.stop()
+        finally:
+            profiling_lock.release()
+        return self.profile_id
+
+    def sample(self) -> None:
+        while not self.stop_event.wait(self.sampling_interval):
+            frame: Optional[FrameType] = sys._current_frames().get(self.thread_id)
+
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def write_folded_stacks(self) -> None:
+        with open(file=self.get_path("folded"), mode="w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
+
+    def write_memory_report(self) -> None:
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        with open(file=self.get_path("memory"), mode="w", encoding="utf-8") as file:
+            file.write(f"Current traced memory: {current / 1024:.1f} KiB\n")
+            file.write(f"Peak traced memory: {peak / 1024:.1f} KiB\n\n")
+            for statistic in snapshot.statistics("lineno")[:50]:
+                file.write(f"{statistic}\n")
+
+    def get_path(self, kind: str) -> str:
+        return get_profile_path(self.directory, self.profile_id, kind)
+
+
+def get_profile_path(directory: str, profile_id: str, kind: str) -> str:
+    return os.path.join(directory, profile_id + PROFILE_EXTENSIONS[kind])
+
+
+def get_profiles(directory: str) -> List[Dict[str, object]]:
+    if not os.path.isdir(directory):
+        return []
+
+    profiles: Dict[str, Dict[str, object]] = {}
+    for filename in sorted(os.listdir(directory), reverse=True):
+        for kind, extension in PROFILE_EXTENSIONS.items():
+            if filename.endswith(extension):
+                profile_id: str = filename[: -len(extension)]
+                profiles.setdefault(profile_id, {"profile_id": profile_id, "files": []})["files"].append(kind)
+                break
+    return list(profiles.values())
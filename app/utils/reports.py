@@ -1,23 +1,32 @@
 from decimal import Decimal
 from io import BytesIO
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, Border, Font, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
-from openpyxl.worksheet.worksheet import Worksheet
-from pandas import DataFrame
+from app.db.employee_manager import TIMESHEET_SUBTOTAL_LABEL
+
+if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+
+# openpyxl is imported inside functions: it is needed only for report export,
+# and importing it at module load slows down startup of every worker process.
 
 Data = List[List[Union[str, Decimal]]]
+# Sheet name, number of days of the month and rows of the grid
+Timesheet = Tuple[str, int, List[List[Union[str, float, None]]]]
+
+TIMESHEET_HEADERS: List[str] = ["ФИО сотрудника", "Таб. номер", "Категория сотрудника", "Наименование подразделения"]
 
 
 def configure_worksheet_columns(
-    worksheet: Worksheet,
+    worksheet: "Worksheet",
     column_widths: Optional[Dict[str, int]] = None,
     style_columns: Optional[List[str]] = None,
     bold_columns: Optional[List[str]] = None,
     merge_columns: Optional[List[str]] = None,
 ) -> None:
+    from openpyxl.styles import Alignment, Border, Font, Side
+
     border_style: Border = Border(
         Side(border_style="thin"),
         Side(border_style="thin"),
@@ -49,7 +58,7 @@ def configure_worksheet_columns(
 
 
 def write_data_to_worksheet(
-    workbook: Workbook,
+    workbook: "Workbook",
     sheet_name: str,
     headers: List[str],
     data: Data,
@@ -59,13 +68,15 @@ def write_data_to_worksheet(
     bold_columns: Optional[List[str]] = None,
     merge_columns: Optional[List[str]] = None,
 ) -> None:
-    dataframe: DataFrame = DataFrame(data=data, columns=headers)
-    worksheet: Worksheet = workbook.create_sheet()
+    from openpyxl.styles import Font
+
+    worksheet: "Worksheet" = workbook.create_sheet()
 
     if sheet_name:
         worksheet.title = sheet_name
 
-    for row in dataframe_to_rows(dataframe, index=False, header=True):
+    worksheet.append(headers)
+    for row in data:
         worksheet.append(row)
 
     filter_range: str = worksheet.dimensions
@@ -87,12 +98,66 @@ def write_data_to_worksheet(
     )
 
 
+def write_timesheet_to_worksheet(workbook: "Workbook", timesheet: Timesheet) -> None:
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    sheet_name, days_count, data = timesheet
+    hours_columns: List[str] = [get_column_letter(index) for index in range(5, days_count + 6)]
+
+    write_data_to_worksheet(
+        workbook=workbook,
+        sheet_name=sheet_name,
+        headers=TIMESHEET_HEADERS + [str(day) for day in range(1, days_count + 1)] + ["Итого, ч"],
+        data=data,
+        column_widths={
+            "A": 28,
+            "B": 12,
+            "C": 16,
+            "D": 22,
+            **{column: 7 for column in hours_columns[:-1]},
+            hours_columns[-1]: 10,
+        },
+        style_columns=hours_columns,
+        filter_columns=["A", "B", "C", "D"],
+        bold_columns=["A", "B", "C", "D", *hours_columns],
+    )
+
+    worksheet: "Worksheet" = workbook[sheet_name]
+    worksheet.freeze_panes = "E2"
+    for row in worksheet.iter_rows(min_row=2):
+        if row[0].value == TIMESHEET_SUBTOTAL_LABEL:
+            for cell in row:
+                cell.font = Font(bold=True)
+
+
+def get_timesheet_file(timesheets: List[Timesheet]) -> BytesIO:
+    from openpyxl import Workbook
+
+    workbook: Workbook = Workbook()
+
+    workbook.remove(workbook.active)
+
+    for timesheet in timesheets:
+        write_timesheet_to_worksheet(workbook, timesheet)
+    if not timesheets:
+        workbook.create_sheet("Табель")
+
+    file: BytesIO = BytesIO()
+    workbook.save(file)
+    file.seek(0)
+    return file
+
+
 def get_report_file(
     tasks_data: Data = [],
     employees_data: Data = [],
     basic_orders_data: Data = [],
     detailed_orders_data: Data = [],
+    timesheets: List[Timesheet] = [],
 ) -> BytesIO:
+    from openpyxl import Workbook
+
     workbook: Workbook = Workbook()
 
     workbook.remove(workbook.active)
@@ -134,6 +199,9 @@ def get_report_file(
         filter_columns=["A", "B", "C", "D", "E"],
     )
 
+    for timesheet in timesheets:
+        write_timesheet_to_worksheet(workbook, timesheet)
+
     write_data_to_worksheet(
         workbook=workbook,
         sheet_name="Сводка по заказам",
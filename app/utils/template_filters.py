@@ -1,5 +1,10 @@
 from typing import Any, Generator, List
 
+from decouple import config
+from flask import url_for
+
+EVENTS_BASE_URL: str = config("EVENTS_BASE_URL", default="")
+
 
 def zip_iterables(*iterables) -> Generator[List[Any], None, None]:
     iterators: List = [iter(iterable) for iterable in iterables]
@@ -12,3 +17,12 @@ def zip_iterables(*iterables) -> Generator[List[Any], None, None]:
             except StopIteration:
                 return
         yield result
+
+
+def events_url_for(endpoint: str, **values: Any) -> str:
+    """
+    Returns URL of a live updates endpoint on the events server at `EVENTS_BASE_URL`,
+    or on this server when the base URL is not set.
+    """
+
+    return EVENTS_BASE_URL.rstrip("/") + url_for(endpoint, **values)
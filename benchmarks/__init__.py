@@ -0,0 +1,3 @@
+from .generator import DataGenerator
+from .runner import BenchmarkRunner, compare_results, save_results
+from .startup import check_startup_budget, measure_startup
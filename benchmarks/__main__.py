@@ -0,0 +1,101 @@
+import argparse
+import sys
+from typing import Any, Dict, List
+
+from .aggregation import measure_aggregation
+from .generator import DataGenerator
+from .runner import BenchmarkRunner, compare_results, save_results
+from .startup import check_startup_budget, measure_startup
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser: argparse.ArgumentParser = subparsers.add_parser("generate", help="fill database with test data")
+    generate_parser.add_argument("--tasks", type=int, default=100_000, help="number of tasks (1k to 10M)")
+    generate_parser.add_argument("--seed", type=int, default=42)
+    generate_parser.add_argument("--truncate", action="store_true", help="delete existing rows of seeded tables")
+
+    run_parser: argparse.ArgumentParser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("--repeat", type=int, default=10)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--filter", dest="cases_filter", default=None, help="run only matching cases")
+    run_parser.add_argument("--output", default="bench_results.json")
+
+    compare_parser: argparse.ArgumentParser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--metric", default="p50_ms")
+
+    startup_parser: argparse.ArgumentParser = subparsers.add_parser("startup", help="measure application startup")
+    startup_parser.add_argument("--repeat", type=int, default=5)
+    startup_parser.add_argument("--budget-ms", type=float, default=1000, help="fail if startup takes longer")
+
+    aggregation_parser: argparse.ArgumentParser = subparsers.add_parser(
+        "aggregation", help="compare Decimal and integer hour sums of reports"
+    )
+    aggregation_parser.add_argument("--tasks", type=int, default=1_000_000)
+    aggregation_parser.add_argument("--repeat", type=int, default=3)
+    aggregation_parser.add_argument("--seed", type=int, default=42)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments: argparse.Namespace = parse_arguments()
+
+    if arguments.command == "generate":
+        generator: DataGenerator = DataGenerator(
+            tasks_count=arguments.tasks, seed=arguments.seed, truncate=arguments.truncate
+        )
+        try:
+            counts: Dict[str, int] = generator.generate()
+        except ValueError as error:
+            print(error)
+            sys.exit(1)
+        for table, count in counts.items():
+            print(f"{table:<12} {count:>12}")
+
+    elif arguments.command == "run":
+        runner: BenchmarkRunner = BenchmarkRunner(
+            repeat=arguments.repeat,
+            warmup=arguments.warmup,
+            cases_filter=arguments.cases_filter,
+        )
+        results: Dict[str, Any] = runner.run()
+        save_results(results, arguments.output)
+        print(f"Results saved to {arguments.output}")
+
+    elif arguments.command == "compare":
+        rows: List[List[Any]] = compare_results(arguments.baseline, arguments.candidate, arguments.metric)
+        for name, before, after, ratio in rows:
+            print(f"{name:<60} {before:>10.3f} -> {after:>10.3f} ms   x{ratio}")
+
+    elif arguments.command == "startup":
+        startup_results: Dict[str, Any] = measure_startup(repeat=arguments.repeat)
+        print(f"{'import app':<40} {startup_results['import_ms']:>10.1f} ms")
+        print(f"{'create_app()':<40} {startup_results['create_app_ms']:>10.1f} ms")
+        for module, duration in startup_results["import_times_ms"]:
+            print(f"  {module:<38} {duration:>10.1f} ms")
+
+        violations: List[str] = check_startup_budget(startup_results, arguments.budget_ms)
+        for violation in violations:
+            print(violation)
+        if violations:
+            sys.exit(1)
+
+    elif arguments.command == "aggregation":
+        aggregation_results: Dict[str, Any] = measure_aggregation(
+            tasks_count=arguments.tasks, repeat=arguments.repeat, seed=arguments.seed
+        )
+        speedup: float = aggregation_results["speedup"]
+        print(f"{'Decimal sums':<40} {aggregation_results['decimal_ms']:>10.1f} ms")
+        print(f"{'integer hundredths sums':<40} {aggregation_results['integer_ms']:>10.1f} ms   x{speedup}")
+        if not aggregation_results["sums_match"]:
+            print("Sums differ")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import gc
+import random
+import statistics
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.db.task_columns import GroupKey, TaskColumns, to_hours
+
+Tasks = List[Dict[str, Any]]
+Sums = Dict[str, Any]
+
+EMPLOYEE_COLUMNS: List[str] = ["employee_name", "personnel_number", "employee_category", "department", "operation_date"]
+ORDER_COLUMNS: List[str] = ["order_number"]
+WORK_COLUMNS: List[str] = ["order_number", "work_name"]
+
+
+def generate_tasks(tasks_count: int, seed: int = 42) -> Tasks:
+    """
+    Returns synthetic task records shaped like `TaskManager.get_tasks` rows, with the proportions
+    of employees, orders and works used by `DataGenerator`.
+    """
+
+    generator: random.Random = random.Random(seed)
+    employees_count: int = min(max(tasks_count // 250, 20), 20000)
+    orders_count: int = min(max(tasks_count // 1500, 10), 10000)
+
+    employees: List[Tuple[str, str, str, str]] = [
+        (
+            f"Сотрудник {index}",
+            f"{index:06d}",
+            generator.choice(["worker", "specialist", "manager"]),
+            f"Подразделение {index % 40}",
+        )
+        for index in range(employees_count)
+    ]
+    dates: List[str] = [(date(2025, 1, 1) + timedelta(days=day)).isoformat() for day in range(365)]
+
+    tasks: Tasks = []
+    for _ in range(tasks_count):
+        employee_name, personnel_number, employee_category, department = generator.choice(employees)
+        order_index: int = generator.randrange(orders_count)
+        tasks.append(
+            {
+                "employee_name": employee_name,
+                "personnel_number": personnel_number,
+                "employee_category": employee_category,
+                "department": department,
+                "order_number": f"З-{order_index:05d}",
+                "work_name": f"Работа {generator.randrange(8)}",
+                "hours": Decimal(generator.randrange(25, 1201, 25)).scaleb(-2),
+                "operation_date": generator.choice(dates),
+            }
+        )
+    return tasks
+
+
+def sum_decimal_hours(tasks: Tasks) -> Sums:
+    """
+    Sums hours the way report builders did before `TaskColumns`: one Decimal addition per task
+    and aggregation, keyed by tuples of column values, then rows of employees from the sums.
+    """
+
+    employees: Dict[GroupKey, Decimal] = defaultdict(Decimal)
+    for task in tasks:
+        key: GroupKey = (
+            task["employee_name"],
+            task["personnel_number"],
+            task["employee_category"],
+            task["department"],
+            task["operation_date"],
+        )
+        employees[key] += task["hours"]
+
+    orders: Dict[GroupKey, Decimal] = defaultdict(Decimal)
+    for task in tasks:
+        orders[(task["order_number"],)] += task["hours"]
+
+    works: Dict[GroupKey, Decimal] = defaultdict(Decimal)
+    for task in tasks:
+        works[(task["order_number"], task["work_name"])] += task["hours"]
+
+    return {
+        "employees": [[*employee_data, spent_hours] for employee_data, spent_hours in employees.items()],
+        "orders": dict(orders),
+        "works": dict(works),
+    }
+
+
+def sum_integer_hours(tasks: Tasks) -> Sums:
+    task_columns: TaskColumns = TaskColumns(tasks)
+    group_columns, employee_hours = task_columns.group_hours(EMPLOYEE_COLUMNS)
+
+    return {
+        "employees": [list(employee_data) for employee_data in zip(*group_columns, map(to_hours, employee_hours))],
+        "orders": {key: to_hours(hours) for key, hours in task_columns.sum_hours(ORDER_COLUMNS).items()},
+        "works": {key: to_hours(hours) for key, hours in task_columns.sum_hours(WORK_COLUMNS).items()},
+    }
+
+
+def measure(function: Callable[[Tasks], Sums], tasks: Tasks, repeat: int) -> Tuple[float, Sums]:
+    samples: List[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        started: float = time.perf_counter()
+        sums: Sums = function(tasks)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), sums
+
+
+def measure_aggregation(tasks_count: int = 1_000_000, repeat: int = 3, seed: int = 42) -> Dict[str, Any]:
+    """
+    Times the employees, orders and works hour sums of a report over synthetic tasks, with Decimal
+    per-task additions and with integer hundredths over interned columns, and checks that both give
+    the same rows and sums.
+
+    Args:
+        tasks_count (int): Number of tasks.
+        repeat (int): Number of runs of each variant; the median is reported.
+        seed (int): Seed of the task generator.
+
+    Returns:
+        results (Dict[str, Any]): Median durations in milliseconds, speedup, and whether sums match.
+    """
+
+    tasks: Tasks = generate_tasks(tasks_count, seed=seed)
+    decimal_ms, decimal_sums = measure(sum_decimal_hours, tasks, repeat)
+    integer_ms, integer_sums = measure(sum_integer_hours, tasks, repeat)
+
+    return {
+        "tasks": tasks_count,
+        "decimal_ms": decimal_ms,
+        "integer_ms": integer_ms,
+        "speedup": round(decimal_ms / integer_ms, 2),
+        "sums_match": decimal_sums == integer_sums,
+    }
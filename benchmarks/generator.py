@@ -0,0 +1,412 @@
+import hashlib
+import random
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import ROUND_DOWN, Decimal
+from typing import Dict, Iterator, List, Tuple
+
+from app.db import DatabaseManager
+from app.db.archive_manager import get_boundary_setting
+from app.db.change_feed import DELETED_UNTIL_SETTING
+from app.db.data_versions import bump_data_versions
+from app.db.task_cube import BUILT_UNTIL_SETTING
+
+Row = Tuple
+Rows = List[Row]
+
+BENCH_USER_LOGIN: str = "bench"
+BENCH_USER_PASSWORD: str = "bench"
+
+DEPARTMENTS: List[str] = [
+    "Механический цех",
+    "Сборочный цех",
+    "Сварочный цех",
+    "Малярный участок",
+    "Инструментальный участок",
+    "Участок ЧПУ",
+    "Отдел технического контроля",
+    "Конструкторский отдел",
+    "Технологический отдел",
+    "Отдел снабжения",
+    "Склад",
+    "Ремонтная служба",
+]
+
+WORK_NAMES: List[str] = [
+    "Токарная обработка",
+    "Фрезерная обработка",
+    "Сверление",
+    "Шлифование",
+    "Сварка",
+    "Зачистка швов",
+    "Покраска",
+    "Грунтовка",
+    "Сборка узлов",
+    "Общая сборка",
+    "Электромонтаж",
+    "Контроль качества",
+    "Испытания",
+    "Упаковка",
+    "Разработка КД",
+    "Разработка ТП",
+    "Наладка оборудования",
+    "Гибка",
+    "Резка",
+    "Слесарная доработка",
+]
+
+SURNAMES: List[str] = ["Иванов", "Петров", "Сидоров", "Смирнов", "Кузнецов", "Попов", "Васильев", "Соколов"]
+NAMES: List[str] = ["Иван", "Петр", "Сергей", "Алексей", "Дмитрий", "Андрей", "Михаил", "Николай"]
+PATRONYMICS: List[str] = ["Иванович", "Петрович", "Сергеевич", "Алексеевич", "Дмитриевич", "Андреевич"]
+
+CATEGORIES: List[str] = ["worker", "specialist", "manager"]
+CATEGORY_WEIGHTS: List[int] = [75, 20, 5]
+
+HOURS_PER_DAY: Decimal = Decimal("12.25")
+BATCH_SIZE: int = 5000
+
+# Tables filled by the generator, children before parents
+SEEDED_TABLES: List[str] = ["tasks", "works", "hours", "orders", "employees", "departments", "logs", "users"]
+# Tables and settings derived from rows of the seeded tables, cleared together with them.
+# The task cube is rebuilt from the generated tasks, versions of the seeded tables are bumped.
+DERIVED_TABLES: List[str] = [
+    "task_cube",
+    "work_hours_deltas",
+    "task_submissions",
+    "event_gaps",
+    "change_feed_consumers",
+    "events",
+    "tasks_archive",
+    "logs_archive",
+]
+DERIVED_SETTINGS: List[str] = [
+    BUILT_UNTIL_SETTING,
+    DELETED_UNTIL_SETTING,
+    get_boundary_setting("tasks"),
+    get_boundary_setting("logs"),
+]
+
+
+class DataGenerator:
+    """
+    Deterministic synthetic data generator for benchmarks.
+
+    Fills departments, employees, orders, works, tasks, hours and logs tables with data whose shape
+    follows the production workload: a few hundred tasks per employee, skewed order popularity
+    (a handful of orders receive most of the hours), one to four tasks per employee shift
+    and shifts never exceeding 12.25 hours. The same seed and scale always produce the same rows.
+
+    Generation refuses to run on a database that already has rows in the seeded or derived tables, so that
+    a repeated run does not double the dataset; with `truncate` the tables are cleared first.
+    After seeding the task cube is rebuilt and data versions of the seeded tables are bumped, so
+    reports, caches and ETags never reflect rows of a previous dataset.
+
+    Args:
+        tasks_count (int): Number of task rows to generate (1k to 10M).
+        seed (int): Seed of the pseudo-random generator.
+        start_date (date): First operation date of the generated period.
+        truncate (bool): Delete existing rows of the seeded tables before generation.
+    """
+
+    def __init__(
+        self,
+        tasks_count: int,
+        seed: int = 42,
+        start_date: date = date(2025, 1, 1),
+        truncate: bool = False,
+    ) -> None:
+        self.db_manager: DatabaseManager = DatabaseManager()
+        self.tasks_count: int = tasks_count
+        self.truncate: bool = truncate
+        self.seed: int = seed
+        self.start_date: date = start_date
+        self.random: random.Random = random.Random(seed)
+
+        self.employees_count: int = min(max(tasks_count // 250, 20), 20000)
+        self.orders_count: int = min(max(tasks_count // 1500, 10), 10000)
+
+    def generate(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+
+        with self.db_manager.get_connection() as connection:
+            with connection.cursor() as cursor:
+                self.prepare_tables(cursor)
+                connection.commit()
+
+                counts["departments"] = self.insert_rows(
+                    cursor,
+                    "INSERT INTO departments (name, is_production) VALUES (?, ?)",
+                    [(name, index < 7) for index, name in enumerate(DEPARTMENTS)],
+                )
+
+                employees: Rows = self.get_employees()
+                counts["employees"] = self.insert_rows(
+                    cursor,
+                    "INSERT INTO employees (name, personnel_number, department, category) VALUES (?, ?, ?, ?)",
+                    employees,
+                )
+
+                orders: Rows = self.get_orders()
+                counts["orders"] = self.insert_rows(cursor, "INSERT INTO orders (number, name) VALUES (?, ?)", orders)
+
+                cursor.execute("SELECT id, number FROM orders")
+                order_ids: Dict[str, int] = {number: order_id for order_id, number in cursor.fetchall()}
+
+                works: Dict[str, List[Tuple[str, Decimal]]] = self.get_works(orders)
+                counts["works"] = self.insert_rows(
+                    cursor,
+                    "INSERT INTO works (order_id, name, planned_hours) VALUES (?, ?, ?)",
+                    [
+                        (order_ids[order_number], work_name, planned_hours)
+                        for order_number, order_works in works.items()
+                        for work_name, planned_hours in order_works
+                    ],
+                )
+
+                spent_hours_per_work: Dict[Tuple[str, str], Decimal] = defaultdict(Decimal)
+                counts["tasks"] = 0
+
+                for batch in self.iterate_batches(self.get_tasks(employees, orders, works)):
+                    cursor.executemany(
+                        """
+                        INSERT INTO tasks (
+                            employee_name,
+                            personnel_number,
+                            department,
+                            work_name,
+                            hours,
+                            order_number,
+                            order_name,
+                            operation_date,
+                            employee_category
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        batch,
+                    )
+                    for task in batch:
+                        spent_hours_per_work[(task[5], task[3])] += task[4]
+                    counts["tasks"] += len(batch)
+                    connection.commit()
+
+                cursor.executemany(
+                    """
+                    UPDATE works
+                    SET spent_hours = ?
+                    WHERE name = ? AND order_id = ?
+                    """,
+                    [
+                        (spent_hours, work_name, order_ids[order_number])
+                        for (order_number, work_name), spent_hours in spent_hours_per_work.items()
+                    ],
+                )
+
+                counts["hours"] = self.insert_rows(
+                    cursor,
+                    """
+                    INSERT INTO hours (order_name, order_number, work_name, spent_hours)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    self.get_hours(orders, works),
+                )
+
+                counts["logs"] = 0
+                for batch in self.iterate_batches(self.get_logs(max(self.tasks_count // 10, 1))):
+                    cursor.executemany(
+                        """
+                        INSERT INTO logs (
+                            action,
+                            entity_id,
+                            entity_type,
+                            user_name,
+                            ip_address,
+                            platform,
+                            os_version,
+                            browser,
+                            browser_version,
+                            created_date
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        batch,
+                    )
+                    counts["logs"] += len(batch)
+
+                counts["users"] = self.insert_rows(
+                    cursor,
+                    """
+                    INSERT INTO users (
+                        name,
+                        department,
+                        login,
+                        password_hash,
+                        permissions_level,
+                        is_account_enabled,
+                        is_factory_worker,
+                        is_admin
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            "Benchmark",
+                            DEPARTMENTS[0],
+                            BENCH_USER_LOGIN,
+                            hashlib.sha256(BENCH_USER_PASSWORD.encode()).hexdigest(),
+                            "advanced",
+                            True,
+                            False,
+                            True,
+                        )
+                    ],
+                )
+            connection.commit()
+
+        counts["task_cube"] = self.db_manager.task_cube.rebuild()
+        bump_data_versions(*SEEDED_TABLES)
+        return counts
+
+    def prepare_tables(self, cursor) -> None:
+        """
+        Clears the seeded and derived tables when `truncate` is set, otherwise checks that they are empty.
+        Settings derived from their rows are dropped in both cases.
+
+        Raises:
+            ValueError: If a seeded table has rows and `truncate` is not set.
+        """
+
+        for table in DERIVED_TABLES + SEEDED_TABLES:
+            if self.truncate:
+                cursor.execute(f"DELETE FROM {table}")
+                continue
+
+            cursor.execute(f"SELECT COUNT(*) FROM {table}")
+            if cursor.fetchone()[0]:
+                raise ValueError(f"Table {table} is not empty, run generate with --truncate to replace its rows")
+
+        placeholders: str = ", ".join("?" for _ in DERIVED_SETTINGS)
+        cursor.execute(f"DELETE FROM settings WHERE name IN ({placeholders})", tuple(DERIVED_SETTINGS))
+
+    def insert_rows(self, cursor, query: str, rows: Rows) -> int:
+        for batch in self.iterate_batches(iter(rows)):
+            cursor.executemany(query, batch)
+        return len(rows)
+
+    def iterate_batches(self, rows: Iterator[Row]) -> Iterator[Rows]:
+        batch: Rows = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def get_employees(self) -> Rows:
+        employees: Rows = []
+        for index in range(self.employees_count):
+            name: str = "{} {} {}".format(
+                self.random.choice(SURNAMES),
+                self.random.choice(NAMES),
+                self.random.choice(PATRONYMICS),
+            )
+            personnel_number: str = str(10000 + index)
+            department: str = DEPARTMENTS[min(int(self.random.expovariate(0.35)), len(DEPARTMENTS) - 1)]
+            category: str = self.random.choices(CATEGORIES, weights=CATEGORY_WEIGHTS)[0]
+            employees.append((name, personnel_number, department, category))
+        return employees
+
+    def get_orders(self) -> Rows:
+        return [
+            (f"{2000 + index}-{index % 97:02d}", f"Изделие {self.random.choice(WORK_NAMES).lower()} №{index}")
+            for index in range(self.orders_count)
+        ]
+
+    def get_works(self, orders: Rows) -> Dict[str, List[Tuple[str, Decimal]]]:
+        works: Dict[str, List[Tuple[str, Decimal]]] = {}
+        average_hours: int = max(self.tasks_count * 5 // (len(orders) * len(WORK_NAMES) // 2), 50)
+
+        for order_number, _ in orders:
+            work_names: List[str] = self.random.sample(WORK_NAMES, self.random.randint(3, len(WORK_NAMES)))
+            works[order_number] = [
+                (
+                    work_name,
+                    Decimal(self.random.randint(average_hours // 2, average_hours * 3)).quantize(Decimal("0.01")),
+                )
+                for work_name in work_names
+            ]
+        return works
+
+    def get_tasks(self, employees: Rows, orders: Rows, works: Dict[str, List[Tuple[str, Decimal]]]) -> Iterator[Row]:
+        """
+        Yields task rows shift by shift so that 10M rows never have to be held in memory.
+
+        Order popularity follows a Pareto distribution, hours of one shift are split between
+        one to four tasks and never exceed the shift duration.
+        """
+
+        generated: int = 0
+        day: int = 0
+
+        while generated < self.tasks_count:
+            operation_date: date = self.start_date + timedelta(days=day)
+            day += 1
+
+            if operation_date.weekday() >= 5:
+                continue
+
+            for employee_name, personnel_number, department, category in employees:
+                if self.random.random() < 0.1:
+                    continue
+
+                tasks_per_shift: int = self.random.choices([1, 2, 3, 4], weights=[40, 30, 20, 10])[0]
+                shift_hours: Decimal = self.random.choice([Decimal(8), Decimal(11), HOURS_PER_DAY])
+
+                for task_index in range(tasks_per_shift):
+                    if generated >= self.tasks_count:
+                        return
+
+                    order_index: int = min(int(self.random.paretovariate(1.2)) - 1, len(orders) - 1)
+                    order_number, order_name = orders[order_index]
+                    work_name, _ = self.random.choice(works[order_number])
+
+                    hours: Decimal = (shift_hours / tasks_per_shift).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+
+                    yield (
+                        employee_name,
+                        personnel_number,
+                        department,
+                        work_name,
+                        hours,
+                        order_number,
+                        order_name,
+                        operation_date.strftime("%Y-%m-%d"),
+                        category,
+                    )
+                    generated += 1
+
+    def get_hours(self, orders: Rows, works: Dict[str, List[Tuple[str, Decimal]]]) -> Rows:
+        hours: Rows = []
+        for order_number, order_name in orders[: max(len(orders) // 10, 1)]:
+            work_name, planned_hours = works[order_number][0]
+            hours.append((order_name, order_number, work_name, (planned_hours / 3).quantize(Decimal("0.01"))))
+        return hours
+
+    def get_logs(self, logs_count: int) -> Iterator[Row]:
+        actions: List[str] = ["create", "update", "delete"]
+        entity_types: List[str] = ["task", "order", "work", "employee"]
+
+        for index in range(logs_count):
+            created_date: date = self.start_date + timedelta(days=index * 7 // max(logs_count // 365, 1) % 365)
+            yield (
+                self.random.choices(actions, weights=[80, 15, 5])[0],
+                self.random.randint(1, self.tasks_count),
+                self.random.choice(entity_types),
+                BENCH_USER_LOGIN,
+                f"10.0.{self.random.randint(0, 9)}.{self.random.randint(1, 254)}",
+                "Windows",
+                "10",
+                "Chrome",
+                "120.0",
+                created_date.strftime("%Y-%m-%d"),
+            )
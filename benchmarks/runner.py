@@ -0,0 +1,261 @@
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask
+from flask.testing import FlaskClient
+
+from app.db import DatabaseManager
+
+from .generator import BENCH_USER_LOGIN, BENCH_USER_PASSWORD
+
+Case = Tuple[str, Callable[[], Any]]
+Result = Dict[str, Any]
+
+
+def get_percentile(samples: List[float], percentile: float) -> float:
+    ordered: List[float] = sorted(samples)
+    index: float = (len(ordered) - 1) * percentile / 100
+    lower: int = int(index)
+    upper: int = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (index - lower)
+
+
+def get_commit() -> Optional[str]:
+    try:
+        output: bytes = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode().strip()
+
+
+class BenchmarkRunner:
+    """
+    Times manager methods, report builders and Flask routes against the configured database.
+
+    Every case is executed `warmup` times without measurement, then `repeat` times with
+    wall-clock timing, and once more under tracemalloc to record the peak of Python allocations
+    (kept separate so that tracing overhead does not distort the timings).
+
+    Args:
+        repeat (int): Number of measured runs per case.
+        warmup (int): Number of unmeasured runs per case.
+        cases_filter (Optional[str]): Substring that case names must contain to be executed.
+    """
+
+    def __init__(self, repeat: int = 10, warmup: int = 1, cases_filter: Optional[str] = None) -> None:
+        self.repeat: int = repeat
+        self.warmup: int = warmup
+        self.cases_filter: Optional[str] = cases_filter
+        self.db_manager: DatabaseManager = DatabaseManager()
+
+    def measure(self, function: Callable[[], Any]) -> Result:
+        for _ in range(self.warmup):
+            function()
+
+        samples: List[float] = []
+        for _ in range(self.repeat):
+            gc.collect()
+            started: float = time.perf_counter()
+            function()
+            samples.append((time.perf_counter() - started) * 1000)
+
+        tracemalloc.start()
+        function()
+        _, memory_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        return {
+            "runs": len(samples),
+            "min_ms": round(min(samples), 3),
+            "mean_ms": round(statistics.mean(samples), 3),
+            "p50_ms": round(get_percentile(samples, 50), 3),
+            "p90_ms": round(get_percentile(samples, 90), 3),
+            "p99_ms": round(get_percentile(samples, 99), 3),
+            "max_ms": round(max(samples), 3),
+            "memory_peak_kb": round(memory_peak / 1024, 1),
+        }
+
+    def get_date_ranges(self) -> Dict[str, Tuple[str, str]]:
+        with self.db_manager.tasks.get_connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT MAX(operation_date) FROM tasks")
+                last_date: Any = cursor.fetchone()[0]
+
+        if isinstance(last_date, str):
+            last_date = datetime.strptime(last_date, "%Y-%m-%d")
+
+        end_date: str = last_date.strftime("%Y-%m-%d")
+        return {
+            "day": (end_date, end_date),
+            "week": ((last_date - timedelta(days=6)).strftime("%Y-%m-%d"), end_date),
+            "month": ((last_date - timedelta(days=30)).strftime("%Y-%m-%d"), end_date),
+        }
+
+    def get_manager_cases(self, date_ranges: Dict[str, Tuple[str, str]]) -> List[Case]:
+        tasks = self.db_manager.tasks
+        employees = self.db_manager.employees
+        works = self.db_manager.works
+        orders = self.db_manager.orders
+
+        departments: List[str] = employees.get_departments()
+        order_number: str = orders.get_orders(page=1)[0][1]
+
+        cases: List[Case] = [
+            ("managers.tasks.get_tasks_count", tasks.get_tasks_count),
+            ("managers.employees.get_departments", employees.get_departments),
+            (
+                "managers.employees.get_employees_by_partial_match",
+                lambda: employees.get_employees_by_partial_match("Ив"),
+            ),
+            (
+                "managers.orders.get_order_numbers_by_partial_match",
+                lambda: orders.get_order_numbers_by_partial_match("20"),
+            ),
+            ("managers.works.get_works_for_order_by_number", lambda: works.get_works_for_order_by_number(order_number)),
+        ]
+
+        for period, (start_date, end_date) in date_ranges.items():
+            cases.append(
+                (
+                    f"managers.tasks.get_tasks[{period}]",
+                    lambda start_date=start_date, end_date=end_date: tasks.get_tasks(
+                        start_date=start_date, end_date=end_date
+                    ),
+                )
+            )
+            cases.append(
+                (
+                    f"managers.tasks.get_tasks[{period},department]",
+                    lambda start_date=start_date, end_date=end_date: tasks.get_tasks(
+                        departments=departments[:1], start_date=start_date, end_date=end_date
+                    ),
+                )
+            )
+        return cases
+
+    def get_report_cases(self, date_ranges: Dict[str, Tuple[str, str]]) -> List[Case]:
+        from app.db.task_columns import TaskColumns
+        from app.utils import get_report_file
+
+        start_date, end_date = date_ranges["month"]
+        tasks: List[Dict[str, Any]] = self.db_manager.tasks.get_tasks(start_date=start_date, end_date=end_date)
+
+        def build_report_file() -> None:
+            report_tasks: TaskColumns = TaskColumns(tasks)
+            get_report_file(
+                tasks_data=self.db_manager.tasks.get_tasks_data(tasks=report_tasks),
+                employees_data=self.db_manager.employees.get_employees_data(tasks=report_tasks),
+                basic_orders_data=self.db_manager.orders.get_basic_orders_data(tasks=report_tasks),
+                detailed_orders_data=self.db_manager.orders.get_detailed_orders_data(tasks=report_tasks),
+                timesheets=self.db_manager.employees.get_timesheet_data(tasks=report_tasks),
+            )
+
+        return [
+            ("reports.get_tasks_data[month]", lambda: self.db_manager.tasks.get_tasks_data(tasks=tasks)),
+            ("reports.get_employees_data[month]", lambda: self.db_manager.employees.get_employees_data(tasks=tasks)),
+            ("reports.get_basic_orders_data[month]", lambda: self.db_manager.orders.get_basic_orders_data(tasks=tasks)),
+            (
+                "reports.get_detailed_orders_data[month]",
+                lambda: self.db_manager.orders.get_detailed_orders_data(tasks=tasks),
+            ),
+            ("reports.get_report_file[month]", build_report_file),
+        ]
+
+    def get_route_cases(self, date_ranges: Dict[str, Tuple[str, str]]) -> List[Case]:
+        from app import create_app
+
+        app: Flask = create_app()
+        client: FlaskClient = app.test_client()
+        client.post("/", data={"login": BENCH_USER_LOGIN, "password": BENCH_USER_PASSWORD})
+
+        order_number: str = self.db_manager.orders.get_orders(page=1)[0][1]
+
+        def get(url: str) -> Callable[[], None]:
+            def request() -> None:
+                response = client.get(url)
+                if response.status_code != 200:
+                    raise RuntimeError(f"GET {url} returned {response.status_code}")
+                response.get_data()
+
+            return request
+
+        cases: List[Case] = [
+            ("routes.control.index", get("/control")),
+            ("routes.employees.get_employees", get("/employees?query=Ив")),
+            ("routes.orders.get_works_for_order", get(f"/orders/{order_number}/works")),
+        ]
+
+        for period, (start_date, end_date) in date_ranges.items():
+            cases.append(
+                (
+                    f"routes.tasks.tasks_table[{period}]",
+                    get(f"/tasks/table?start_date={start_date}&end_date={end_date}"),
+                )
+            )
+
+        start_date, end_date = date_ranges["month"]
+        cases.append(
+            (
+                "routes.control.reports.export[month]",
+                get(f"/control/reports?export=true&start_date={start_date}&end_date={end_date}"),
+            )
+        )
+        return cases
+
+    def run(self) -> Dict[str, Any]:
+        date_ranges: Dict[str, Tuple[str, str]] = self.get_date_ranges()
+
+        cases: List[Case] = []
+        cases.extend(self.get_manager_cases(date_ranges))
+        cases.extend(self.get_report_cases(date_ranges))
+        cases.extend(self.get_route_cases(date_ranges))
+
+        results: Dict[str, Result] = {}
+        for name, function in cases:
+            if self.cases_filter and self.cases_filter not in name:
+                continue
+            results[name] = self.measure(function)
+            print(f"{name:<60} p50 {results[name]['p50_ms']:>10.3f} ms   p99 {results[name]['p99_ms']:>10.3f} ms")
+
+        return {
+            "meta": {
+                "commit": get_commit(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "tasks_count": self.db_manager.tasks.get_tasks_count(),
+                "repeat": self.repeat,
+                "warmup": self.warmup,
+                "date_ranges": date_ranges,
+            },
+            "results": results,
+        }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(file=path, mode="w", encoding="utf-8") as file:
+        json.dump(results, file, ensure_ascii=False, indent=2)
+
+
+def compare_results(baseline_path: str, candidate_path: str, metric: str = "p50_ms") -> List[List[Any]]:
+    with open(file=baseline_path, mode="r", encoding="utf-8") as file:
+        baseline: Dict[str, Any] = json.load(file)
+    with open(file=candidate_path, mode="r", encoding="utf-8") as file:
+        candidate: Dict[str, Any] = json.load(file)
+
+    rows: List[List[Any]] = []
+    for name, result in candidate["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before: float = baseline["results"][name][metric]
+        after: float = result[metric]
+        ratio: Optional[float] = round(after / before, 3) if before else None
+        rows.append([name, before, after, ratio])
+    return rows
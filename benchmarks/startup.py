@@ -0,0 +1,89 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+DEFERRED_MODULES: Tuple[str, ...] = ("pandas", "openpyxl", "numpy")
+
+STARTUP_SCRIPT: str = """
+import json, sys, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.create_app()
+created = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "modules": sorted({name.split(".")[0] for name in sys.modules} & set(%r)),
+}))
+"""
+
+
+def run_startup() -> Dict[str, Any]:
+    output: bytes = subprocess.check_output([sys.executable, "-c", STARTUP_SCRIPT % (DEFERRED_MODULES,)])
+    return json.loads(output)
+
+
+def get_import_times(limit: int = 15) -> List[Tuple[str, float]]:
+    """
+    Returns top-level packages (except the application itself) with the largest cumulative import time
+    reported by `python -X importtime`.
+    """
+
+    completed: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times: List[Tuple[str, float]] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        module = module.strip()
+        if "." not in module and module != "app":
+            import_times.append((module, int(cumulative) / 1000))
+    return sorted(import_times, key=lambda item: item[1], reverse=True)[:limit]
+
+
+def measure_startup(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Measures application startup in fresh interpreter processes, as a worker process would pay it.
+
+    Args:
+        repeat (int): Number of interpreter processes to start.
+
+    Returns:
+        results (Dict[str, Any]): Median import and create_app times, total startup time, heavy modules
+            loaded by startup (which should be deferred until first use) and top-level modules
+            with the largest import time.
+    """
+
+    runs: List[Dict[str, Any]] = [run_startup() for _ in range(repeat)]
+
+    import_ms: float = statistics.median(run["import_ms"] for run in runs)
+    create_app_ms: float = statistics.median(run["create_app_ms"] for run in runs)
+
+    return {
+        "runs": repeat,
+        "import_ms": round(import_ms, 3),
+        "create_app_ms": round(create_app_ms, 3),
+        "startup_ms": round(import_ms + create_app_ms, 3),
+        "deferred_modules_loaded": runs[-1]["modules"],
+        "import_times_ms": get_import_times(),
+    }
+
+
+def check_startup_budget(results: Dict[str, Any], budget_ms: float) -> List[str]:
+    violations: List[str] = []
+
+    if results["startup_ms"] > budget_ms:
+        violations.append(f"Startup takes {results['startup_ms']:.1f} ms, budget is {budget_ms:.1f} ms")
+
+    if results["deferred_modules_loaded"]:
+        violations.append(f"Modules loaded at startup: {', '.join(results['deferred_modules_loaded'])}")
+    return violations
@@ -0,0 +1,43 @@
+import json
+import multiprocessing
+import os
+from typing import Any, Dict, Union
+
+import decouple
+
+# Application is not imported here: its modules read settings (DB_POOL_SIZE) from environment on import.
+with open(file="config.json", mode="r") as file:
+    settings: Dict[str, Union[bool, str, int]] = json.load(file)
+
+bind: str = f"{settings['host']}:{settings['port']}"
+
+# Application is imported once in the master process and shared with workers by fork.
+preload_app: bool = True
+
+worker_class: str = "gthread"
+workers: int = decouple.config("GUNICORN_WORKERS", default=multiprocessing.cpu_count() * 2 + 1, cast=int)
+threads: int = decouple.config("GUNICORN_THREADS", default=4, cast=int)
+
+# Every thread of a worker may hold a connection, so the pool keeps as many idle connections as there are threads.
+os.environ.setdefault("DB_POOL_SIZE", str(threads))
+# Live update requests served here (without the events server, see gunicorn.events.conf.py) wait for events
+# in a worker thread, so they may take at most half of the threads.
+os.environ.setdefault("EVENTS_MAX_STREAMS", str(max(threads // 2, 1)))
+
+# Workers are recycled to bound memory growth of long-lived processes (pandas reports, caches).
+max_requests: int = decouple.config("GUNICORN_MAX_REQUESTS", default=1000, cast=int)
+max_requests_jitter: int = decouple.config("GUNICORN_MAX_REQUESTS_JITTER", default=100, cast=int)
+
+# Report export may take a while on large periods.
+timeout: int = decouple.config("GUNICORN_TIMEOUT", default=120, cast=int)
+graceful_timeout: int = decouple.config("GUNICORN_GRACEFUL_TIMEOUT", default=30, cast=int)
+keepalive: int = 5
+
+accesslog: str = "-"
+errorlog: str = "-"
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    from app.db.backends import reset_backend
+
+    reset_backend()
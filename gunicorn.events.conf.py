@@ -0,0 +1,32 @@
+import json
+import os
+from typing import Dict, Union
+
+import decouple
+
+# Server of live updates (`/events`), run next to the main server. Requests waiting for events are greenlets
+# of an asynchronous worker rather than threads, so one worker keeps thousands of dashboards waiting.
+# Pages reach it at `EVENTS_BASE_URL`, and the server accepts them from `EVENTS_ALLOWED_ORIGINS`.
+with open(file="config.json", mode="r") as file:
+    settings: Dict[str, Union[bool, str, int]] = json.load(file)
+
+bind: str = f"{settings['host']}:{decouple.config('EVENTS_PORT', default=int(settings['port']) + 1, cast=int)}"
+
+worker_class: str = "gevent"
+# Every worker runs its own event hub, reading the events table once per `EVENTS_POLL_INTERVAL`.
+workers: int = decouple.config("EVENTS_WORKERS", default=1, cast=int)
+worker_connections: int = decouple.config("EVENTS_WORKER_CONNECTIONS", default=1000, cast=int)
+
+# Application is imported by every worker after gevent has patched the standard library (threads, queues).
+preload_app: bool = False
+
+# Waiting requests hold no connection, only the hub thread and request authentication query the database.
+os.environ.setdefault("DB_POOL_SIZE", "4")
+os.environ.setdefault("EVENTS_MAX_STREAMS", str(worker_connections))
+
+timeout: int = decouple.config("GUNICORN_TIMEOUT", default=120, cast=int)
+graceful_timeout: int = decouple.config("GUNICORN_GRACEFUL_TIMEOUT", default=30, cast=int)
+keepalive: int = 5
+
+accesslog: str = "-"
+errorlog: str = "-"
@@ -0,0 +1,5 @@
+from flask import Flask
+
+from app import create_app
+
+app: Flask = create_app()